@@ -4,7 +4,6 @@ Generates Excel workbooks and CSV exports for tournament data.
 """
 
 import io
-import csv
 import json
 from typing import List, Dict, Any, Optional
 from datetime import datetime
@@ -17,6 +16,29 @@ except ImportError:
     HAS_OPENPYXL = False
 
 
+# UTF-8 byte order mark so Excel opens the CSV exports with the right encoding
+UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def _csv_field(value) -> str:
+    """Format one CSV cell, quoting only when the text needs it (like csv.QUOTE_MINIMAL)."""
+    if value is None:
+        return ""
+    text = value if isinstance(value, str) else str(value)
+    if '"' in text or "," in text or "\n" in text or "\r" in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def format_csv_row(fields) -> str:
+    """Format a CSV row for the fixed, text-only export schemas.
+
+    Produces the same output as csv.writer's default dialect without its
+    per-cell dialect dispatch.
+    """
+    return ",".join([_csv_field(f) for f in fields]) + "\r\n"
+
+
 def _style_header_row(ws, num_cols: int):
     """Apply consistent header styling to the first row."""
     if not HAS_OPENPYXL:
@@ -217,14 +239,20 @@ def generate_results_csv(
     group_matches: List[Dict[str, Any]],
     bracket_matches: List[Dict[str, Any]],
 ) -> bytes:
-    """Generate a combined CSV of all results (groups + bracket)."""
-    output = io.StringIO()
-    writer = csv.writer(output)
+    """Generate a combined CSV of all results (groups + bracket).
+
+    Rows are UTF-8 encoded straight into a bytes buffer that starts with the
+    BOM, so the payload is never held as one large str.
+    """
+    output = io.BytesIO()
+    output.write(UTF8_BOM)
 
-    writer.writerow(["Fase", "Categoría", "Grupo/Ronda", "#", "Jugador 1", "Jugador 2", "Ganador", "Sets", "Estado"])
+    output.write(format_csv_row(
+        ["Fase", "Categoría", "Grupo/Ronda", "#", "Jugador 1", "Jugador 2", "Ganador", "Sets", "Estado"]
+    ).encode('utf-8'))
 
     for m in group_matches:
-        writer.writerow([
+        output.write(format_csv_row([
             "Grupos",
             m.get("category", ""),
             m.get("group_name", ""),
@@ -234,10 +262,10 @@ def generate_results_csv(
             m.get("winner_name", "-"),
             m.get("sets_result", "-"),
             m.get("status", ""),
-        ])
+        ]).encode('utf-8'))
 
     for m in bracket_matches:
-        writer.writerow([
+        output.write(format_csv_row([
             "Bracket",
             m.get("category", ""),
             m.get("round_name", ""),
@@ -247,7 +275,6 @@ def generate_results_csv(
             m.get("winner_name", "-"),
             m.get("sets_result", "-"),
             m.get("status", ""),
-        ])
+        ]).encode('utf-8'))
 
-    csv_content = output.getvalue()
-    return ('\ufeff' + csv_content).encode('utf-8')
+    return output.getvalue()
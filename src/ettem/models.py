@@ -74,6 +74,30 @@ class RoundType(str, Enum):
     SEMIFINAL = "SF"
     FINAL = "F"
 
+    @property
+    def order(self) -> int:
+        """Position of the round in play order (group stage first, final last)."""
+        return _ROUND_ORDER[self]
+
+    @property
+    def display_es(self) -> str:
+        """Spanish display name of the round."""
+        return _ROUND_DISPLAY_ES[self]
+
+
+_ROUND_ORDER = {round_type: index for index, round_type in enumerate(RoundType)}
+
+_ROUND_DISPLAY_ES = {
+    RoundType.ROUND_ROBIN: "Fase de Grupos",
+    RoundType.ROUND_OF_128: "Ronda de 128",
+    RoundType.ROUND_OF_64: "Ronda de 64",
+    RoundType.ROUND_OF_32: "Ronda de 32",
+    RoundType.ROUND_OF_16: "Octavos de Final",
+    RoundType.QUARTERFINAL: "Cuartos de Final",
+    RoundType.SEMIFINAL: "Semifinal",
+    RoundType.FINAL: "Final",
+}
+
 
 # ============================================================================
 # Core Domain Models
@@ -5,8 +5,9 @@ Uses xhtml2pdf for HTML to PDF conversion.
 """
 
 import io
+from functools import cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Any, BinaryIO, Dict, List, Optional
 
 try:
     from xhtml2pdf import pisa
@@ -14,18 +15,28 @@ try:
 except ImportError:
     pisa = None
     HAS_PISA = False
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from ettem.paths import is_frozen
 
 
 # Path to print templates
 TEMPLATES_DIR = Path(__file__).parent / "webapp" / "templates" / "print"
 
 
+@cache
 def get_template_env() -> Environment:
-    """Get Jinja2 environment for print templates."""
+    """Get the shared Jinja2 environment for print templates.
+
+    Built once so compiled templates stay in the environment's cache
+    between PDFs, with the same on-disk bytecode cache and reload policy
+    as the web app's templates.
+    """
     return Environment(
         loader=FileSystemLoader(str(TEMPLATES_DIR)),
-        autoescape=True
+        autoescape=True,
+        bytecode_cache=FileSystemBytecodeCache(),
+        auto_reload=not is_frozen(),
     )
 
 
@@ -45,24 +56,27 @@ def _prepare_branding_for_pdf(branding: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
-def html_to_pdf(html_content: str) -> bytes:
-    """Convert HTML string to PDF bytes."""
+def write_pdf(html_content: str, dest: BinaryIO) -> None:
+    """Convert HTML string to PDF, writing it into the binary file ``dest``."""
     if not HAS_PISA:
         raise ImportError("xhtml2pdf is not available (Python 3.14+ cffi issue). PDF generation disabled.")
-    result = io.BytesIO()
 
     # Convert HTML to PDF
     pisa_status = pisa.CreatePDF(
         src=html_content,
-        dest=result,
+        dest=dest,
         encoding='utf-8'
     )
 
     if pisa_status.err:
         raise Exception(f"Error generating PDF: {pisa_status.err}")
 
-    result.seek(0)
-    return result.read()
+
+def html_to_pdf(html_content: str) -> bytes:
+    """Convert HTML string to PDF bytes."""
+    result = io.BytesIO()
+    write_pdf(html_content, result)
+    return result.getvalue()
 
 
 def generate_match_sheet_pdf(
@@ -102,7 +116,7 @@ def generate_group_sheet_pdf(
     group: Dict[str, Any],
     players: List[Dict[str, Any]],
     matches: List[Dict[str, Any]],
-    results_matrix: Dict[int, Dict[int, str]],
+    results_matrix: Dict[tuple[int, int], str],
     tournament_name: Optional[str] = None,
     category: Optional[str] = None,
     branding: Optional[Dict[str, Any]] = None
@@ -146,14 +160,14 @@ def generate_match_list_pdf(
     return html_to_pdf(html)
 
 
-def generate_all_match_sheets_pdf(
+def _render_all_match_sheets(
     matches_data: List[Dict[str, Any]],
     tournament_name: Optional[str] = None,
     category: Optional[str] = None,
     is_doubles: bool = False,
     branding: Optional[Dict[str, Any]] = None
-) -> bytes:
-    """Generate a single PDF with all match sheets (2 per page)."""
+) -> str:
+    """Render the HTML of all match sheets (2 per page)."""
     context = {
         "matches_data": matches_data,
         "tournament_name": tournament_name or "Torneo de Tenis de Mesa",
@@ -162,11 +176,34 @@ def generate_all_match_sheets_pdf(
         "branding": _prepare_branding_for_pdf(branding) if branding else {},
         "country_colors": branding.get("country_colors", {}) if branding else {},
     }
+    return render_html("all_match_sheets.html", context)
+
 
-    html = render_html("all_match_sheets.html", context)
+def generate_all_match_sheets_pdf(
+    matches_data: List[Dict[str, Any]],
+    tournament_name: Optional[str] = None,
+    category: Optional[str] = None,
+    is_doubles: bool = False,
+    branding: Optional[Dict[str, Any]] = None
+) -> bytes:
+    """Generate a single PDF with all match sheets (2 per page)."""
+    html = _render_all_match_sheets(matches_data, tournament_name, category, is_doubles, branding)
     return html_to_pdf(html)
 
 
+def write_all_match_sheets_pdf(
+    dest: BinaryIO,
+    matches_data: List[Dict[str, Any]],
+    tournament_name: Optional[str] = None,
+    category: Optional[str] = None,
+    is_doubles: bool = False,
+    branding: Optional[Dict[str, Any]] = None
+) -> None:
+    """Like generate_all_match_sheets_pdf, but write the PDF into ``dest``."""
+    html = _render_all_match_sheets(matches_data, tournament_name, category, is_doubles, branding)
+    write_pdf(html, dest)
+
+
 def generate_bracket_tree_pdf(context: Dict[str, Any]) -> bytes:
     """Generate a bracket tree PDF."""
     if "branding" in context and context["branding"]:
@@ -5,8 +5,9 @@ Provides ORM models and repository pattern for data persistence.
 
 import json
 from datetime import datetime
+from datetime import time as dt_time
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from sqlalchemy import (
     Boolean,
@@ -14,14 +15,22 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    and_,
+    case,
     create_engine,
+    event,
+    func,
+    or_,
+    select,
 )
-from sqlalchemy.orm import declarative_base, relationship, sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import declarative_base, relationship, selectinload, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from ettem.models import Gender, MatchStatus, RoundType
 from ettem.paths import get_data_dir
@@ -126,7 +135,7 @@ class PlayerORM(Base):
     genero = Column(String(1), nullable=False)  # M or F
     pais_cd = Column(String(3), nullable=False)  # ISO-3
     ranking_pts = Column(Float, nullable=False)
-    categoria = Column(String(20), nullable=False)
+    categoria = Column(String(20), nullable=False, index=True)
 
     # Tournament-assigned identifiers
     seed = Column(Integer, nullable=True)  # 1 = best player
@@ -346,8 +355,8 @@ class MatchORM(Base):
     __tablename__ = "matches"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    player1_id = Column(Integer, ForeignKey("players.id"), nullable=True)  # Allow None for BYE or empty slot
-    player2_id = Column(Integer, ForeignKey("players.id"), nullable=True)  # Allow None for BYE or empty slot
+    player1_id = Column(Integer, ForeignKey("players.id"), nullable=True, index=True)  # Allow None for BYE or empty slot
+    player2_id = Column(Integer, ForeignKey("players.id"), nullable=True, index=True)  # Allow None for BYE or empty slot
     group_id = Column(Integer, ForeignKey("groups.id"), nullable=True)
     tournament_id = Column(Integer, ForeignKey("tournaments.id"), nullable=True)  # For filtering by tournament
     category = Column(String(20), nullable=True)  # Category for bracket matches (SUB21, OPEN, etc.)
@@ -383,6 +392,15 @@ class MatchORM(Base):
     pair2 = relationship("PairORM", foreign_keys=[pair2_id])
     group = relationship("GroupORM", back_populates="matches")
 
+    __table_args__ = (
+        # Bracket lookups filter on group_id IS NULL within a tournament
+        Index("ix_matches_group_tournament", "group_id", "tournament_id"),
+        # Bracket listings filter on group_id IS NULL and order by round/number
+        Index("ix_matches_bracket", "group_id", "round_type", "match_number"),
+        # Per-category bracket listings filter on category and group_id IS NULL
+        Index("ix_matches_category_group", "category", "group_id"),
+    )
+
     @property
     def is_doubles(self) -> bool:
         """Check if this is a doubles match."""
@@ -413,7 +431,11 @@ class MatchORM(Base):
 
     @property
     def sets(self) -> list[dict]:
-        """Get sets from JSON."""
+        """Get sets from JSON.
+
+        Parsed from sets_json on every access, so read it once into a local
+        when it is used more than once.
+        """
         return json.loads(self.sets_json)
 
     @sets.setter
@@ -599,12 +621,17 @@ class ScheduleSlotORM(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     session_id = Column(Integer, ForeignKey("sessions.id"), nullable=False)
-    match_id = Column(Integer, ForeignKey("matches.id"), nullable=False)
+    match_id = Column(Integer, ForeignKey("matches.id"), nullable=False, unique=True, index=True)  # one slot per match
     table_number = Column(Integer, nullable=False)  # 1, 2, 3, ...
     start_time = Column(String(5), nullable=False)  # HH:MM format
     duration = Column(Integer, nullable=True)  # Override duration in minutes (null = use default)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # The scheduler grid reads a session's slots in time/table order
+        Index("ix_schedule_slots_session_time_table", "session_id", "start_time", "table_number"),
+    )
+
     # Relationships
     session = relationship("SessionORM", back_populates="schedule_slots")
     match = relationship("MatchORM")
@@ -651,6 +678,20 @@ class EventMappingORM(Base):
 # ============================================================================
 
 
+def _configure_sqlite_connection(dbapi_connection, connection_record):
+    """Set per-connection SQLite PRAGMAs.
+
+    WAL lets readers run while a write is in progress, and synchronous=NORMAL
+    only fsyncs at checkpoints instead of on every commit (safe under WAL).
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-20000")
+    cursor.close()
+
+
 class DatabaseManager:
     """Manages SQLite database connection and session."""
 
@@ -666,13 +707,19 @@ class DatabaseManager:
             self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Use NullPool for SQLite to avoid connection pool issues
+        # Keep a few SQLite connections open for reuse across requests.
+        # Overflow is unbounded so a burst of sessions (threadpool handlers,
+        # a leaked session) never blocks waiting for a pooled connection;
+        # connections beyond pool_size are simply closed when returned.
         self.engine = create_engine(
             f"sqlite:///{self.db_path}",
             echo=False,
-            poolclass=NullPool,
+            poolclass=QueuePool,
+            pool_size=8,
+            max_overflow=-1,
             connect_args={"check_same_thread": False}
         )
+        event.listen(self.engine, "connect", _configure_sqlite_connection)
         self.SessionLocal = sessionmaker(bind=self.engine)
 
     def create_tables(self):
@@ -693,6 +740,15 @@ class DatabaseManager:
 # ============================================================================
 
 
+class PlayerName(NamedTuple):
+    """Display fields of a player, as returned by PlayerRepository.get_names_by_ids."""
+
+    nombre: str
+    apellido: str
+    categoria: str
+    pais_cd: str
+
+
 class TournamentRepository:
     """Repository for Tournament operations."""
 
@@ -853,6 +909,46 @@ class PlayerRepository:
         """
         return self.session.query(PlayerORM).filter(PlayerORM.id == player_id).first()
 
+    def get_by_ids(self, player_ids) -> list[PlayerORM]:
+        """Get several players by database ID in a single query.
+
+        Args:
+            player_ids: Iterable of internal database IDs
+
+        Returns:
+            List of PlayerORM instances (missing IDs are skipped)
+        """
+        player_ids = list(player_ids)
+        if not player_ids:
+            return []
+        return self.session.query(PlayerORM).filter(PlayerORM.id.in_(player_ids)).all()
+
+    def get_names_by_ids(self, player_ids) -> dict[int, PlayerName]:
+        """Get the display fields of several players without building ORM objects.
+
+        Args:
+            player_ids: Iterable of internal database IDs
+
+        Returns:
+            Dict mapping player ID to PlayerName(nombre, apellido, categoria, pais_cd)
+        """
+        player_ids = list(player_ids)
+        if not player_ids:
+            return {}
+        rows = self.session.execute(
+            select(
+                PlayerORM.id,
+                PlayerORM.nombre,
+                PlayerORM.apellido,
+                PlayerORM.categoria,
+                PlayerORM.pais_cd,
+            ).where(PlayerORM.id.in_(player_ids))
+        )
+        return {
+            row.id: PlayerName(row.nombre, row.apellido, row.categoria, row.pais_cd)
+            for row in rows
+        }
+
     def get_by_tournament_number(self, tournament_number: int) -> Optional[PlayerORM]:
         """Get player by tournament number (bib number).
 
@@ -901,6 +997,20 @@ class PlayerRepository:
             query = query.filter(PlayerORM.tournament_id == tournament_id)
         return query.order_by(PlayerORM.seed.asc().nullslast(), PlayerORM.ranking_pts.desc()).all()
 
+    def get_categories(self, tournament_id: int = None) -> list[str]:
+        """Get the distinct player categories, sorted by name.
+
+        Args:
+            tournament_id: Optional tournament ID to filter by
+
+        Returns:
+            Sorted list of category names
+        """
+        query = self.session.query(PlayerORM.categoria).distinct()
+        if tournament_id is not None:
+            query = query.filter(PlayerORM.tournament_id == tournament_id)
+        return [category for (category,) in query.order_by(PlayerORM.categoria).all()]
+
     def get_all(self, tournament_id: int = None) -> list[PlayerORM]:
         """Get all players, optionally filtered by tournament.
 
@@ -1088,6 +1198,20 @@ class GroupRepository:
         """
         return self.session.query(GroupORM).filter(GroupORM.id == group_id).first()
 
+    def get_by_ids(self, group_ids) -> list[GroupORM]:
+        """Get several groups by ID in a single query.
+
+        Args:
+            group_ids: Iterable of group IDs
+
+        Returns:
+            List of GroupORM instances (missing IDs are skipped)
+        """
+        group_ids = list(group_ids)
+        if not group_ids:
+            return []
+        return self.session.query(GroupORM).filter(GroupORM.id.in_(group_ids)).all()
+
     def get_by_category(self, category: str, tournament_id: int = None) -> list[GroupORM]:
         """Get all groups in a category.
 
@@ -1103,6 +1227,69 @@ class GroupRepository:
             query = query.filter(GroupORM.tournament_id == tournament_id)
         return query.all()
 
+    def get_content_versions(self, group_ids) -> dict[int, tuple]:
+        """Get a change marker for the matches and players of several groups.
+
+        The marker changes whenever a match or player of the group is added,
+        removed or updated, so it can be used to validate cached data
+        computed from them.
+
+        Args:
+            group_ids: Iterable of group IDs
+
+        Returns:
+            Dict mapping group ID to (match_count, last_match_update,
+            player_count, last_player_update)
+        """
+        group_ids = list(group_ids)
+        if not group_ids:
+            return {}
+        match_rows = (
+            self.session.query(MatchORM.group_id, func.count(MatchORM.id), func.max(MatchORM.updated_at))
+            .filter(MatchORM.group_id.in_(group_ids))
+            .group_by(MatchORM.group_id)
+        )
+        player_rows = (
+            self.session.query(PlayerORM.group_id, func.count(PlayerORM.id), func.max(PlayerORM.updated_at))
+            .filter(PlayerORM.group_id.in_(group_ids))
+            .group_by(PlayerORM.group_id)
+        )
+        matches = {gid: (count, last) for gid, count, last in match_rows}
+        players = {gid: (count, last) for gid, count, last in player_rows}
+        return {
+            gid: matches.get(gid, (0, None)) + players.get(gid, (0, None))
+            for gid in group_ids
+        }
+
+    def has_category(self, category: str, tournament_id: int = None) -> bool:
+        """Check whether a category has at least one group.
+
+        Args:
+            category: Category name
+            tournament_id: Optional tournament ID to filter by
+
+        Returns:
+            True if any group exists for the category
+        """
+        query = self.session.query(GroupORM.id).filter(GroupORM.category == category)
+        if tournament_id is not None:
+            query = query.filter(GroupORM.tournament_id == tournament_id)
+        return query.limit(1).first() is not None
+
+    def get_categories(self, tournament_id: int = None) -> set[str]:
+        """Get the distinct categories that have groups.
+
+        Args:
+            tournament_id: Optional tournament ID to filter by
+
+        Returns:
+            Set of category names
+        """
+        query = self.session.query(GroupORM.category).distinct()
+        if tournament_id is not None:
+            query = query.filter(GroupORM.tournament_id == tournament_id)
+        return {category for (category,) in query.all() if category}
+
     def get_all(self, tournament_id: int = None) -> list[GroupORM]:
         """Get all groups, optionally filtered by tournament.
 
@@ -1274,16 +1461,62 @@ class MatchRepository:
         """
         return self.session.query(MatchORM).filter(MatchORM.id == match_id).first()
 
-    def get_by_group(self, group_id: int) -> list[MatchORM]:
+    def get_by_ids(self, match_ids) -> list[MatchORM]:
+        """Get several matches by ID in a single query.
+
+        Args:
+            match_ids: Iterable of match IDs
+
+        Returns:
+            List of MatchORM instances (missing IDs are skipped)
+        """
+        match_ids = list(match_ids)
+        if not match_ids:
+            return []
+        return self.session.query(MatchORM).filter(MatchORM.id.in_(match_ids)).all()
+
+    @staticmethod
+    def _match_order():
+        """ORDER BY terms for play order: match_number, unnumbered matches last."""
+        return (func.coalesce(func.nullif(MatchORM.match_number, 0), 999), MatchORM.id)
+
+    def get_by_group(self, group_id: int, ordered: bool = False) -> list[MatchORM]:
         """Get all matches in a group.
 
         Args:
             group_id: Group ID
+            ordered: If True, order by match_number (unnumbered matches last)
 
         Returns:
             List of MatchORM instances
         """
-        return self.session.query(MatchORM).filter(MatchORM.group_id == group_id).all()
+        query = self.session.query(MatchORM).filter(MatchORM.group_id == group_id)
+        if ordered:
+            query = query.order_by(*self._match_order())
+        return query.all()
+
+    def get_by_groups(self, group_ids) -> dict[int, list[MatchORM]]:
+        """Get the matches of several groups in a single query.
+
+        Args:
+            group_ids: Iterable of group IDs
+
+        Returns:
+            Dict mapping each group ID to its matches in match_number order
+            (groups without matches are omitted)
+        """
+        group_ids = list(group_ids)
+        if not group_ids:
+            return {}
+        matches_by_group = {}
+        query = (
+            self.session.query(MatchORM)
+            .filter(MatchORM.group_id.in_(group_ids))
+            .order_by(*self._match_order())
+        )
+        for match in query:
+            matches_by_group.setdefault(match.group_id, []).append(match)
+        return matches_by_group
 
     def get_by_round(self, round_type: str) -> list[MatchORM]:
         """Get all matches in a round.
@@ -1311,16 +1544,62 @@ class MatchRepository:
             .all()
         )
 
-    def get_all(self) -> list[MatchORM]:
-        """Get all matches."""
-        return self.session.query(MatchORM).all()
+    @staticmethod
+    def _with_competitors(query):
+        """Eager-load player1/player2 and doubles pairs (with their players)."""
+        return query.options(
+            selectinload(MatchORM.player1),
+            selectinload(MatchORM.player2),
+            selectinload(MatchORM.pair1).selectinload(PairORM.player1),
+            selectinload(MatchORM.pair1).selectinload(PairORM.player2),
+            selectinload(MatchORM.pair2).selectinload(PairORM.player1),
+            selectinload(MatchORM.pair2).selectinload(PairORM.player2),
+        )
+
+    def get_all(self, eager: bool = False) -> list[MatchORM]:
+        """Get all matches.
+
+        Args:
+            eager: If True, also load player1/player2 (and doubles pairs with
+                their players) up front, so reading them does not issue one
+                query per match.
+
+        Returns:
+            List of MatchORM instances
+        """
+        query = self.session.query(MatchORM)
+        if eager:
+            query = self._with_competitors(query)
+        return query.all()
+
+    def get_bracket_matches(self, tournament_id: int = None, eager: bool = False) -> list[MatchORM]:
+        """Get all bracket matches (group_id is None), across categories.
+
+        Args:
+            tournament_id: Optional tournament ID to filter by
+            eager: If True, eager-load competitors (see get_all)
+
+        Returns:
+            List of MatchORM instances
+        """
+        query = self.session.query(MatchORM).filter(MatchORM.group_id.is_(None))
+        if tournament_id is not None:
+            query = query.filter(MatchORM.tournament_id == tournament_id)
+        if eager:
+            query = self._with_competitors(query)
+        return query.all()
 
-    def get_bracket_matches_by_category(self, category: str, tournament_id: int = None) -> list[MatchORM]:
+    def get_bracket_matches_by_category(
+        self, category: str, tournament_id: int = None, by_round: bool = False
+    ) -> list[MatchORM]:
         """Get all bracket matches for a category.
 
         Args:
             category: Category name
             tournament_id: Optional tournament ID to filter by
+            by_round: If True, order by round progression (R128 first, final
+                last, unknown rounds at the end), then by match ID, instead of
+                by round_type code and match number
 
         Returns:
             List of MatchORM instances for bracket matches (group_id is None)
@@ -1331,6 +1610,11 @@ class MatchRepository:
         )
         if tournament_id is not None:
             query = query.filter(MatchORM.tournament_id == tournament_id)
+        if by_round:
+            round_order = case(
+                {rt.value: rt.order for rt in RoundType}, value=MatchORM.round_type, else_=99
+            )
+            return query.order_by(round_order, MatchORM.id).all()
         return query.order_by(MatchORM.round_type, MatchORM.match_number).all()
 
     def get_bracket_match_by_round_and_number(self, category: str, round_type: str, match_number: int, tournament_id: int = None) -> Optional[MatchORM]:
@@ -1505,6 +1789,44 @@ class StandingRepository:
             query = query.order_by(GroupStandingORM.position)
         return query.all()
 
+    def iter_rows_by_category(self, category: str, batch_size: int = 500):
+        """Stream standings of a category joined with group and player columns.
+
+        Rows are fetched from the cursor in batches of ``batch_size`` so only
+        a handful of records are held in memory at a time.
+
+        Args:
+            category: Category name
+            batch_size: Number of rows fetched per round trip
+
+        Returns:
+            Iterator of rows with group_name, position, player_id, nombre,
+            apellido, pais_cd and the standing counters, ordered by group,
+            then position
+        """
+        query = (
+            self.session.query(
+                GroupORM.name.label("group_name"),
+                GroupStandingORM.position,
+                PlayerORM.id.label("player_id"),
+                PlayerORM.nombre,
+                PlayerORM.apellido,
+                PlayerORM.pais_cd,
+                GroupStandingORM.points_total,
+                GroupStandingORM.wins,
+                GroupStandingORM.losses,
+                GroupStandingORM.sets_w,
+                GroupStandingORM.sets_l,
+                GroupStandingORM.points_w,
+                GroupStandingORM.points_l,
+            )
+            .join(GroupORM, GroupStandingORM.group_id == GroupORM.id)
+            .outerjoin(PlayerORM, GroupStandingORM.player_id == PlayerORM.id)
+            .filter(GroupORM.category == category)
+            .order_by(GroupStandingORM.group_id, GroupStandingORM.position)
+        )
+        return query.yield_per(batch_size)
+
     def get_all(self) -> list[GroupStandingORM]:
         """Get all standings."""
         return self.session.query(GroupStandingORM).all()
@@ -1633,6 +1955,20 @@ class BracketRepository:
             query = query.filter(BracketSlotORM.tournament_id == tournament_id)
         return query.all()
 
+    def get_categories(self, tournament_id: int = None) -> set[str]:
+        """Get the distinct categories that have bracket slots.
+
+        Args:
+            tournament_id: Optional tournament ID to filter by
+
+        Returns:
+            Set of category names
+        """
+        query = self.session.query(BracketSlotORM.category).distinct()
+        if tournament_id is not None:
+            query = query.filter(BracketSlotORM.tournament_id == tournament_id)
+        return {category for (category,) in query.all() if category}
+
     def delete_by_category(self, category: str, tournament_id: int = None) -> int:
         """Delete all bracket slots for a category.
 
@@ -1673,6 +2009,12 @@ class BracketRepository:
             self.session.commit()
 
 
+def time_to_minutes(hhmm: str) -> int:
+    """Minutes since midnight of an "HH:MM" schedule time."""
+    parsed = dt_time.fromisoformat(hhmm)
+    return parsed.hour * 60 + parsed.minute
+
+
 class SessionRepository:
     """Repository for Session (tournament day/time block) operations."""
 
@@ -1772,6 +2114,35 @@ class ScheduleSlotRepository:
         self.session.refresh(slot_orm)
         return slot_orm
 
+    def upsert_by_match(self, session_id: int, match_id: int, table_number: int, start_time: str) -> None:
+        """Assign a match to a table and time, moving its slot if it has one.
+
+        A single INSERT ... ON CONFLICT(match_id) DO UPDATE statement; the
+        unique index on match_id keeps one slot per match.
+
+        Args:
+            session_id: Session ID
+            match_id: Match ID
+            table_number: Table number (1, 2, 3, ...)
+            start_time: Start time in HH:MM format
+        """
+        stmt = sqlite_insert(ScheduleSlotORM).values(
+            session_id=session_id,
+            match_id=match_id,
+            table_number=table_number,
+            start_time=start_time,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ScheduleSlotORM.match_id],
+            set_={
+                "session_id": stmt.excluded.session_id,
+                "table_number": stmt.excluded.table_number,
+                "start_time": stmt.excluded.start_time,
+            },
+        )
+        self.session.execute(stmt)
+        self.session.commit()
+
     def get_by_id(self, slot_id: int) -> Optional[ScheduleSlotORM]:
         """Get schedule slot by ID."""
         return self.session.query(ScheduleSlotORM).filter(ScheduleSlotORM.id == slot_id).first()
@@ -1789,6 +2160,29 @@ class ScheduleSlotRepository:
         """Get schedule slot for a specific match."""
         return self.session.query(ScheduleSlotORM).filter(ScheduleSlotORM.match_id == match_id).first()
 
+    def get_by_matches(self, match_ids) -> dict[int, ScheduleSlotORM]:
+        """Get the schedule slots of several matches in a single query.
+
+        Args:
+            match_ids: Iterable of match IDs
+
+        Returns:
+            Dict mapping match ID to its schedule slot (unscheduled matches
+            are omitted)
+        """
+        match_ids = list(match_ids)
+        if not match_ids:
+            return {}
+        slots_by_match = {}
+        query = (
+            self.session.query(ScheduleSlotORM)
+            .filter(ScheduleSlotORM.match_id.in_(match_ids))
+            .order_by(ScheduleSlotORM.id)
+        )
+        for slot in query:
+            slots_by_match.setdefault(slot.match_id, slot)
+        return slots_by_match
+
     def get_all(self) -> list[ScheduleSlotORM]:
         """Get all schedule slots."""
         return self.session.query(ScheduleSlotORM).all()
@@ -1807,31 +2201,69 @@ class ScheduleSlotRepository:
             .all()
         )
 
+    @staticmethod
+    def _in_tournament(tournament_id: int):
+        """WHERE clause selecting the matches that belong to a tournament.
+
+        Group matches belong to it through their group; bracket matches (no
+        group) through a bracket of their category in the tournament.
+        """
+        group_ids = select(GroupORM.id).where(GroupORM.tournament_id == tournament_id)
+        bracket_categories = select(BracketSlotORM.category).where(
+            BracketSlotORM.tournament_id == tournament_id
+        )
+        return or_(
+            MatchORM.group_id.in_(group_ids),
+            and_(
+                or_(MatchORM.group_id.is_(None), MatchORM.group_id == 0),
+                MatchORM.category.in_(bracket_categories),
+                MatchORM.category != "",
+            ),
+        )
+
     def get_unscheduled_matches(self, tournament_id: int) -> list[MatchORM]:
-        """Get all matches that don't have a schedule slot assigned.
+        """Get a tournament's matches that don't have a schedule slot assigned.
+
+        Filtering is done in a single query.
 
         Args:
             tournament_id: Tournament ID to filter matches
 
         Returns:
-            List of MatchORM instances without schedule assignments
+            List of MatchORM instances without schedule assignments, by ID
         """
-        # Get all scheduled match IDs
-        scheduled_match_ids = [
-            slot.match_id for slot in self.session.query(ScheduleSlotORM).all()
-        ]
+        scheduled_ids = select(ScheduleSlotORM.match_id)
+        return (
+            self.session.query(MatchORM)
+            .filter(MatchORM.id.notin_(scheduled_ids), self._in_tournament(tournament_id))
+            .order_by(MatchORM.id)
+            .all()
+        )
 
-        # Get matches for this tournament that are not scheduled
-        # Group matches: get from groups that belong to this tournament
-        # Bracket matches: get by category from players in this tournament
-        from sqlalchemy import or_
+    def count_matches_for_tournament(self, tournament_id: int) -> tuple[int, int]:
+        """Count a tournament's matches and how many are scheduled, in one query.
 
-        query = self.session.query(MatchORM)
+        A match counts as scheduled when it has a slot in one of the
+        tournament's sessions.
 
-        if scheduled_match_ids:
-            query = query.filter(~MatchORM.id.in_(scheduled_match_ids))
+        Args:
+            tournament_id: Tournament ID
 
-        return query.all()
+        Returns:
+            (total_matches, scheduled_matches)
+        """
+        scheduled_ids = (
+            select(ScheduleSlotORM.match_id)
+            .join(SessionORM, SessionORM.id == ScheduleSlotORM.session_id)
+            .where(SessionORM.tournament_id == tournament_id)
+        )
+        total, scheduled = self.session.execute(
+            select(
+                func.count(MatchORM.id),
+                func.count(case((MatchORM.id.in_(scheduled_ids), 1))),
+            ).where(self._in_tournament(tournament_id))
+        ).one()
+        return total, scheduled
 
     def update(self, slot_orm: ScheduleSlotORM) -> ScheduleSlotORM:
         """Update an existing schedule slot."""
@@ -1935,8 +2367,7 @@ class TimeSlotRepository:
             if slot.slot_number > slot_number:
                 # Calculate new start time based on previous slot
                 prev_slot = slots[i - 1]
-                prev_h, prev_m = map(int, prev_slot.start_time.split(":"))
-                prev_minutes = prev_h * 60 + prev_m + prev_slot.duration_minutes
+                prev_minutes = time_to_minutes(prev_slot.start_time) + prev_slot.duration_minutes
                 new_h = prev_minutes // 60
                 new_m = prev_minutes % 60
                 slot.start_time = f"{new_h:02d}:{new_m:02d}"
@@ -1974,32 +2405,19 @@ class TimeSlotRepository:
         # Delete existing time slots for this session
         self.session.query(TimeSlotORM).filter(TimeSlotORM.session_id == session_id).delete()
 
-        start_h, start_m = map(int, start_time.split(":"))
-        end_h, end_m = map(int, end_time.split(":"))
-        start_minutes = start_h * 60 + start_m
-        end_minutes = end_h * 60 + end_m
+        start_minutes = time_to_minutes(start_time)
+        end_minutes = time_to_minutes(end_time)
 
-        slots = []
-        current = start_minutes
-        slot_number = 0
-
-        while current < end_minutes:
-            h = current // 60
-            m = current % 60
-            slot_time = f"{h:02d}:{m:02d}"
-
-            slot_orm = TimeSlotORM(
+        slots = [
+            TimeSlotORM(
                 session_id=session_id,
                 slot_number=slot_number,
-                start_time=slot_time,
+                start_time=f"{minutes // 60:02d}:{minutes % 60:02d}",
                 duration_minutes=default_duration,
             )
-            self.session.add(slot_orm)
-            slots.append(slot_orm)
-
-            current += default_duration
-            slot_number += 1
-
+            for slot_number, minutes in enumerate(range(start_minutes, end_minutes, default_duration))
+        ]
+        self.session.add_all(slots)
         self.session.commit()
         return slots
 
@@ -2613,12 +3031,16 @@ class TeamMatchDetailRepository:
 # ============================================================================
 
 
+def existing_columns(session, table: str) -> set[str]:
+    """Return the column names of a table (empty if the table doesn't exist)."""
+    from sqlalchemy import text
+    return {row[1] for row in session.execute(text(f"PRAGMA table_info({table})"))}
+
+
 def _safe_add_column(session, table: str, column: str, col_type: str):
     """Add a column to a table if it doesn't already exist (SQLite)."""
     from sqlalchemy import text
-    try:
-        session.execute(text(f"SELECT {column} FROM {table} LIMIT 1"))
-    except Exception:
+    if column not in existing_columns(session, table):
         session.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {col_type}"))
         session.commit()
 
@@ -2904,3 +3326,63 @@ def migrate_cloud_id_mapping(engine):
         session.close()
 
 
+# ============================================================================
+# Database Migration (query indexes)
+# ============================================================================
+
+
+def migrate_query_indexes(engine):
+    """Create secondary indexes used by hot read paths on existing databases.
+
+    New databases get them from the ORM metadata; this adds them to files
+    created before the indexes existed.
+
+    Safe to run multiple times (idempotent).
+    """
+    from sqlalchemy import text
+
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    try:
+        session.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_matches_group_tournament "
+            "ON matches(group_id, tournament_id)"
+        ))
+        session.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_matches_bracket "
+            "ON matches(group_id, round_type, match_number)"
+        ))
+        session.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_players_categoria "
+            "ON players(categoria)"
+        ))
+        session.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_matches_category_group "
+            "ON matches(category, group_id)"
+        ))
+        session.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_matches_player1_id "
+            "ON matches(player1_id)"
+        ))
+        session.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_matches_player2_id "
+            "ON matches(player2_id)"
+        ))
+        # One slot per match: drop duplicate slots (keeping the first, the
+        # one get_by_match returned) before the index enforces it
+        session.execute(text(
+            "DELETE FROM schedule_slots WHERE id NOT IN "
+            "(SELECT MIN(id) FROM schedule_slots GROUP BY match_id)"
+        ))
+        session.execute(text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_schedule_slots_match_id "
+            "ON schedule_slots(match_id)"
+        ))
+        session.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_schedule_slots_session_time_table "
+            "ON schedule_slots(session_id, start_time, table_number)"
+        ))
+        session.commit()
+    finally:
+        session.close()
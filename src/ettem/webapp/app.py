@@ -1,17 +1,33 @@
 """FastAPI web application for Easy Table Tennis Event Manager."""
 
+import gzip
+import hashlib
+import itertools
+import json
+import logging
 import math
+import mimetypes
+import os
+import shutil
+import tempfile
+import threading
+import time
 from datetime import datetime as _dt
+from email.utils import formatdate
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from fastapi import FastAPI, Request, Form, File, UploadFile
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse, Response
+from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+from starlette.datastructures import Headers
 from starlette.middleware.sessions import SessionMiddleware
+from starlette.staticfiles import NotModifiedResponse
 
-from ettem.models import Gender, Match, MatchStatus, Pair, Player, Set, Team, detect_event_type, is_doubles_category, is_teams_category
+from ettem.models import Gender, Match, MatchStatus, Pair, Player, RoundType, Set, Team, detect_event_type, is_doubles_category, is_teams_category
 from ettem.standings import calculate_standings
 from ettem.storage import (
     DatabaseManager,
@@ -24,8 +40,12 @@ from ettem.storage import (
     PlayerORM,
     PlayerRepository,
     ScheduleSlotRepository,
+    SessionRepository,
     StandingRepository,
+    TableConfigRepository,
+    TimeSlotRepository,
     TournamentRepository,
+    time_to_minutes,
     migrate_v24_doubles,
     migrate_v25_teams,
     migrate_v26_branding,
@@ -39,19 +59,33 @@ from ettem.storage import (
     DraftPlayerRepository,
     migrate_v28_draft_players,
     migrate_cloud_id_mapping,
+    migrate_query_indexes,
+    existing_columns,
+)
+from ettem.webapp.helpers import (
+    TBD_SHEET_SIDE,
+    CompetitorDisplay,
+    CompetitorDisplayCache,
+    MatchSheet,
+    MatchSheetRef,
+    MatchSheetSide,
+    PlayerLookup,
+    get_competitor_display,
 )
-from ettem.webapp.helpers import CompetitorDisplay, get_competitor_display
 from ettem.validation import validate_match_sets, validate_tt_set, validate_walkover
 from ettem.i18n import load_strings, get_language_from_env, clear_cache as clear_i18n_cache
 
 # Clear i18n cache on app reload to pick up translation changes
 clear_i18n_cache()
 from ettem import pdf_generator
-from ettem.paths import get_templates_dir, get_static_dir, get_data_dir
+from ettem.exports import UTF8_BOM, format_csv_row
+from ettem.paths import get_templates_dir, get_static_dir, get_data_dir, is_frozen
 from ettem.licensing import get_current_license, get_current_license_with_online, validate_license_key, save_license, load_license, clear_license, LicenseInfo
 from ettem.cloud_session import CloudSession, CloudAuthError
 from ettem.cloud_sync import CloudSyncClient, CloudSyncError
 
+logger = logging.getLogger(__name__)
+
 # Initialize FastAPI app
 app = FastAPI(title="Easy Table Tennis Event Manager")
 
@@ -62,25 +96,46 @@ app.add_middleware(
 )
 
 
+# Path prefixes served without a license check
+_LICENSE_FREE_PREFIXES = ("/license", "/static", "/favicon.ico")
+
+# Last successful license check as (monotonic time, license_info). Verifying
+# the key file (and the online status) on every request is wasted work; a
+# failed check is never cached, so a fresh activation is picked up at once.
+_LICENSE_CHECK_TTL = 60.0
+_license_check_cache: Optional[tuple] = None
+
+
+def _clear_license_cache() -> None:
+    """Forget the cached license check (after the license file changes)."""
+    global _license_check_cache
+    _license_check_cache = None
+
+
 # License verification middleware
 @app.middleware("http")
 async def license_middleware(request: Request, call_next):
     """Verify license on every request, redirect to activation if invalid."""
-    # Allow these paths without license check
-    allowed_paths = ["/license", "/static", "/favicon.ico"]
-
+    global _license_check_cache
     path = request.url.path
 
     # Check if path is allowed without license
-    if any(path.startswith(p) for p in allowed_paths):
+    if path.startswith(_LICENSE_FREE_PREFIXES):
         return await call_next(request)
 
     # Check license validity (with online validation when needed)
-    is_valid, license_info, error = get_current_license_with_online()
+    now = time.monotonic()
+    cached = _license_check_cache
+    if cached is not None and now - cached[0] < _LICENSE_CHECK_TTL:
+        license_info = cached[1]
+    else:
+        is_valid, license_info, error = get_current_license_with_online()
 
-    if not is_valid:
-        # Redirect to license activation page
-        return RedirectResponse(url="/license/activate", status_code=303)
+        if not is_valid:
+            _license_check_cache = None
+            # Redirect to license activation page
+            return RedirectResponse(url="/license/activate", status_code=303)
+        _license_check_cache = (now, license_info)
 
     # License is valid, continue with request
     # Store license info in request state for use in templates
@@ -93,41 +148,137 @@ async def license_middleware(request: Request, call_next):
 templates_dir = get_templates_dir()
 templates = Jinja2Templates(directory=str(templates_dir))
 
+# Keep compiled templates on disk (per-user temp dir) so a restart skips
+# parsing them again; the cache is keyed by source checksum, so edits are
+# picked up. Packaged builds never change their templates, so skip the
+# per-render mtime check there.
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+templates.env.auto_reload = not is_frozen()
+
 # Add custom Jinja2 filters
-import json
 templates.env.filters['from_json'] = json.loads
 
 # Translation helper function for templates
+# Per-language (strings dict, t function) pairs; keyed on the identity of the
+# loaded strings so a reload through the i18n cache rebuilds the lookup table.
+_translation_functions: Dict[str, tuple] = {}
+
+
+def _flatten_strings(strings: dict, prefix: str = "") -> Dict[str, str]:
+    """Flatten nested i18n strings into a {"a.b.c": text} mapping."""
+    flat = {}
+    for name, value in strings.items():
+        key = f"{prefix}{name}"
+        if isinstance(value, dict):
+            flat.update(_flatten_strings(value, f"{key}."))
+        elif isinstance(value, str):
+            flat[key] = value
+    return flat
+
+
 def make_translation_function(strings: dict, lang: str):
     """Create a translation function with dot notation support.
 
+    The nested strings are flattened once per language, so each lookup is a
+    single dict access.
+
     Usage in templates: {{ t('webapp.index.welcome') }}
     With formatting: {{ t('webapp.match.score', p1='Juan', p2='Pedro') }}
     """
+    cached = _translation_functions.get(lang)
+    if cached is not None and cached[0] is strings:
+        return cached[1]
+
+    flat = _flatten_strings(strings)
+
     def t(key: str, **kwargs) -> str:
-        value = strings
-        for part in key.split('.'):
-            if isinstance(value, dict) and part in value:
-                value = value[part]
-            else:
-                # Return key if not found (for debugging)
-                return f"[{key}]"
+        value = flat.get(key)
+        if value is None:
+            # Return key if not found (for debugging)
+            return f"[{key}]"
 
-        if isinstance(value, str):
-            if kwargs:
-                try:
-                    return value.format(**kwargs)
-                except KeyError:
-                    return value
-            return value
-        return f"[{key}]"
+        if kwargs:
+            try:
+                return value.format(**kwargs)
+            except KeyError:
+                return value
+        return value
 
+    _translation_functions[lang] = (strings, t)
     return t
 
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows a gzip body (q=0 refuses it)."""
+    allowed = {}
+    for token in accept_encoding.split(","):
+        coding, *params = (part.strip() for part in token.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        allowed[coding.lower()] = quality > 0
+    return allowed.get("gzip", allowed.get("*", False))
+
+
+class PreloadedStaticFiles(StaticFiles):
+    """StaticFiles that serves every asset from memory.
+
+    Packaged builds ship immutable assets, so each file is read, gzipped and
+    given an ETag once at startup; requests never stat or read the disk.
+    Paths that weren't preloaded fall back to the regular lookup.
+    """
+
+    def __init__(self, *, directory: str, **kwargs):
+        super().__init__(directory=directory, **kwargs)
+        self._assets: Dict[str, tuple] = {}
+        root = Path(directory)
+        for file_path in root.rglob("*"):
+            if not file_path.is_file():
+                continue
+            data = file_path.read_bytes()
+            media_type = mimetypes.guess_type(file_path.name)[0] or "text/plain"
+            headers = {
+                "etag": f'"{hashlib.md5(data).hexdigest()}"',
+                "last-modified": formatdate(file_path.stat().st_mtime, usegmt=True),
+                "vary": "Accept-Encoding",
+            }
+            compressed = gzip.compress(data, mtime=0)
+            if len(compressed) >= len(data):
+                compressed, gzip_headers = None, None
+            else:
+                # The gzip body is a different representation, so it gets its own ETag
+                gzip_headers = {
+                    **headers,
+                    "etag": f'{headers["etag"][:-1]}-gz"',
+                    "content-encoding": "gzip",
+                }
+            self._assets[file_path.relative_to(root).as_posix()] = (
+                data, compressed, media_type, headers, gzip_headers,
+            )
+
+    async def get_response(self, path: str, scope) -> Response:
+        asset = self._assets.get(path.replace(os.sep, "/"))
+        if asset is None or scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        data, compressed, media_type, headers, gzip_headers = asset
+        request_headers = Headers(scope=scope)
+        if compressed is not None and _accepts_gzip(request_headers.get("accept-encoding", "")):
+            data, headers = compressed, gzip_headers
+        if self.is_not_modified(headers, request_headers):
+            return NotModifiedResponse(headers)
+        return Response(data, media_type=media_type, headers=headers)
+
+
 # Setup static files directory (supports PyInstaller frozen mode)
 static_dir = get_static_dir()
 if static_dir.exists():
-    app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+    static_files_class = PreloadedStaticFiles if is_frozen() else StaticFiles
+    app.mount("/static", static_files_class(directory=str(static_dir)), name="static")
 
 # Database manager (shared instance)
 db_manager = DatabaseManager()
@@ -142,11 +293,9 @@ def migrate_matches_add_category():
     from sqlalchemy import text
     session = db_manager.get_session()
 
-    try:
-        # Check if column exists by trying to query it
-        session.execute(text("SELECT category FROM matches LIMIT 1"))
+    if "category" in existing_columns(session, "matches"):
         print("[MIGRATION] Column 'category' already exists in matches table")
-    except Exception:
+    else:
         # Column doesn't exist, add it
         print("[MIGRATION] Adding 'category' column to matches table...")
         session.execute(text("ALTER TABLE matches ADD COLUMN category VARCHAR(20)"))
@@ -154,34 +303,22 @@ def migrate_matches_add_category():
         print("[MIGRATION] Column 'category' added successfully")
 
         # Migrate existing bracket matches by inferring category from players
+        # (player1's category, falling back to player2's) in one statement;
+        # matches with no known category are left alone so rowcount is accurate
         print("[MIGRATION] Migrating existing bracket matches...")
-        matches = session.execute(text("""
-            SELECT m.id, m.player1_id, m.player2_id, m.group_id
-            FROM matches m
-            WHERE m.group_id IS NULL AND m.category IS NULL
-        """)).fetchall()
-
-        for match in matches:
-            match_id = match[0]
-            player1_id = match[1]
-            player2_id = match[2]
-
-            # Get category from player1 or player2
-            category = None
-            if player1_id:
-                result = session.execute(text(f"SELECT categoria FROM players WHERE id = {player1_id}")).fetchone()
-                if result:
-                    category = result[0]
-            if not category and player2_id:
-                result = session.execute(text(f"SELECT categoria FROM players WHERE id = {player2_id}")).fetchone()
-                if result:
-                    category = result[0]
-
-            if category:
-                session.execute(text(f"UPDATE matches SET category = '{category}' WHERE id = {match_id}"))
-
+        result = session.execute(text("""
+            UPDATE matches
+            SET category = COALESCE(
+                (SELECT NULLIF(categoria, '') FROM players WHERE players.id = matches.player1_id),
+                (SELECT NULLIF(categoria, '') FROM players WHERE players.id = matches.player2_id)
+            )
+            WHERE group_id IS NULL AND category IS NULL AND COALESCE(
+                (SELECT NULLIF(categoria, '') FROM players WHERE players.id = matches.player1_id),
+                (SELECT NULLIF(categoria, '') FROM players WHERE players.id = matches.player2_id)
+            ) IS NOT NULL
+        """))
         session.commit()
-        print(f"[MIGRATION] Migrated {len(matches)} bracket matches")
+        print(f"[MIGRATION] Migrated {result.rowcount} bracket matches")
 
     session.close()
 
@@ -192,7 +329,7 @@ def migrate_bracket_slots_add_tournament_id():
     (without tournament_id) to new slots (with tournament_id).
     """
     from sqlalchemy import text
-    from ettem.storage import BracketSlotORM, TournamentORM
+    from ettem.storage import TournamentORM
     session = db_manager.get_session()
 
     # Get current tournament
@@ -204,37 +341,48 @@ def migrate_bracket_slots_add_tournament_id():
     tournament_id = current_tournament.id
 
     # Find slots without tournament_id
-    old_slots = session.query(BracketSlotORM).filter(BracketSlotORM.tournament_id == None).all()
+    old_count = session.execute(
+        text("SELECT COUNT(*) FROM bracket_slots WHERE tournament_id IS NULL")
+    ).scalar()
 
-    if not old_slots:
+    if not old_count:
         session.close()
         return
 
-    print(f"[MIGRATION] Found {len(old_slots)} bracket slots without tournament_id")
-    migrated = 0
-
-    for old_slot in old_slots:
-        # Find matching new slot with tournament_id
-        new_slot = session.query(BracketSlotORM).filter(
-            BracketSlotORM.category == old_slot.category,
-            BracketSlotORM.tournament_id == tournament_id,
-            BracketSlotORM.round_type == old_slot.round_type,
-            BracketSlotORM.slot_number == old_slot.slot_number
-        ).first()
-
-        if new_slot and old_slot.player_id:
-            # Migrate player data to new slot
-            new_slot.player_id = old_slot.player_id
-            new_slot.is_bye = old_slot.is_bye
-            new_slot.advanced_by_bye = old_slot.advanced_by_bye
-            new_slot.same_country_warning = old_slot.same_country_warning
-            migrated += 1
-
-        # Delete old slot
-        session.delete(old_slot)
+    print(f"[MIGRATION] Found {old_count} bracket slots without tournament_id")
+
+    # Copy player data from each old slot onto the matching new slot
+    # (category, round_type, slot_number); the last old slot wins.
+    result = session.execute(text("""
+        UPDATE bracket_slots
+        SET (player_id, is_bye, advanced_by_bye, same_country_warning) = (
+            SELECT old.player_id, old.is_bye, old.advanced_by_bye, old.same_country_warning
+            FROM bracket_slots AS old
+            WHERE old.tournament_id IS NULL
+              AND old.player_id IS NOT NULL
+              AND old.category = bracket_slots.category
+              AND old.round_type = bracket_slots.round_type
+              AND old.slot_number = bracket_slots.slot_number
+            ORDER BY old.id DESC
+            LIMIT 1
+        )
+        WHERE tournament_id = :tid
+          AND EXISTS (
+            SELECT 1 FROM bracket_slots AS old
+            WHERE old.tournament_id IS NULL
+              AND old.player_id IS NOT NULL
+              AND old.category = bracket_slots.category
+              AND old.round_type = bracket_slots.round_type
+              AND old.slot_number = bracket_slots.slot_number
+          )
+    """), {"tid": tournament_id})
+    migrated = result.rowcount
+
+    # Delete old slots
+    session.execute(text("DELETE FROM bracket_slots WHERE tournament_id IS NULL"))
 
     session.commit()
-    print(f"[MIGRATION] Migrated {migrated} slots, deleted {len(old_slots)} old slots")
+    print(f"[MIGRATION] Migrated {migrated} slots, deleted {old_count} old slots")
     session.close()
 
 
@@ -252,18 +400,16 @@ def migrate_scheduler_tables():
         ("min_rest_time", "INTEGER DEFAULT 10"),
     ]
 
+    tournament_columns = existing_columns(session, "tournaments")
     for col_name, col_type in columns_to_add:
-        try:
-            session.execute(text(f"SELECT {col_name} FROM tournaments LIMIT 1"))
-        except Exception:
+        if col_name not in tournament_columns:
             print(f"[MIGRATION] Adding '{col_name}' column to tournaments table...")
             session.execute(text(f"ALTER TABLE tournaments ADD COLUMN {col_name} {col_type}"))
             session.commit()
 
     # Create sessions table if not exists
-    try:
-        session.execute(text("SELECT id FROM sessions LIMIT 1"))
-    except Exception:
+    session_columns = existing_columns(session, "sessions")
+    if not session_columns:
         print("[MIGRATION] Creating 'sessions' table...")
         session.execute(text("""
             CREATE TABLE sessions (
@@ -281,9 +427,7 @@ def migrate_scheduler_tables():
         print("[MIGRATION] Table 'sessions' created")
 
     # Create schedule_slots table if not exists
-    try:
-        session.execute(text("SELECT id FROM schedule_slots LIMIT 1"))
-    except Exception:
+    if not existing_columns(session, "schedule_slots"):
         print("[MIGRATION] Creating 'schedule_slots' table...")
         session.execute(text("""
             CREATE TABLE schedule_slots (
@@ -300,18 +444,14 @@ def migrate_scheduler_tables():
         print("[MIGRATION] Table 'schedule_slots' created")
 
     # Add is_finalized column to sessions table if not exists
-    try:
-        session.execute(text("SELECT is_finalized FROM sessions LIMIT 1"))
-    except Exception:
+    if "is_finalized" not in session_columns:
         print("[MIGRATION] Adding 'is_finalized' column to sessions table...")
         session.execute(text("ALTER TABLE sessions ADD COLUMN is_finalized INTEGER NOT NULL DEFAULT 0"))
         session.commit()
         print("[MIGRATION] Column 'is_finalized' added to sessions")
 
     # Create time_slots table if not exists
-    try:
-        session.execute(text("SELECT id FROM time_slots LIMIT 1"))
-    except Exception:
+    if not existing_columns(session, "time_slots"):
         print("[MIGRATION] Creating 'time_slots' table...")
         session.execute(text("""
             CREATE TABLE time_slots (
@@ -338,11 +478,9 @@ def migrate_matches_add_tournament_id():
     from ettem.storage import TournamentORM, GroupORM
     session = db_manager.get_session()
 
-    try:
-        # Check if column exists by trying to query it
-        session.execute(text("SELECT tournament_id FROM matches LIMIT 1"))
+    if "tournament_id" in existing_columns(session, "matches"):
         print("[MIGRATION] Column 'tournament_id' already exists in matches table")
-    except Exception:
+    else:
         # Column doesn't exist, add it
         print("[MIGRATION] Adding 'tournament_id' column to matches table...")
         session.execute(text("ALTER TABLE matches ADD COLUMN tournament_id INTEGER REFERENCES tournaments(id)"))
@@ -363,11 +501,11 @@ def migrate_matches_add_tournament_id():
 
             # Migrate bracket matches (no group_id) - assign to current tournament
             print("[MIGRATION] Migrating bracket matches to current tournament...")
-            session.execute(text(f"""
+            session.execute(text("""
                 UPDATE matches
-                SET tournament_id = {current_tournament.id}
+                SET tournament_id = :tid
                 WHERE group_id IS NULL AND tournament_id IS NULL
-            """))
+            """), {"tid": current_tournament.id})
             session.commit()
             print("[MIGRATION] Match tournament_id migration complete")
 
@@ -382,11 +520,9 @@ def migrate_matches_add_best_of():
     from sqlalchemy import text
     session = db_manager.get_session()
 
-    try:
-        # Check if column exists by trying to query it
-        session.execute(text("SELECT best_of FROM matches LIMIT 1"))
+    if "best_of" in existing_columns(session, "matches"):
         print("[MIGRATION] Column 'best_of' already exists in matches table")
-    except Exception:
+    else:
         # Column doesn't exist, add it
         print("[MIGRATION] Adding 'best_of' column to matches table...")
         session.execute(text("ALTER TABLE matches ADD COLUMN best_of INTEGER NOT NULL DEFAULT 5"))
@@ -435,6 +571,7 @@ migrate_v28_draft_players(db_manager.engine)  # Add draft_players table for regi
 migrate_cloud_id_mapping(db_manager.engine)  # Add cloud_*_id columns + event_mappings table (ETTEM Cloud)
 migrate_bracket_slots_add_tournament_id()
 migrate_matches_fill_category_from_group()  # Fill missing categories from groups
+migrate_query_indexes(db_manager.engine)  # Secondary indexes for hot read queries
 
 
 def get_db_session():
@@ -442,6 +579,69 @@ def get_db_session():
     return db_manager.get_session()
 
 
+# Pre-built "3-1" / "3 - 1" labels for every set score up to 7-7, so result
+# strings are not re-formatted for every match
+_SET_SCORE_LABELS = {(a, b): f"{a}-{b}" for a in range(8) for b in range(8)}
+_SET_SCORE_LABELS_SPACED = {(a, b): f"{a} - {b}" for a in range(8) for b in range(8)}
+
+
+def set_score_label(p1_sets: int, p2_sets: int, spaced: bool = False) -> str:
+    """Return the "3-1" (or "3 - 1" when spaced) label of a set score."""
+    labels = _SET_SCORE_LABELS_SPACED if spaced else _SET_SCORE_LABELS
+    label = labels.get((p1_sets, p2_sets))
+    if label is None:
+        label = f"{p1_sets} - {p2_sets}" if spaced else f"{p1_sets}-{p2_sets}"
+    return label
+
+
+# Spanish display names and sort order of knockout rounds, keyed by the
+# round_type stored on matches; unknown rounds sort last (99)
+_ROUND_DISPLAY_NAMES = {rt.value: rt.display_es for rt in RoundType if rt is not RoundType.ROUND_ROBIN}
+_ROUND_SORT_ORDER = {rt.value: rt.order for rt in RoundType if rt is not RoundType.ROUND_ROBIN}
+
+# Shorter round labels used by the bracket tree and the live results board
+_TREE_ROUND_NAMES = {
+    "R128": "Ronda 128",
+    "R64": "Ronda 64",
+    "R32": "Ronda 32",
+    "R16": "Octavos",
+    "QF": "Cuartos",
+    "SF": "Semifinal",
+    "F": "Final",
+}
+_LIVE_ROUND_LABELS = {"QF": "Cuartos", "SF": "Semifinal", "F": "Final"}
+
+# Round labels of the result validation messages, the results report and the
+# bracket CSV export, listed in play order (earliest knockout round first)
+_REPORT_ROUND_NAMES = {
+    RoundType.ROUND_OF_32.value: "Ronda de 32",
+    RoundType.ROUND_OF_16.value: "Ronda de 16",
+    RoundType.QUARTERFINAL.value: "Cuartos de Final",
+    RoundType.SEMIFINAL.value: "Semifinales",
+    RoundType.FINAL.value: "Final",
+}
+
+
+def count_sets_won(sets: list[dict]) -> tuple[int, int]:
+    """Count sets won by each side in a single pass.
+
+    Args:
+        sets: List of set dicts with player1_points / player2_points
+
+    Returns:
+        Tuple (player1_sets, player2_sets)
+    """
+    p1_sets = p2_sets = 0
+    for s in sets:
+        p1_points = s.get("player1_points", 0)
+        p2_points = s.get("player2_points", 0)
+        if p1_points > p2_points:
+            p1_sets += 1
+        elif p2_points > p1_points:
+            p2_sets += 1
+    return p1_sets, p2_sets
+
+
 def get_local_ip() -> str:
     """Get the local IP address for network access."""
     import socket
@@ -469,6 +669,37 @@ def render_template(template_name: str, context: Dict[str, Any]) -> HTMLResponse
     Returns:
         HTMLResponse with rendered template
     """
+    _prepare_template_context(context)
+    return templates.TemplateResponse(context["request"], template_name, context)
+
+
+def stream_template(template_name: str, context: Dict[str, Any], buffer_size: int = 5) -> StreamingResponse:
+    """
+    Render a template with i18n support, sending the HTML as it is generated.
+
+    Same context handling as render_template, for long documents where the
+    browser can start rendering before the last page is produced.
+
+    Args:
+        template_name: Name of the template file
+        context: Template context (must include 'request')
+        buffer_size: Number of template chunks joined per write
+
+    Returns:
+        StreamingResponse with the rendered template
+    """
+    _prepare_template_context(context)
+    stream = templates.get_template(template_name).stream(context)
+    stream.enable_buffering(buffer_size)
+    return StreamingResponse(stream, media_type="text/html")
+
+
+# Session keys a redirecting handler leaves for the next rendered page
+_FLASH_SESSION_KEYS = frozenset(("flash_message", "flash_type", "form_values"))
+
+
+def _prepare_template_context(context: Dict[str, Any]) -> None:
+    """Add i18n, sidebar, license and flash data to a template context in place."""
     # Get language from: 1) query param, 2) session, 3) environment
     request = context.get("request")
     lang = None
@@ -510,17 +741,20 @@ def render_template(template_name: str, context: Dict[str, Any]) -> HTMLResponse
         current_tournament = tournament_repo.get_current()
         tournament_id = current_tournament.id if current_tournament else None
 
-        # Get players for current tournament only
-        all_players = player_repo.get_all(tournament_id=tournament_id)
-        categories = sorted(set(p.categoria for p in all_players))
+        # Get categories for current tournament only
+        categories = player_repo.get_categories(tournament_id=tournament_id)
         context["categories"] = categories
 
         # Add current tournament to context for all templates
         if "current_tournament" not in context:
             context["current_tournament"] = current_tournament
 
-        # Add license info to context for display in UI
-        _, license_info, _ = get_current_license()
+        # Add license info to context for display in UI (checked by the
+        # license middleware for every non-public path)
+        if request is not None and hasattr(request.state, "license_info"):
+            license_info = request.state.license_info
+        else:
+            _, license_info, _ = get_current_license()
         context["license_info"] = license_info
 
         # Add country colors from branding for badge display
@@ -534,38 +768,33 @@ def render_template(template_name: str, context: Dict[str, Any]) -> HTMLResponse
         else:
             context["country_colors"] = {}
 
-        print(f"[DEBUG] Categories loaded for tournament {tournament_id}: {categories}")
-    except Exception as e:
-        print(f"[ERROR] Failed to load categories: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("Categories loaded for tournament %s: %s", tournament_id, categories)
+    except Exception:
+        logger.exception("Failed to load categories")
         context["categories"] = []
     finally:
         if session:
             session.close()
 
     # Extract flash message and form values from session if available
+    # (only touch the session when one was stored, so pages that don't
+    # flash leave it unmodified)
     request = context.get("request")
-    if request and hasattr(request, "session"):
+    if (request and hasattr(request, "session")
+            and not _FLASH_SESSION_KEYS.isdisjoint(request.session)):
         flash_message = request.session.pop("flash_message", None)
         flash_type = request.session.pop("flash_type", "info")
         form_values = request.session.pop("form_values", None)
 
         if flash_message:
-            # Use repr() to safely print any Unicode characters
-            try:
-                print(f"[DEBUG] Flash message found: {repr(flash_message)} (type: {flash_type})")
-            except:
-                print(f"[DEBUG] Flash message found (type: {flash_type})")
+            logger.debug("Flash message found: %r (type: %s)", flash_message, flash_type)
             context["flash_message"] = flash_message
             context["flash_type"] = flash_type
 
         if form_values:
-            print(f"[DEBUG] Form values found: {form_values}")
+            logger.debug("Form values found: %s", form_values)
             context["form_values"] = form_values
 
-    return templates.TemplateResponse(context["request"], template_name, context)
-
 
 # ============================================================================
 # Tournament Management Routes
@@ -624,6 +853,8 @@ async def create_tournament(
     # If this is the first tournament, set it as current
     if len(tournament_repo.get_all()) == 1:
         tournament_repo.set_current(tournament.id)
+        clear_tournament_name_cache()
+        clear_group_sheet_cache()
 
     request.session["flash_message"] = f"Torneo '{name}' creado exitosamente"
     request.session["flash_type"] = "success"
@@ -640,6 +871,8 @@ async def set_current_tournament(request: Request, tournament_id: int):
     tournament = tournament_repo.get_by_id(tournament_id)
     if tournament:
         tournament_repo.set_current(tournament_id)
+        clear_tournament_name_cache()
+        clear_group_sheet_cache()
         request.session["flash_message"] = f"Torneo '{tournament.name}' seleccionado"
         request.session["flash_type"] = "success"
     else:
@@ -661,6 +894,8 @@ async def archive_tournament(request: Request, tournament_id: int):
         if tournament.is_current:
             tournament_repo.set_current(0)  # This will unset all
         tournament_repo.update_status(tournament_id, "archived")
+        clear_tournament_name_cache()
+        clear_group_sheet_cache()
         request.session["flash_message"] = f"Torneo '{tournament.name}' archivado"
         request.session["flash_type"] = "success"
     else:
@@ -698,6 +933,8 @@ async def delete_tournament(request: Request, tournament_id: int):
     if tournament:
         name = tournament.name
         tournament_repo.delete(tournament_id)
+        clear_tournament_name_cache()
+        clear_group_sheet_cache()
         request.session["flash_message"] = f"Torneo '{name}' eliminado permanentemente"
         request.session["flash_type"] = "success"
     else:
@@ -800,6 +1037,7 @@ async def license_activate(request: Request, license_key: str = Form(...)):
 
     # Save the license locally only after online check passed (or was skipped)
     save_license(license_key)
+    _clear_license_cache()
 
     # Set success flash message
     if hasattr(request, "session"):
@@ -828,6 +1066,7 @@ async def license_deactivate_online(request: Request):
 
     # Clear local license
     clear_license()
+    _clear_license_cache()
 
     return RedirectResponse(url="/license/activate", status_code=303)
 
@@ -852,8 +1091,7 @@ async def index(request: Request):
     tournament_id = current_tournament.id
 
     # Get all unique categories for current tournament
-    all_players = player_repo.get_all(tournament_id=tournament_id)
-    categories = sorted(set(p.categoria for p in all_players))
+    categories = player_repo.get_categories(tournament_id=tournament_id)
 
     return render_template(
         "index.html",
@@ -1051,7 +1289,7 @@ async def enter_result_form(request: Request, match_id: int, return_to: Optional
     # Get preserved form values (if any, from validation error)
     form_values = request.session.pop("form_values", None)
     if form_values:
-        print(f"[DEBUG] Form values found: {form_values}")
+        logger.debug("Form values found: %s", form_values)
 
     return render_template(
         "enter_result.html",
@@ -1210,7 +1448,7 @@ async def save_result(
                         "set7_p1": set7_p1, "set7_p2": set7_p2,
                     }
                     request.session["form_values"] = form_vals
-                    print(f"[DEBUG] Set error - saved form values: {form_vals}")
+                    logger.debug("Set error - saved form values: %s", form_vals)
                     return RedirectResponse(url=enter_result_url(), status_code=303)
 
                 sets_data.append({
@@ -1237,7 +1475,7 @@ async def save_result(
         is_valid, error_msg = validate_match_sets(sets_tuples, best_of=best_of)
         if not is_valid:
             error_text = f"Error en el partido: {error_msg}"
-            print(f"[DEBUG] Saving flash message to session: {error_text}")
+            logger.debug("Saving flash message to session: %s", error_text)
             request.session["flash_message"] = error_text
             request.session["flash_type"] = "error"
             # Save RAW form values (as submitted by user) to preserve them on error
@@ -1247,7 +1485,7 @@ async def save_result(
                 form_vals[f"set{i}_p1"] = raw_inputs[(i-1)*2] or ""
                 form_vals[f"set{i}_p2"] = raw_inputs[(i-1)*2 + 1] or ""
             request.session["form_values"] = form_vals
-            print(f"[DEBUG] Saved form values: {form_vals}")
+            logger.debug("Saved form values: %s", form_vals)
             return RedirectResponse(url=enter_result_url(), status_code=303)
 
         # Determine winner based on sets won
@@ -2238,7 +2476,8 @@ async def view_bracket_matches(request: Request, category: str):
     pending_byes = count_pending_byes(category, bracket_repo, tournament_id)
     bye_matches_count = count_bye_matches(category, match_repo, bracket_repo, tournament_id)
     total_pending = pending_byes + bye_matches_count
-    print(f"[DEBUG] pending_byes for {category}: {pending_byes}, bye_matches: {bye_matches_count}")
+    logger.debug("pending_byes for %s: %s, bye_matches: %s",
+                 category, pending_byes, bye_matches_count)
 
     # Check if this category has groups (to conditionally show "Groups" button)
     group_repo = GroupRepository(session)
@@ -6953,24 +7192,9 @@ def validate_bracket_round_order(match_orm, category, session) -> tuple[bool, st
     Returns:
         Tuple of (is_valid, error_message)
     """
-    from ettem.models import RoundType
-
     # Define round order (from first to last)
-    round_order = [
-        RoundType.ROUND_OF_32.value,
-        RoundType.ROUND_OF_16.value,
-        RoundType.QUARTERFINAL.value,
-        RoundType.SEMIFINAL.value,
-        RoundType.FINAL.value,
-    ]
-
-    round_names = {
-        RoundType.ROUND_OF_32.value: "Ronda de 32",
-        RoundType.ROUND_OF_16.value: "Ronda de 16",
-        RoundType.QUARTERFINAL.value: "Cuartos de Final",
-        RoundType.SEMIFINAL.value: "Semifinales",
-        RoundType.FINAL.value: "Final",
-    }
+    round_order = list(_REPORT_ROUND_NAMES)
+    round_names = _REPORT_ROUND_NAMES
 
     current_round = match_orm.round_type
 
@@ -7364,7 +7588,7 @@ def create_bracket_matches(category: str, bracket_repo, match_repo, tournament_i
     for match_orm in match_repo.get_bracket_matches_by_category(category, tournament_id=tournament_id):
         key = (match_orm.round_type, match_orm.match_number)
         existing_bracket_matches[key] = match_orm
-        print(f"[DEBUG] Existing match found: {key}")
+        logger.debug("Existing match found: %s", key)
 
     matches_created = 0
     import sys
@@ -7379,10 +7603,11 @@ def create_bracket_matches(category: str, bracket_repo, match_repo, tournament_i
         # Check both enum value and string key
         round_key = round_type.value if round_type.value in slots_by_round else round_type
         if round_key not in slots_by_round:
-            print(f"[DEBUG] Skipping round {round_type.value} - not in slots_by_round")
+            logger.debug("Skipping round %s - not in slots_by_round", round_type.value)
             continue
 
-        print(f"[DEBUG] Processing round {round_type.value} with {len(slots_by_round[round_key])} slots")
+        logger.debug("Processing round %s with %s slots",
+                     round_type.value, len(slots_by_round[round_key]))
         slots = sorted(slots_by_round[round_key], key=lambda s: s.slot_number)
 
         # Create matches by pairing adjacent slots (1-2, 3-4, 5-6, etc.)
@@ -7933,7 +8158,8 @@ def process_bye_advancements(category: str, bracket_repo, session, tournament_id
                         deleted_count += 1
         if deleted_count > 0:
             session.commit()
-            print(f"[DEBUG] Deleted {deleted_count} BYE matches for {category} (first round: {first_round_value})")
+            logger.debug("Deleted %s BYE matches for %s (first round: %s)",
+                         deleted_count, category, first_round_value)
 
     return True
 
@@ -8291,14 +8517,34 @@ async def admin_manual_bracket_save(request: Request, category: str):
 # ==============================================================================
 
 
+# Current tournament name for print headers: (expires at, name). Reset by the
+# tournament routes that change which tournament is current; the TTL covers
+# changes made outside this process (e.g. the CLI on the same database).
+_TOURNAMENT_NAME_TTL_SECONDS = 60
+_tournament_name_cache: Optional[tuple[float, str]] = None
+
+
+def clear_tournament_name_cache() -> None:
+    """Forget the cached current tournament name."""
+    global _tournament_name_cache
+    _tournament_name_cache = None
+
+
 def get_tournament_name() -> str:
     """Get current tournament name for PDF headers."""
+    global _tournament_name_cache
+
+    cached = _tournament_name_cache
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
     with get_db_session() as session:
         tournament_repo = TournamentRepository(session)
         tournament = tournament_repo.get_current()
-        if tournament:
-            return tournament.name
-        return "Torneo de Tenis de Mesa"
+        name = tournament.name if tournament else "Torneo de Tenis de Mesa"
+
+    _tournament_name_cache = (time.monotonic() + _TOURNAMENT_NAME_TTL_SECONDS, name)
+    return name
 
 
 def get_branding_data() -> dict:
@@ -8334,6 +8580,176 @@ def get_branding_data() -> dict:
         return result
 
 
+def _pair_up(matches_data) -> Iterator[list]:
+    """Group match sheets two per page.
+
+    Yields the pages lazily from any iterable: the template walks them once,
+    so the list of pages is never materialized next to the flat list.
+    """
+    sheets = iter(matches_data)
+    for first in sheets:
+        second = next(sheets, None)
+        yield [first] if second is None else [first, second]
+
+
+def _build_group_sheet(event_type, players_orm, matches_orm, player_repo, pair_repo, team_repo,
+                       slots_by_match=None) -> tuple[list, list, dict]:
+    """Compute the standings table, match list and results matrix of a group sheet.
+
+    Shared by the group sheet PDF and its previews. ``player_repo`` only needs
+    ``get_by_id`` (a PlayerLookup avoids one query per match). When
+    ``slots_by_match`` is given, each match also carries its table and time.
+
+    Returns:
+        Tuple (players, matches, results_matrix)
+    """
+    # Initialize player stats (keyed by entity ID: player/pair/team)
+    player_stats = {}
+    for p in players_orm:
+        player_stats[p.id] = {
+            "wins": 0,
+            "losses": 0,
+            "sets_won": 0,
+            "sets_lost": 0,
+            "points": 0,
+        }
+
+    # Build results matrix from actual match results
+    # Matrix format: results_matrix[(entity1_id, entity2_id)] = "3-1" (sets won)
+    results_matrix = {}
+
+    # Build matches with results and calculate stats
+    matches = []
+    for m in matches_orm:
+        cd1 = get_competitor_display(m, 1, player_repo, pair_repo=pair_repo, team_repo=team_repo)
+        cd2 = get_competitor_display(m, 2, player_repo, pair_repo=pair_repo, team_repo=team_repo)
+
+        # Calculate result from sets
+        result = None
+        match_sets = m.sets
+        if match_sets:
+            sets_p1, sets_p2 = count_sets_won(match_sets)
+            result = set_score_label(sets_p1, sets_p2)
+
+            # Fill results matrix (both directions) and update set stats for
+            # the sides that belong to this group
+            stats1 = player_stats.get(m.player1_id)
+            stats2 = player_stats.get(m.player2_id)
+            if stats1 is not None:
+                results_matrix[(m.player1_id, m.player2_id)] = result
+                stats1["sets_won"] += sets_p1
+                stats1["sets_lost"] += sets_p2
+            if stats2 is not None:
+                results_matrix[(m.player2_id, m.player1_id)] = set_score_label(sets_p2, sets_p1)
+                stats2["sets_won"] += sets_p2
+                stats2["sets_lost"] += sets_p1
+
+            # Determine winner and update wins/losses/points
+            if m.winner_id:
+                if m.winner_id == m.player1_id:
+                    winner_stats, loser_stats = stats1, stats2
+                else:
+                    winner_stats, loser_stats = player_stats.get(m.winner_id), stats1
+                if winner_stats is not None:
+                    winner_stats["wins"] += 1
+                    winner_stats["points"] += 2
+                if loser_stats is not None:
+                    loser_stats["losses"] += 1
+                    # 1 point for playing (not walkover)
+                    if m.status != "WALKOVER":
+                        loser_stats["points"] += 1
+
+        # Determine winner's group number
+        winner_group_number = None
+        if m.winner_id:
+            p1_orm = player_repo.get_by_id(m.player1_id)
+            p2_orm = player_repo.get_by_id(m.player2_id)
+            if m.winner_id == m.player1_id and p1_orm:
+                winner_group_number = p1_orm.group_number
+            elif m.winner_id == m.player2_id and p2_orm:
+                winner_group_number = p2_orm.group_number
+
+        match_data = {
+            "match_order": m.match_number,
+            "result": result,
+            "winner_group_number": winner_group_number,
+            "player1": {"nombre": cd1.nombre, "apellido": cd1.apellido},
+            "player2": {"nombre": cd2.nombre, "apellido": cd2.apellido},
+        }
+        if slots_by_match is not None:
+            schedule_slot = slots_by_match.get(m.id)
+            match_data["table_number"] = schedule_slot.table_number if schedule_slot else None
+            match_data["scheduled_time"] = schedule_slot.start_time if schedule_slot else None
+        matches.append(match_data)
+
+    # Build player dicts with stats
+    players = []
+    for p in players_orm:
+        stats = player_stats.get(p.id, {})
+        # Calculate ratios for tiebreaker
+        sets_won = stats.get("sets_won", 0)
+        sets_lost = stats.get("sets_lost", 0)
+        sets_ratio = sets_won / sets_lost if sets_lost > 0 else (float('inf') if sets_won > 0 else 0)
+
+        # Resolve display name (team/pair-aware)
+        if event_type == "teams" and team_repo:
+            team_orm = team_repo.get_by_id(p.id)
+            display_nombre = team_orm.name if team_orm else p.nombre
+            display_apellido = ""
+            display_pais = (team_orm.pais_cd if team_orm else p.pais_cd) or p.pais_cd
+        elif event_type == "doubles" and pair_repo:
+            pair_orm = pair_repo.get_by_id(p.id)
+            if pair_orm:
+                p1_orm = player_repo.get_by_id(pair_orm.player1_id)
+                p2_orm = player_repo.get_by_id(pair_orm.player2_id)
+                cd = CompetitorDisplay.from_pair(pair_orm, p1_orm, p2_orm)
+                display_nombre = cd.nombre
+                display_apellido = cd.apellido
+                display_pais = cd.pais_cd
+            else:
+                display_nombre = p.nombre
+                display_apellido = p.apellido
+                display_pais = p.pais_cd
+        else:
+            display_nombre = p.nombre
+            display_apellido = p.apellido
+            display_pais = p.pais_cd
+
+        players.append({
+            "player": {
+                "id": p.id,
+                "nombre": display_nombre,
+                "apellido": display_apellido,
+                "pais_cd": display_pais,
+                "group_number": p.group_number,
+            },
+            "stats": {
+                "points": stats.get("points", 0),
+                "wins": stats.get("wins", 0),
+                "losses": stats.get("losses", 0),
+                "sets_won": sets_won,
+                "sets_lost": sets_lost,
+                "sets_ratio": sets_ratio,
+                "position": None,  # Will be calculated below
+            }
+        })
+
+    # Calculate positions based on points and tiebreakers
+    # Only for players who have played at least one match
+    players_with_matches = [p for p in players if p["stats"]["wins"] + p["stats"]["losses"] > 0]
+    if players_with_matches:
+        # Sort by: points (desc), sets_ratio (desc), group_number (asc as tiebreaker)
+        sorted_players = sorted(
+            players_with_matches,
+            key=lambda x: (-x["stats"]["points"], -x["stats"]["sets_ratio"], x["player"]["group_number"])
+        )
+        # Assign positions (sorted_players holds the same dicts as players)
+        for pos, p in enumerate(sorted_players, 1):
+            p["stats"]["position"] = pos
+
+    return players, matches, results_matrix
+
+
 @app.get("/print/match/{match_id}")
 async def print_match_sheet(match_id: int):
     """Generate PDF for a single match sheet."""
@@ -8367,8 +8783,7 @@ async def print_match_sheet(match_id: int):
                 matches_per_round = max(1, num_players // 2)
 
                 # Get all matches in this group to find the index
-                all_group_matches = match_repo.get_by_group(match_orm.group_id)
-                all_group_matches = sorted(all_group_matches, key=lambda m: m.match_number or 999)
+                all_group_matches = match_repo.get_by_group(match_orm.group_id, ordered=True)
                 for idx, gm in enumerate(all_group_matches):
                     if gm.id == match_orm.id:
                         round_number = (idx // matches_per_round) + 1
@@ -8444,146 +8859,15 @@ async def print_group_sheet(group_id: int):
         players_orm = sorted(players_orm, key=lambda p: p.group_number or 999)
 
         # Get matches
-        matches_orm = match_repo.get_by_group(group_id)
-        matches_orm = sorted(matches_orm, key=lambda m: m.match_number or 999)
-
-        # Initialize player stats
-        player_stats = {}
-        for p in players_orm:
-            player_stats[p.id] = {
-                "wins": 0,
-                "losses": 0,
-                "sets_won": 0,
-                "sets_lost": 0,
-                "points": 0,
-            }
-
-        # Build results matrix from actual match results
-        results_matrix = {}
-        for p in players_orm:
-            results_matrix[p.id] = {}
-
-        # Build matches with player info and results
-        from ettem.webapp.helpers import get_competitor_display
-        matches = []
-        for m in matches_orm:
-            cd1 = get_competitor_display(m, 1, player_repo, pair_repo=pair_repo, team_repo=team_repo)
-            cd2 = get_competitor_display(m, 2, player_repo, pair_repo=pair_repo, team_repo=team_repo)
-
-            # Calculate result from sets
-            result = None
-            if m.sets and len(m.sets) > 0:
-                sets_p1 = sum(1 for s in m.sets if s.get('player1_points', 0) > s.get('player2_points', 0))
-                sets_p2 = sum(1 for s in m.sets if s.get('player2_points', 0) > s.get('player1_points', 0))
-                result = f"{sets_p1}-{sets_p2}"
-                # Fill results matrix (both directions)
-                if m.player1_id in results_matrix:
-                    results_matrix[m.player1_id][m.player2_id] = f"{sets_p1}-{sets_p2}"
-                if m.player2_id in results_matrix:
-                    results_matrix[m.player2_id][m.player1_id] = f"{sets_p2}-{sets_p1}"
-
-                # Update player stats
-                if m.player1_id in player_stats:
-                    player_stats[m.player1_id]["sets_won"] += sets_p1
-                    player_stats[m.player1_id]["sets_lost"] += sets_p2
-                if m.player2_id in player_stats:
-                    player_stats[m.player2_id]["sets_won"] += sets_p2
-                    player_stats[m.player2_id]["sets_lost"] += sets_p1
-
-                # Determine winner and update wins/losses/points
-                if m.winner_id:
-                    if m.winner_id in player_stats:
-                        player_stats[m.winner_id]["wins"] += 1
-                        player_stats[m.winner_id]["points"] += 2
-                    loser_id = m.player2_id if m.winner_id == m.player1_id else m.player1_id
-                    if loser_id in player_stats:
-                        player_stats[loser_id]["losses"] += 1
-                        # 1 point for playing (not walkover)
-                        if m.status != "WALKOVER":
-                            player_stats[loser_id]["points"] += 1
-
-            # Determine winner's group number
-            winner_group_number = None
-            if m.winner_id:
-                p1_orm = player_repo.get_by_id(m.player1_id)
-                p2_orm = player_repo.get_by_id(m.player2_id)
-                if m.winner_id == m.player1_id and p1_orm:
-                    winner_group_number = p1_orm.group_number
-                elif m.winner_id == m.player2_id and p2_orm:
-                    winner_group_number = p2_orm.group_number
-
-            matches.append({
-                "match_order": m.match_number,
-                "result": result,
-                "winner_group_number": winner_group_number,
-                "player1": {"nombre": cd1.nombre, "apellido": cd1.apellido},
-                "player2": {"nombre": cd2.nombre, "apellido": cd2.apellido},
-            })
-
-        # Build player dicts with stats
-        players = []
-        for p in players_orm:
-            stats = player_stats.get(p.id, {})
-            # Calculate ratios for tiebreaker
-            sets_won = stats.get("sets_won", 0)
-            sets_lost = stats.get("sets_lost", 0)
-            sets_ratio = sets_won / sets_lost if sets_lost > 0 else (float('inf') if sets_won > 0 else 0)
-
-            # Resolve display name (team/pair-aware)
-            if event_type == "teams" and team_repo:
-                team_orm = team_repo.get_by_id(p.id)
-                display_nombre = team_orm.name if team_orm else p.nombre
-                display_apellido = ""
-                display_pais = (team_orm.pais_cd if team_orm else p.pais_cd) or p.pais_cd
-            elif event_type == "doubles" and pair_repo:
-                pair_orm = pair_repo.get_by_id(p.id)
-                if pair_orm:
-                    p1_d = player_repo.get_by_id(pair_orm.player1_id)
-                    p2_d = player_repo.get_by_id(pair_orm.player2_id)
-                    cd = CompetitorDisplay.from_pair(pair_orm, p1_d, p2_d)
-                    display_nombre = cd.nombre
-                    display_apellido = cd.apellido
-                    display_pais = cd.pais_cd
-                else:
-                    display_nombre = p.nombre
-                    display_apellido = p.apellido
-                    display_pais = p.pais_cd
-            else:
-                display_nombre = p.nombre
-                display_apellido = p.apellido
-                display_pais = p.pais_cd
-
-            players.append({
-                "player": {
-                    "id": p.id,
-                    "nombre": display_nombre,
-                    "apellido": display_apellido,
-                    "pais_cd": display_pais,
-                    "group_number": p.group_number,
-                },
-                "stats": {
-                    "points": stats.get("points", 0),
-                    "wins": stats.get("wins", 0),
-                    "losses": stats.get("losses", 0),
-                    "sets_won": sets_won,
-                    "sets_lost": sets_lost,
-                    "sets_ratio": sets_ratio,
-                    "position": None,
-                }
-            })
-
-        # Calculate positions based on points and tiebreakers
-        players_with_matches = [p for p in players if p["stats"]["wins"] + p["stats"]["losses"] > 0]
-        if players_with_matches:
-            sorted_players = sorted(
-                players_with_matches,
-                key=lambda x: (-x["stats"]["points"], -x["stats"]["sets_ratio"], x["player"]["group_number"])
-            )
-            for pos, p in enumerate(sorted_players, 1):
-                for orig_p in players:
-                    if orig_p["player"]["id"] == p["player"]["id"]:
-                        orig_p["stats"]["position"] = pos
-                        break
+        matches_orm = match_repo.get_by_group(group_id, ordered=True)
+
+        # Every player referenced by the matches, loaded in one query
+        player_lookup = PlayerLookup(player_repo, player_repo.get_by_ids(
+            {pid for m in matches_orm for pid in (m.player1_id, m.player2_id) if pid}
+        ))
+        players, matches, results_matrix = _build_group_sheet(
+            event_type, players_orm, matches_orm, player_lookup, pair_repo, team_repo
+        )
 
         try:
             pdf_bytes = pdf_generator.generate_group_sheet_pdf(
@@ -8626,8 +8910,7 @@ async def print_group_matches(group_id: int):
         _is_doubles = is_doubles_category(group.category)
 
         # Get matches
-        matches_orm = match_repo.get_by_group(group_id)
-        matches_orm = sorted(matches_orm, key=lambda m: m.match_number or 999)
+        matches_orm = match_repo.get_by_group(group_id, ordered=True)
 
         # Build matches with player info
         matches = []
@@ -8642,10 +8925,10 @@ async def print_group_matches(group_id: int):
 
             # Calculate result from sets
             result = None
-            if m.sets and len(m.sets) > 0:
-                sets_p1 = sum(1 for s in m.sets if s.get('player1_points', 0) > s.get('player2_points', 0))
-                sets_p2 = sum(1 for s in m.sets if s.get('player2_points', 0) > s.get('player1_points', 0))
-                result = f"{sets_p1} - {sets_p2}"
+            match_sets = m.sets
+            if match_sets:
+                sets_p1, sets_p2 = count_sets_won(match_sets)
+                result = set_score_label(sets_p1, sets_p2, spaced=True)
 
             matches.append({
                 "match_order": m.match_number,
@@ -8705,8 +8988,7 @@ async def print_all_group_match_sheets(group_id: int):
         _is_doubles = is_doubles_category(group.category)
 
         # Get matches
-        matches_orm = match_repo.get_by_group(group_id)
-        matches_orm = sorted(matches_orm, key=lambda m: m.match_number or 999)
+        matches_orm = match_repo.get_by_group(group_id, ordered=True)
 
         # Get number of players in group to calculate rounds
         all_players = player_repo.get_all()
@@ -8793,8 +9075,7 @@ async def print_all_category_match_sheets(category: str):
         # Build all matches data
         matches_data = []
         for group in sorted(groups, key=lambda g: int(g.name) if g.name.isdigit() else g.name):
-            matches_orm = match_repo.get_by_group(group.id)
-            matches_orm = sorted(matches_orm, key=lambda m: m.match_number or 999)
+            matches_orm = match_repo.get_by_group(group.id, ordered=True)
 
             # Get number of players in this group to calculate rounds
             players_in_group = [p for p in all_players if p.group_id == group.id]
@@ -8957,13 +9238,7 @@ async def tournament_status(request: Request):
                             bracket_matches.append(m)
 
                 # Group by round
-                round_order = [
-                    (RoundType.ROUND_OF_32.value, "Ronda de 32"),
-                    (RoundType.ROUND_OF_16.value, "Ronda de 16"),
-                    (RoundType.QUARTERFINAL.value, "Cuartos de Final"),
-                    (RoundType.SEMIFINAL.value, "Semifinales"),
-                    (RoundType.FINAL.value, "Final"),
-                ]
+                round_order = _REPORT_ROUND_NAMES.items()
 
                 for round_type, round_name in round_order:
                     round_matches = [m for m in bracket_matches if m.round_type == round_type]
@@ -9018,62 +9293,85 @@ async def tournament_status(request: Request):
 # CSV EXPORT ROUTES
 # =============================================================================
 
+# Bracket CSV export: round sort order (from the report round labels) and status labels
+_CSV_ROUND_ORDER = {round_type: index for index, round_type in enumerate(_REPORT_ROUND_NAMES, 1)}
+
+_CSV_STATUS_MAP = {
+    "pending": "Pendiente",
+    "completed": "Completado",
+    "WALKOVER": "Walkover",
+}
+
+
+def _csv_attachment_headers(filename: str) -> dict:
+    """Headers that make the browser download the CSV as ``filename``."""
+    return {"Content-Disposition": f"attachment; filename={filename}"}
+
+
+def csv_stream_response(filename: str, header: list, rows_iter) -> StreamingResponse:
+    """Stream a CSV download row by row (BOM first for Excel UTF-8 compatibility).
+
+    ``rows_iter`` is consumed lazily, so it may hold a DB session open while
+    the body is being sent.
+    """
+    async def gen():
+        yield UTF8_BOM
+        yield format_csv_row(header).encode('utf-8')
+        for row in rows_iter:
+            yield format_csv_row(row).encode('utf-8')
+
+    return StreamingResponse(
+        gen(),
+        media_type="text/csv; charset=utf-8",
+        headers=_csv_attachment_headers(filename)
+    )
+
+
+def csv_buffered_response(filename: str, header: list, rows) -> PlainTextResponse:
+    """Send a small CSV download as a single body (BOM first, like the streamed one)."""
+    lines = [format_csv_row(header)]
+    lines.extend(format_csv_row(row) for row in rows)
+    return PlainTextResponse(
+        UTF8_BOM + "".join(lines).encode('utf-8'),
+        media_type="text/csv; charset=utf-8",
+        headers=_csv_attachment_headers(filename)
+    )
+
+
 @app.get("/export/bracket/{category}")
 async def export_bracket_csv(category: str):
-    """Export bracket matches to CSV."""
-    import csv
-    import io
-    from ettem.models import RoundType
+    """Export bracket matches to CSV.
+
+    A bracket has at most a few dozen matches, so the CSV is built in memory
+    and sent in one body instead of going through a streaming response.
+    """
+    rows = []
 
     with get_db_session() as session:
         match_repo = MatchRepository(session)
         player_repo = PlayerRepository(session)
 
-        # Get all bracket matches for this category
-        all_matches = match_repo.get_all()
-        bracket_matches = []
+        # Fetch only the name columns of every bracket player in one query;
+        # the same dict serves the category filter and the row names
+        all_bracket_matches = match_repo.get_bracket_matches()
+        names = player_repo.get_names_by_ids({
+            pid for m in all_bracket_matches for pid in (m.player1_id, m.player2_id, m.winner_id) if pid
+        })
 
-        for m in all_matches:
-            if m.group_id is None:  # Bracket match
-                if m.player1_id:
-                    player = player_repo.get_by_id(m.player1_id)
-                    if player and player.categoria == category:
-                        bracket_matches.append(m)
-                elif m.player2_id:
-                    player = player_repo.get_by_id(m.player2_id)
-                    if player and player.categoria == category:
-                        bracket_matches.append(m)
+        # Category comes from player 1 (player 2 when the first slot is empty)
+        bracket_matches = []
+        for m in all_bracket_matches:
+            player = names.get(m.player1_id) if m.player1_id else names.get(m.player2_id)
+            if player and player.categoria == category:
+                bracket_matches.append(m)
 
         # Sort by round order then match number
-        round_order = {
-            RoundType.ROUND_OF_32.value: 1,
-            RoundType.ROUND_OF_16.value: 2,
-            RoundType.QUARTERFINAL.value: 3,
-            RoundType.SEMIFINAL.value: 4,
-            RoundType.FINAL.value: 5,
-        }
-        bracket_matches.sort(key=lambda m: (round_order.get(m.round_type, 99), m.match_number or 0))
-
-        # Round display names
-        round_names = {
-            RoundType.ROUND_OF_32.value: "Ronda de 32",
-            RoundType.ROUND_OF_16.value: "Ronda de 16",
-            RoundType.QUARTERFINAL.value: "Cuartos de Final",
-            RoundType.SEMIFINAL.value: "Semifinales",
-            RoundType.FINAL.value: "Final",
-        }
-
-        # Build CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Header
-        writer.writerow(["Ronda", "Partido", "Jugador 1", "Jugador 2", "Ganador", "Sets", "Estado"])
+        bracket_matches.sort(key=lambda m: (_CSV_ROUND_ORDER.get(m.round_type, 99), m.match_number or 0))
 
         for m in bracket_matches:
-            player1 = player_repo.get_by_id(m.player1_id) if m.player1_id else None
-            player2 = player_repo.get_by_id(m.player2_id) if m.player2_id else None
-            winner = player_repo.get_by_id(m.winner_id) if m.winner_id else None
+            player1 = names.get(m.player1_id)
+            player2 = names.get(m.player2_id)
+            winner = names.get(m.winner_id)
 
             player1_name = f"{player1.nombre} {player1.apellido}" if player1 else "TBD"
             player2_name = f"{player2.nombre} {player2.apellido}" if player2 else "TBD"
@@ -9082,23 +9380,18 @@ async def export_bracket_csv(category: str):
             # Parse sets
             sets_str = "-"
             if m.sets_json:
-                import json
                 sets = json.loads(m.sets_json)
                 if sets:
-                    p1_sets = sum(1 for s in sets if s.get("player1_points", 0) > s.get("player2_points", 0))
-                    p2_sets = sum(1 for s in sets if s.get("player2_points", 0) > s.get("player1_points", 0))
+                    p1_sets, p2_sets = count_sets_won(sets)
                     sets_str = f"{p1_sets}-{p2_sets}"
 
-            # Status
-            status_map = {
-                "pending": "Pendiente",
-                "completed": "Completado",
-                "WALKOVER": "Walkover",
-            }
-            status = status_map.get(m.status, m.status)
+            try:
+                status = _CSV_STATUS_MAP[m.status]
+            except KeyError:
+                status = m.status
 
-            writer.writerow([
-                round_names.get(m.round_type, m.round_type),
+            rows.append([
+                _REPORT_ROUND_NAMES.get(m.round_type, m.round_type),
                 m.match_number or "-",
                 player1_name,
                 player2_name,
@@ -9107,72 +9400,50 @@ async def export_bracket_csv(category: str):
                 status
             ])
 
-        # Return CSV response with BOM for Excel UTF-8 compatibility
-        csv_content = output.getvalue()
-        filename = f"bracket_{category}.csv"
-        csv_bytes = ('\ufeff' + csv_content).encode('utf-8')
-
-        return Response(
-            content=csv_bytes,
-            media_type="text/csv; charset=utf-8",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
+    return csv_buffered_response(
+        f"bracket_{category}.csv",
+        ["Ronda", "Partido", "Jugador 1", "Jugador 2", "Ganador", "Sets", "Estado"],
+        rows,
+    )
 
 
 @app.get("/export/standings/{category}")
 async def export_standings_csv(category: str):
-    """Export standings to CSV."""
-    import csv
-    import io
+    """Export standings to CSV (streamed row by row)."""
 
     with get_db_session() as session:
-        standing_repo = StandingRepository(session)
-        player_repo = PlayerRepository(session)
-        group_repo = GroupRepository(session)
-
-        # Get all groups for this category
-        groups = group_repo.get_by_category(category)
-
-        if not groups:
-            return Response(content="No hay grupos para esta categoría", status_code=404)
+        # Existence check only; the rows are read by the generator below
+        has_groups = GroupRepository(session).has_category(category)
 
-        # Build CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
+    if not has_groups:
+        return Response(content="No hay grupos para esta categoría", status_code=404)
 
-        # Header
-        writer.writerow(["Grupo", "Posición", "Jugador", "País", "Puntos", "V", "D", "Sets+", "Sets-", "Pts+", "Pts-"])
-
-        for group in groups:
-            standings = standing_repo.get_by_group(group.id)
-            for s in standings:
-                player = player_repo.get_by_id(s.player_id)
-
-                writer.writerow([
-                    group.name if group else "-",
-                    s.position,
-                    f"{player.nombre} {player.apellido}" if player else "-",
-                    player.pais_cd if player else "-",
-                    s.points_total,
-                    s.wins,
-                    s.losses,
-                    s.sets_w,
-                    s.sets_l,
-                    s.points_w,
-                    s.points_l
-                ])
-
-        csv_content = output.getvalue()
-        filename = f"standings_{category}.csv"
-
-        # Add BOM for Excel UTF-8 compatibility
-        csv_bytes = ('\ufeff' + csv_content).encode('utf-8')
+    def iter_rows():
+        with get_db_session() as session:
+            # One joined query, read from the cursor in batches and written
+            # out row by row
+            for row in StandingRepository(session).iter_rows_by_category(category):
+                has_player = row.player_id is not None
+
+                yield [
+                    row.group_name or "-",
+                    row.position,
+                    f"{row.nombre} {row.apellido}" if has_player else "-",
+                    row.pais_cd if has_player else "-",
+                    row.points_total,
+                    row.wins,
+                    row.losses,
+                    row.sets_w,
+                    row.sets_l,
+                    row.points_w,
+                    row.points_l
+                ]
 
-        return Response(
-            content=csv_bytes,
-            media_type="text/csv; charset=utf-8",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
+    return csv_stream_response(
+        f"standings_{category}.csv",
+        ["Grupo", "Posición", "Jugador", "País", "Puntos", "V", "D", "Sets+", "Sets-", "Pts+", "Pts-"],
+        iter_rows(),
+    )
 
 
 @app.get("/admin/export/tournament-excel")
@@ -9276,12 +9547,6 @@ async def export_tournament_excel():
                 })
 
         # --- Bracket Matches ---
-        round_names = {
-            "R128": "Ronda de 128", "R64": "Ronda de 64", "R32": "Ronda de 32",
-            "R16": "Octavos de Final", "QF": "Cuartos de Final",
-            "SF": "Semifinal", "F": "Final",
-        }
-        round_order = {"R128": 0, "R64": 1, "R32": 2, "R16": 3, "QF": 4, "SF": 5, "F": 6}
         bracket_matches_data = []
         for m in all_matches:
             if m.group_id is None and m.tournament_id == tournament_id and m.category:
@@ -9297,8 +9562,8 @@ async def export_tournament_excel():
                         sets_result = f"{p1s}-{p2s}"
                 bracket_matches_data.append({
                     "category": m.category,
-                    "round_name": round_names.get(m.round_type, m.round_type or ""),
-                    "round_order": round_order.get(m.round_type, 99),
+                    "round_name": _ROUND_DISPLAY_NAMES.get(m.round_type, m.round_type or ""),
+                    "round_order": _ROUND_SORT_ORDER.get(m.round_type, 99),
                     "match_order": m.match_number or "",
                     "player1_name": f"{p1.nombre} {p1.apellido}" if p1 else "TBD",
                     "player2_name": f"{p2.nombre} {p2.apellido}" if p2 else "TBD",
@@ -9393,12 +9658,6 @@ async def export_results_csv():
         tournament_id = tournament.id
         all_matches = match_repo.get_all()
 
-        round_names = {
-            "R128": "Ronda de 128", "R64": "Ronda de 64", "R32": "Ronda de 32",
-            "R16": "Octavos de Final", "QF": "Cuartos de Final",
-            "SF": "Semifinal", "F": "Final",
-        }
-
         group_matches_data = []
         bracket_matches_data = []
 
@@ -9432,7 +9691,7 @@ async def export_results_csv():
             elif m.category:
                 bracket_matches_data.append({
                     "category": m.category,
-                    "round_name": round_names.get(m.round_type, m.round_type or ""),
+                    "round_name": _ROUND_DISPLAY_NAMES.get(m.round_type, m.round_type or ""),
                     "match_order": m.match_number or "",
                     "player1_name": f"{p1.nombre} {p1.apellido}" if p1 else "TBD",
                     "player2_name": f"{p2.nombre} {p2.apellido}" if p2 else "TBD",
@@ -9646,8 +9905,6 @@ async def admin_print_center(request: Request):
         tournament_repo = TournamentRepository(session)
         bracket_repo = BracketRepository(session)
         match_repo = MatchRepository(session)
-        player_repo = PlayerRepository(session)
-        pair_repo = PairRepository(session)
         team_repo = TeamRepository(session)
 
         tournament = tournament_repo.get_current()
@@ -9673,28 +9930,25 @@ async def admin_print_center(request: Request):
         # Get bracket matches by category, grouped by round
         # Include ALL categories with brackets (not just those with groups — KO Directo has no groups)
         categories_brackets = {}
-        bracket_categories = set()
-        all_bracket_slots = bracket_repo.get_all(tournament_id=tournament_id)
-        for slot in all_bracket_slots:
-            if slot.category:
-                bracket_categories.add(slot.category)
-
-        all_bracket_matches = []
-        for m in match_repo.get_all():
-            if m.group_id is None and m.category in bracket_categories and m.tournament_id == tournament_id:
-                all_bracket_matches.append(m)
-
-        # Round display names
-        round_names = {
-            "R128": "Ronda de 128",
-            "R64": "Ronda de 64",
-            "R32": "Ronda de 32",
-            "R16": "Octavos de Final",
-            "QF": "Cuartos de Final",
-            "SF": "Semifinal",
-            "F": "Final",
+        bracket_categories = bracket_repo.get_categories(tournament_id=tournament_id)
+
+        all_bracket_matches = [
+            m for m in match_repo.get_bracket_matches(tournament_id=tournament_id, eager=True)
+            if m.category in bracket_categories and m.tournament_id == tournament_id
+        ]
+
+        # Event type flags per category, resolved once instead of per match
+        category_flags = {
+            cat: (is_doubles_category(cat), is_teams_category(cat)) for cat in bracket_categories
         }
-        round_order = {"R128": 0, "R64": 1, "R32": 2, "R16": 3, "QF": 4, "SF": 5, "F": 6}
+
+        # Load teams once instead of one lookup per team match
+        teams_by_id = {}
+        if any(is_teams for _, is_teams in category_flags.values()):
+            teams_by_id = {t.id: t for t in team_repo.get_all(tournament_id=tournament_id)}
+
+        # Matches are appended in match_number order, so each round stays sorted
+        all_bracket_matches.sort(key=lambda m: m.match_number or 0)
 
         for match_orm in all_bracket_matches:
             # Use the match's stored category directly (already filtered)
@@ -9703,63 +9957,64 @@ async def admin_print_center(request: Request):
                 continue
 
             if category not in categories_brackets:
-                categories_brackets[category] = {"rounds": {}, "total_matches": 0}
+                # Pre-seed every known round in display order so no re-sort is needed later
+                categories_brackets[category] = {
+                    "rounds": {
+                        rt.value: {"name": rt.display_es, "order": rt.order, "matches": []}
+                        for rt in RoundType if rt is not RoundType.ROUND_ROBIN
+                    },
+                    "total_matches": 0,
+                }
 
             round_type = match_orm.round_type
             if round_type not in categories_brackets[category]["rounds"]:
                 categories_brackets[category]["rounds"][round_type] = {
-                    "name": round_names.get(round_type, round_type),
-                    "order": round_order.get(round_type, 99),
+                    "name": round_type,
+                    "order": 99,
                     "matches": [],
                 }
 
-            # Get competitor names (handle singles, doubles, and teams)
-            from ettem.models import is_doubles_category, is_teams_category
+            # Get competitor names (handle singles, doubles, and teams) from the
+            # eager-loaded relationships, without touching the database
             p1_name = "TBD"
             p2_name = "TBD"
-            is_ready = False  # Match is ready to play (both competitors known)
 
-            is_doubles = is_doubles_category(category)
-            is_teams = is_teams_category(category)
+            is_doubles, is_teams = category_flags[category]
             if is_teams and match_orm.team1_id:
-                team1 = team_repo.get_by_id(match_orm.team1_id)
+                team1 = teams_by_id.get(match_orm.team1_id)
                 if team1:
                     p1_name = team1.name
             elif is_doubles and match_orm.pair1_id:
-                pair1 = pair_repo.get_by_id(match_orm.pair1_id)
+                pair1 = match_orm.pair1
                 if pair1:
-                    pl1 = player_repo.get_by_id(pair1.player1_id)
-                    pl2 = player_repo.get_by_id(pair1.player2_id)
+                    pl1, pl2 = pair1.player1, pair1.player2
                     p1_name = f"{pl1.apellido}/{pl2.apellido}" if pl1 and pl2 else "Pareja"
             elif match_orm.player1_id:
-                p1 = player_repo.get_by_id(match_orm.player1_id)
+                p1 = match_orm.player1
                 if p1:
                     p1_name = f"{p1.nombre} {p1.apellido}"
 
             if is_teams and match_orm.team2_id:
-                team2 = team_repo.get_by_id(match_orm.team2_id)
+                team2 = teams_by_id.get(match_orm.team2_id)
                 if team2:
                     p2_name = team2.name
             elif is_doubles and match_orm.pair2_id:
-                pair2 = pair_repo.get_by_id(match_orm.pair2_id)
+                pair2 = match_orm.pair2
                 if pair2:
-                    pl1 = player_repo.get_by_id(pair2.player1_id)
-                    pl2 = player_repo.get_by_id(pair2.player2_id)
+                    pl1, pl2 = pair2.player1, pair2.player2
                     p2_name = f"{pl1.apellido}/{pl2.apellido}" if pl1 and pl2 else "Pareja"
             elif match_orm.player2_id:
-                p2 = player_repo.get_by_id(match_orm.player2_id)
+                p2 = match_orm.player2
                 if p2:
                     p2_name = f"{p2.nombre} {p2.apellido}"
 
+            # Match is ready to play (both competitors known)
             if is_teams:
-                if match_orm.team1_id and match_orm.team2_id:
-                    is_ready = True
+                is_ready = bool(match_orm.team1_id and match_orm.team2_id)
             elif is_doubles:
-                if match_orm.pair1_id and match_orm.pair2_id:
-                    is_ready = True
+                is_ready = bool(match_orm.pair1_id and match_orm.pair2_id)
             else:
-                if match_orm.player1_id and match_orm.player2_id:
-                    is_ready = True
+                is_ready = bool(match_orm.player1_id and match_orm.player2_id)
 
             categories_brackets[category]["rounds"][round_type]["matches"].append({
                 "id": match_orm.id,
@@ -9772,20 +10027,11 @@ async def admin_print_center(request: Request):
             })
             categories_brackets[category]["total_matches"] += 1
 
-        # Sort rounds within each category and matches within each round
-        for cat in categories_brackets:
-            # Sort rounds by order
-            sorted_rounds = dict(sorted(
-                categories_brackets[cat]["rounds"].items(),
-                key=lambda x: x[1]["order"]
-            ))
-            # Sort matches within each round by match_number
-            for round_type in sorted_rounds:
-                sorted_rounds[round_type]["matches"] = sorted(
-                    sorted_rounds[round_type]["matches"],
-                    key=lambda m: m["match_number"]
-                )
-            categories_brackets[cat]["rounds"] = sorted_rounds
+        # Drop the pre-seeded rounds that have no matches
+        for cat_data in categories_brackets.values():
+            cat_data["rounds"] = {
+                rt: round_data for rt, round_data in cat_data["rounds"].items() if round_data["matches"]
+            }
 
         context = {
             "request": request,
@@ -9802,6 +10048,36 @@ async def admin_print_center(request: Request):
 # ==============================================================================
 
 
+# Computed singles group sheets: group_id -> (change marker, (players, matches, results_matrix)).
+# Entries are validated against the group's change marker on every read, so a
+# stale entry is never served; the dict is emptied by the tournament routes that
+# change which tournament is current, which keeps it bounded by the groups of
+# the tournament being worked on.
+_group_sheet_cache: dict[int, tuple[tuple, tuple]] = {}
+
+
+def clear_group_sheet_cache() -> None:
+    """Forget every computed group sheet."""
+    _group_sheet_cache.clear()
+
+
+def _group_sheet_preview_context(request: Request, group, players, matches, results_matrix) -> dict:
+    """Template context for the group sheet preview."""
+    return {
+        "request": request,
+        "preview_title": f"Hoja de Grupo - Grupo {group.name}",
+        "back_url": "/admin/print-center",
+        "download_url": f"/print/group/{group.id}/sheet",
+        "tournament_name": get_tournament_name(),
+        "category": group.category,
+        "group": {"name": f"Grupo {group.name}"},
+        "players": players,
+        "matches": matches,
+        "results_matrix": results_matrix,
+        "branding": get_branding_data(),
+    }
+
+
 @app.get("/preview/group/{group_id}/sheet", response_class=HTMLResponse)
 async def preview_group_sheet(request: Request, group_id: int):
     """Preview group sheet before PDF download."""
@@ -9818,6 +10094,19 @@ async def preview_group_sheet(request: Request, group_id: int):
 
         event_type = detect_event_type(group.category)
 
+        # Singles sheets only depend on the group's matches and players, so
+        # reuse the last computed sheet while their change marker is the same
+        version = None
+        if event_type == "singles":
+            version = (group.name, group.category, group_repo.get_content_versions([group_id])[group_id])
+            cached = _group_sheet_cache.get(group_id)
+            if cached is not None and cached[0] == version:
+                players, matches, results_matrix = cached[1]
+                return render_template(
+                    "print/preview_group_sheet.html",
+                    _group_sheet_preview_context(request, group, players, matches, results_matrix),
+                )
+
         # Get entities in group (players, pairs, or teams depending on event type)
         if event_type == "teams":
             all_teams = team_repo.get_all()
@@ -9831,168 +10120,24 @@ async def preview_group_sheet(request: Request, group_id: int):
         players_orm = sorted(players_orm, key=lambda p: p.group_number or 999)
 
         # Get matches
-        matches_orm = match_repo.get_by_group(group_id)
-        matches_orm = sorted(matches_orm, key=lambda m: m.match_number or 999)
-
-        # Initialize player stats (keyed by entity ID: player/pair/team)
-        player_stats = {}
-        for p in players_orm:
-            player_stats[p.id] = {
-                "wins": 0,
-                "losses": 0,
-                "sets_won": 0,
-                "sets_lost": 0,
-                "points": 0,
-            }
+        matches_orm = match_repo.get_by_group(group_id, ordered=True)
 
-        # Build results matrix from actual match results
-        # Matrix format: results_matrix[entity1_id][entity2_id] = "3-1" (sets won)
-        results_matrix = {}
-        for p in players_orm:
-            results_matrix[p.id] = {}
-
-        # Build matches with results and calculate stats
-        from ettem.webapp.helpers import get_competitor_display
-        matches = []
-        for m in matches_orm:
-            cd1 = get_competitor_display(m, 1, player_repo, pair_repo=pair_repo, team_repo=team_repo)
-            cd2 = get_competitor_display(m, 2, player_repo, pair_repo=pair_repo, team_repo=team_repo)
+        # Every player referenced by the matches, loaded in one query
+        player_lookup = PlayerLookup(player_repo, player_repo.get_by_ids(
+            {pid for m in matches_orm for pid in (m.player1_id, m.player2_id) if pid}
+        ))
 
-            # Calculate result from sets
-            result = None
-            if m.sets and len(m.sets) > 0:
-                sets_p1 = sum(1 for s in m.sets if s.get('player1_points', 0) > s.get('player2_points', 0))
-                sets_p2 = sum(1 for s in m.sets if s.get('player2_points', 0) > s.get('player1_points', 0))
-                result = f"{sets_p1}-{sets_p2}"
-
-                # Fill results matrix (both directions)
-                if m.player1_id in results_matrix:
-                    results_matrix[m.player1_id][m.player2_id] = f"{sets_p1}-{sets_p2}"
-                if m.player2_id in results_matrix:
-                    results_matrix[m.player2_id][m.player1_id] = f"{sets_p2}-{sets_p1}"
-
-                # Update player stats
-                if m.player1_id in player_stats:
-                    player_stats[m.player1_id]["sets_won"] += sets_p1
-                    player_stats[m.player1_id]["sets_lost"] += sets_p2
-                if m.player2_id in player_stats:
-                    player_stats[m.player2_id]["sets_won"] += sets_p2
-                    player_stats[m.player2_id]["sets_lost"] += sets_p1
-
-                # Determine winner and update wins/losses/points
-                if m.winner_id:
-                    if m.winner_id in player_stats:
-                        player_stats[m.winner_id]["wins"] += 1
-                        player_stats[m.winner_id]["points"] += 2
-                    loser_id = m.player2_id if m.winner_id == m.player1_id else m.player1_id
-                    if loser_id in player_stats:
-                        player_stats[loser_id]["losses"] += 1
-                        # 1 point for playing (not walkover)
-                        if m.status != "WALKOVER":
-                            player_stats[loser_id]["points"] += 1
-
-            # Determine winner's group number
-            winner_group_number = None
-            if m.winner_id:
-                p1_orm = player_repo.get_by_id(m.player1_id)
-                p2_orm = player_repo.get_by_id(m.player2_id)
-                if m.winner_id == m.player1_id and p1_orm:
-                    winner_group_number = p1_orm.group_number
-                elif m.winner_id == m.player2_id and p2_orm:
-                    winner_group_number = p2_orm.group_number
-
-            matches.append({
-                "match_order": m.match_number,
-                "result": result,
-                "winner_group_number": winner_group_number,
-                "player1": {"nombre": cd1.nombre, "apellido": cd1.apellido},
-                "player2": {"nombre": cd2.nombre, "apellido": cd2.apellido},
-            })
-
-        # Build player dicts with stats
-        players = []
-        for p in players_orm:
-            stats = player_stats.get(p.id, {})
-            # Calculate ratios for tiebreaker
-            sets_won = stats.get("sets_won", 0)
-            sets_lost = stats.get("sets_lost", 0)
-            sets_ratio = sets_won / sets_lost if sets_lost > 0 else (float('inf') if sets_won > 0 else 0)
-
-            # Resolve display name (team/pair-aware)
-            if event_type == "teams" and team_repo:
-                team_orm = team_repo.get_by_id(p.id)
-                display_nombre = team_orm.name if team_orm else p.nombre
-                display_apellido = ""
-                display_pais = (team_orm.pais_cd if team_orm else p.pais_cd) or p.pais_cd
-            elif event_type == "doubles" and pair_repo:
-                pair_orm = pair_repo.get_by_id(p.id)
-                if pair_orm:
-                    p1_orm = player_repo.get_by_id(pair_orm.player1_id)
-                    p2_orm = player_repo.get_by_id(pair_orm.player2_id)
-                    cd = CompetitorDisplay.from_pair(pair_orm, p1_orm, p2_orm)
-                    display_nombre = cd.nombre
-                    display_apellido = cd.apellido
-                    display_pais = cd.pais_cd
-                else:
-                    display_nombre = p.nombre
-                    display_apellido = p.apellido
-                    display_pais = p.pais_cd
-            else:
-                display_nombre = p.nombre
-                display_apellido = p.apellido
-                display_pais = p.pais_cd
-
-            players.append({
-                "player": {
-                    "id": p.id,
-                    "nombre": display_nombre,
-                    "apellido": display_apellido,
-                    "pais_cd": display_pais,
-                    "group_number": p.group_number,
-                },
-                "stats": {
-                    "points": stats.get("points", 0),
-                    "wins": stats.get("wins", 0),
-                    "losses": stats.get("losses", 0),
-                    "sets_won": sets_won,
-                    "sets_lost": sets_lost,
-                    "sets_ratio": sets_ratio,
-                    "position": None,  # Will be calculated below
-                }
-            })
-
-        # Calculate positions based on points and tiebreakers
-        # Only for players who have played at least one match
-        players_with_matches = [p for p in players if p["stats"]["wins"] + p["stats"]["losses"] > 0]
-        if players_with_matches:
-            # Sort by: points (desc), sets_ratio (desc), group_number (asc as tiebreaker)
-            sorted_players = sorted(
-                players_with_matches,
-                key=lambda x: (-x["stats"]["points"], -x["stats"]["sets_ratio"], x["player"]["group_number"])
-            )
-            # Assign positions
-            for pos, p in enumerate(sorted_players, 1):
-                # Find this player in the original list and update position
-                for orig_p in players:
-                    if orig_p["player"]["id"] == p["player"]["id"]:
-                        orig_p["stats"]["position"] = pos
-                        break
+        players, matches, results_matrix = _build_group_sheet(
+            event_type, players_orm, matches_orm, player_lookup, pair_repo, team_repo
+        )
 
-        context = {
-            "request": request,
-            "preview_title": f"Hoja de Grupo - Grupo {group.name}",
-            "back_url": "/admin/print-center",
-            "download_url": f"/print/group/{group_id}/sheet",
-            "tournament_name": get_tournament_name(),
-            "category": group.category,
-            "group": {"name": f"Grupo {group.name}"},
-            "players": players,
-            "matches": matches,
-            "results_matrix": results_matrix,
-            "branding": get_branding_data(),
-        }
+        if version is not None:
+            _group_sheet_cache[group_id] = (version, (players, matches, results_matrix))
 
-        return render_template("print/preview_group_sheet.html", context)
+        return render_template(
+            "print/preview_group_sheet.html",
+            _group_sheet_preview_context(request, group, players, matches, results_matrix),
+        )
 
 
 @app.get("/preview/category/{category}/all-group-sheets", response_class=HTMLResponse)
@@ -10021,152 +10166,39 @@ async def preview_all_group_sheets(request: Request, category: str):
         if not groups_in_category:
             return Response(content="No hay grupos en esta categoría", status_code=404)
 
+        # Get entities (players, pairs, or teams depending on event type) once
+        # for the whole category and bucket them by group
+        from collections import defaultdict
+        if event_type == "teams":
+            all_entities = team_repo.get_all()
+        elif event_type == "doubles":
+            all_entities = pair_repo.get_all()
+        else:
+            all_entities = player_repo.get_all()
+        entities_by_group = defaultdict(list)
+        for entity in all_entities:
+            entities_by_group[getattr(entity, 'group_id', None)].append(entity)
+
+        # Matches, their players and their schedule slots for every group,
+        # one query each
+        matches_by_group = match_repo.get_by_groups(g.id for g in groups_in_category)
+        category_matches = [m for matches in matches_by_group.values() for m in matches]
+        player_lookup = PlayerLookup(player_repo, player_repo.get_by_ids(
+            {pid for m in category_matches for pid in (m.player1_id, m.player2_id) if pid}
+        ))
+        slots_by_match = schedule_repo.get_by_matches(m.id for m in category_matches)
+
         groups_data = []
         for group in groups_in_category:
-            # Get entities in group (players, pairs, or teams depending on event type)
-            if event_type == "teams":
-                all_teams = team_repo.get_all()
-                players_orm = [t for t in all_teams if t.group_id == group.id]
-            elif event_type == "doubles":
-                all_pairs = pair_repo.get_all()
-                players_orm = [p for p in all_pairs if getattr(p, 'group_id', None) == group.id]
-            else:
-                all_players = player_repo.get_all()
-                players_orm = [p for p in all_players if p.group_id == group.id]
-            players_orm = sorted(players_orm, key=lambda p: p.group_number or 999)
+            players_orm = sorted(entities_by_group.get(group.id, []), key=lambda p: p.group_number or 999)
 
             # Get matches
-            matches_orm = match_repo.get_by_group(group.id)
-            matches_orm = sorted(matches_orm, key=lambda m: m.match_number or 999)
-
-            # Initialize player stats
-            player_stats = {}
-            for p in players_orm:
-                player_stats[p.id] = {
-                    "wins": 0,
-                    "losses": 0,
-                    "sets_won": 0,
-                    "sets_lost": 0,
-                    "points": 0,
-                }
-
-            # Build results matrix
-            results_matrix = {}
-            for p in players_orm:
-                results_matrix[p.id] = {}
-
-            # Build matches with results and calculate stats
-            from ettem.webapp.helpers import get_competitor_display
-            matches = []
-            for m in matches_orm:
-                cd1 = get_competitor_display(m, 1, player_repo, pair_repo=pair_repo, team_repo=team_repo)
-                cd2 = get_competitor_display(m, 2, player_repo, pair_repo=pair_repo, team_repo=team_repo)
-
-                result = None
-                if m.sets and len(m.sets) > 0:
-                    sets_p1 = sum(1 for s in m.sets if s.get('player1_points', 0) > s.get('player2_points', 0))
-                    sets_p2 = sum(1 for s in m.sets if s.get('player2_points', 0) > s.get('player1_points', 0))
-                    result = f"{sets_p1}-{sets_p2}"
-
-                    if m.player1_id in results_matrix:
-                        results_matrix[m.player1_id][m.player2_id] = f"{sets_p1}-{sets_p2}"
-                    if m.player2_id in results_matrix:
-                        results_matrix[m.player2_id][m.player1_id] = f"{sets_p2}-{sets_p1}"
-
-                    if m.player1_id in player_stats:
-                        player_stats[m.player1_id]["sets_won"] += sets_p1
-                        player_stats[m.player1_id]["sets_lost"] += sets_p2
-                    if m.player2_id in player_stats:
-                        player_stats[m.player2_id]["sets_won"] += sets_p2
-                        player_stats[m.player2_id]["sets_lost"] += sets_p1
-
-                    if m.winner_id:
-                        if m.winner_id in player_stats:
-                            player_stats[m.winner_id]["wins"] += 1
-                            player_stats[m.winner_id]["points"] += 2
-                        loser_id = m.player2_id if m.winner_id == m.player1_id else m.player1_id
-                        if loser_id in player_stats:
-                            player_stats[loser_id]["losses"] += 1
-                            if m.status != "WALKOVER":
-                                player_stats[loser_id]["points"] += 1
-
-                # Get schedule info for this match
-                schedule_slot = schedule_repo.get_by_match(m.id)
-                table_number = schedule_slot.table_number if schedule_slot else None
-                scheduled_time = schedule_slot.start_time if schedule_slot else None
-
-                matches.append({
-                    "match_order": m.match_number,
-                    "result": result,
-                    "player1": {"nombre": cd1.nombre, "apellido": cd1.apellido},
-                    "player2": {"nombre": cd2.nombre, "apellido": cd2.apellido},
-                    "table_number": table_number,
-                    "scheduled_time": scheduled_time,
-                })
-
-            # Build player dicts with stats
-            players = []
-            for p in players_orm:
-                stats = player_stats.get(p.id, {})
-                sets_won = stats.get("sets_won", 0)
-                sets_lost = stats.get("sets_lost", 0)
-                sets_ratio = sets_won / sets_lost if sets_lost > 0 else (float('inf') if sets_won > 0 else 0)
-
-                # Resolve display name (team/pair-aware)
-                if event_type == "teams" and team_repo:
-                    team_orm = team_repo.get_by_id(p.id)
-                    display_nombre = team_orm.name if team_orm else p.nombre
-                    display_apellido = ""
-                    display_pais = (team_orm.pais_cd if team_orm else p.pais_cd) or p.pais_cd
-                elif event_type == "doubles" and pair_repo:
-                    pair_orm = pair_repo.get_by_id(p.id)
-                    if pair_orm:
-                        p1_d = player_repo.get_by_id(pair_orm.player1_id)
-                        p2_d = player_repo.get_by_id(pair_orm.player2_id)
-                        cd = CompetitorDisplay.from_pair(pair_orm, p1_d, p2_d)
-                        display_nombre = cd.nombre
-                        display_apellido = cd.apellido
-                        display_pais = cd.pais_cd
-                    else:
-                        display_nombre = p.nombre
-                        display_apellido = p.apellido
-                        display_pais = p.pais_cd
-                else:
-                    display_nombre = p.nombre
-                    display_apellido = p.apellido
-                    display_pais = p.pais_cd
-
-                players.append({
-                    "player": {
-                        "id": p.id,
-                        "nombre": display_nombre,
-                        "apellido": display_apellido,
-                        "pais_cd": display_pais,
-                        "group_number": p.group_number,
-                    },
-                    "stats": {
-                        "points": stats.get("points", 0),
-                        "wins": stats.get("wins", 0),
-                        "losses": stats.get("losses", 0),
-                        "sets_won": sets_won,
-                        "sets_lost": sets_lost,
-                        "sets_ratio": sets_ratio,
-                        "position": None,
-                    }
-                })
+            matches_orm = matches_by_group.get(group.id, [])
 
-            # Calculate positions
-            players_with_matches = [p for p in players if p["stats"]["wins"] + p["stats"]["losses"] > 0]
-            if players_with_matches:
-                sorted_players = sorted(
-                    players_with_matches,
-                    key=lambda x: (-x["stats"]["points"], -x["stats"]["sets_ratio"], x["player"]["group_number"])
-                )
-                for pos, p in enumerate(sorted_players, 1):
-                    for orig_p in players:
-                        if orig_p["player"]["id"] == p["player"]["id"]:
-                            orig_p["stats"]["position"] = pos
-                            break
+            players, matches, results_matrix = _build_group_sheet(
+                event_type, players_orm, matches_orm, player_lookup, pair_repo, team_repo,
+                slots_by_match=slots_by_match,
+            )
 
             groups_data.append({
                 "group": {"name": f"Grupo {group.name}"},
@@ -10209,26 +10241,31 @@ async def preview_group_matches(request: Request, group_id: int):
         _is_doubles = is_doubles_category(group.category)
 
         # Get matches
-        matches_orm = match_repo.get_by_group(group_id)
-        matches_orm = sorted(matches_orm, key=lambda m: m.match_number or 999)
+        matches_orm = match_repo.get_by_group(group_id, ordered=True)
+
+        # Every player and schedule slot referenced by the matches, one query each
+        player_lookup = PlayerLookup(player_repo, player_repo.get_by_ids(
+            {pid for m in matches_orm for pid in (m.player1_id, m.player2_id) if pid}
+        ))
+        slots_by_match = schedule_repo.get_by_matches(m.id for m in matches_orm)
 
         # Build matches with player info
         matches = []
         for m in matches_orm:
-            p1 = get_competitor_display(m, 1, player_repo, pair_repo, team_repo)
-            p2 = get_competitor_display(m, 2, player_repo, pair_repo, team_repo)
+            p1 = get_competitor_display(m, 1, player_lookup, pair_repo, team_repo)
+            p2 = get_competitor_display(m, 2, player_lookup, pair_repo, team_repo)
 
             # Get schedule info
-            schedule_slot = schedule_repo.get_by_match(m.id)
+            schedule_slot = slots_by_match.get(m.id)
             table_number = schedule_slot.table_number if schedule_slot else None
             scheduled_time = schedule_slot.start_time if schedule_slot else None
 
             # Calculate result from sets
             result = None
-            if m.sets and len(m.sets) > 0:
-                sets_p1 = sum(1 for s in m.sets if s.get('player1_points', 0) > s.get('player2_points', 0))
-                sets_p2 = sum(1 for s in m.sets if s.get('player2_points', 0) > s.get('player1_points', 0))
-                result = f"{sets_p1} - {sets_p2}"
+            match_sets = m.sets
+            if match_sets:
+                sets_p1, sets_p2 = count_sets_won(match_sets)
+                result = set_score_label(sets_p1, sets_p2, spaced=True)
 
             matches.append({
                 "match_order": m.match_number,
@@ -10284,8 +10321,13 @@ async def preview_all_group_match_sheets(request: Request, group_id: int):
         _is_doubles = is_doubles_category(group.category)
 
         # Get matches
-        matches_orm = match_repo.get_by_group(group_id)
-        matches_orm = sorted(matches_orm, key=lambda m: m.match_number or 999)
+        matches_orm = match_repo.get_by_group(group_id, ordered=True)
+
+        # Every player and schedule slot referenced by the matches, one query each
+        player_lookup = PlayerLookup(player_repo, player_repo.get_by_ids(
+            {pid for m in matches_orm for pid in (m.player1_id, m.player2_id) if pid}
+        ))
+        slots_by_match = schedule_repo.get_by_matches(m.id for m in matches_orm)
 
         # Get number of players in group to calculate rounds
         all_players = player_repo.get_all()
@@ -10296,11 +10338,11 @@ async def preview_all_group_match_sheets(request: Request, group_id: int):
         # Build matches data
         matches_data = []
         for idx, m in enumerate(matches_orm):
-            p1 = get_competitor_display(m, 1, player_repo, pair_repo, team_repo)
-            p2 = get_competitor_display(m, 2, player_repo, pair_repo, team_repo)
+            p1 = get_competitor_display(m, 1, player_lookup, pair_repo, team_repo)
+            p2 = get_competitor_display(m, 2, player_lookup, pair_repo, team_repo)
 
             # Get schedule info
-            schedule_slot = schedule_repo.get_by_match(m.id)
+            schedule_slot = slots_by_match.get(m.id)
             table_number = schedule_slot.table_number if schedule_slot else None
             scheduled_time = schedule_slot.start_time if schedule_slot else None
 
@@ -10330,10 +10372,7 @@ async def preview_all_group_match_sheets(request: Request, group_id: int):
             })
 
         # Group matches in pairs (2 per page)
-        matches_pairs = []
-        for i in range(0, len(matches_data), 2):
-            pair = matches_data[i:i+2]
-            matches_pairs.append(pair)
+        matches_pairs = _pair_up(matches_data)
 
         context = {
             "request": request,
@@ -10368,26 +10407,34 @@ async def preview_all_category_match_sheets(request: Request, category: str):
         if not groups:
             return Response(content="No hay grupos en esta categoría", status_code=404)
 
-        # Get all players once
+        # Get all players once, indexed by ID for the per-match lookups and
+        # counted per group for the round numbers
+        from collections import Counter
         all_players = player_repo.get_all()
+        players_by_id = {p.id: p for p in all_players}
+        group_sizes = Counter(p.group_id for p in all_players)
+
+        # Matches and schedule slots for every group, one query each
+        matches_by_group = match_repo.get_by_groups(g.id for g in groups)
+        slots_by_match = schedule_repo.get_by_matches(
+            m.id for matches in matches_by_group.values() for m in matches
+        )
 
         # Build all matches data
         matches_data = []
         for group in sorted(groups, key=lambda g: int(g.name) if g.name.isdigit() else g.name):
-            matches_orm = match_repo.get_by_group(group.id)
-            matches_orm = sorted(matches_orm, key=lambda m: m.match_number or 999)
+            matches_orm = matches_by_group.get(group.id, [])
 
             # Get number of players in this group to calculate rounds
-            players_in_group = [p for p in all_players if p.group_id == group.id]
-            num_players = len(players_in_group)
+            num_players = group_sizes[group.id]
             matches_per_round = max(1, num_players // 2)
 
             for idx, m in enumerate(matches_orm):
-                p1 = player_repo.get_by_id(m.player1_id)
-                p2 = player_repo.get_by_id(m.player2_id)
+                p1 = players_by_id.get(m.player1_id)
+                p2 = players_by_id.get(m.player2_id)
 
                 # Get schedule info
-                schedule_slot = schedule_repo.get_by_match(m.id)
+                schedule_slot = slots_by_match.get(m.id)
                 table_number = schedule_slot.table_number if schedule_slot else None
                 scheduled_time = schedule_slot.start_time if schedule_slot else None
 
@@ -10420,10 +10467,7 @@ async def preview_all_category_match_sheets(request: Request, category: str):
             return Response(content="No hay partidos en esta categoría", status_code=404)
 
         # Group matches in pairs (2 per page)
-        matches_pairs = []
-        for i in range(0, len(matches_data), 2):
-            pair = matches_data[i:i+2]
-            matches_pairs.append(pair)
+        matches_pairs = _pair_up(matches_data)
 
         context = {
             "request": request,
@@ -10436,7 +10480,9 @@ async def preview_all_category_match_sheets(request: Request, category: str):
             "branding": get_branding_data(),
         }
 
-        return render_template("print/preview_match_sheets.html", context)
+        # One sheet pair per page for the whole category: stream the HTML so
+        # the browser can start rendering before the last page is generated
+        return stream_template("print/preview_match_sheets.html", context)
 
 
 # ==============================================================================
@@ -10444,8 +10490,239 @@ async def preview_all_category_match_sheets(request: Request, category: str):
 # ==============================================================================
 
 
+def _wants_json(request: Request) -> bool:
+    """True when the client asked for JSON rather than the HTML page."""
+    return "application/json" in request.headers.get("accept", "")
+
+
+def _is_singles_match(match_orm) -> bool:
+    return (match_orm.event_type or "singles") == "singles"
+
+
+def _singles_player_ids(matches) -> set[int]:
+    """Player IDs referenced by the singles matches in ``matches``."""
+    return {
+        pid
+        for m in matches if _is_singles_match(m)
+        for pid in (m.player1_id, m.player2_id) if pid
+    }
+
+
+def _bracket_match_category(match_orm, names, pair_repo) -> Optional[str]:
+    """Category of a bracket match: its own column, else its first pair/player.
+
+    ``names`` maps player IDs to PlayerRepository.get_names_by_ids rows.
+    """
+    if match_orm.category:
+        return match_orm.category
+    if match_orm.pair1_id:
+        pair = pair_repo.get_by_id(match_orm.pair1_id)
+        if pair:
+            return pair.categoria
+    row = names.get(match_orm.player1_id)
+    return row.categoria if row else None
+
+
+def _bracket_sheet_side(match_orm, side: int, names, is_doubles: bool,
+                        player_repo, pair_repo, team_repo) -> Optional[MatchSheetSide]:
+    """Name/country fields of one side of a bracket match sheet.
+
+    Singles sides are read straight from the ``names`` rows; doubles and
+    teams go through get_competitor_display. Returns None when the side is
+    not defined yet.
+    """
+    if _is_singles_match(match_orm):
+        row = names.get(match_orm.player1_id if side == 1 else match_orm.player2_id)
+        if row is None:
+            return None
+        if is_doubles:
+            return MatchSheetSide(f"{row.nombre} {row.apellido}", "", row.pais_cd)
+        return MatchSheetSide(row.nombre, row.apellido, row.pais_cd)
+
+    competitor = get_competitor_display(match_orm, side, player_repo, pair_repo, team_repo)
+    if competitor.id == 0:
+        return None
+    if is_doubles:
+        return MatchSheetSide(competitor.full_name, "", competitor.pais_cd)
+    return MatchSheetSide(competitor.nombre, competitor.apellido, competitor.pais_cd)
+
+
+def _bracket_match_sheet_data(match_orm, player1: MatchSheetSide, player2: MatchSheetSide,
+                              table_number=None, scheduled_time=None) -> MatchSheet:
+    """Match sheet entry (preview template and PDF) for one bracket match."""
+    return MatchSheet(
+        match=MatchSheetRef(match_orm.id, match_orm.match_number or 1, match_orm.round_type),
+        player1=player1,
+        player2=player2,
+        group_name=_ROUND_DISPLAY_NAMES.get(match_orm.round_type, match_orm.round_type),
+        round_number=1,
+        table_number=table_number,
+        scheduled_time=scheduled_time,
+    )
+
+
+def _iter_bracket_matches_data(category, match_repo, player_repo, pair_repo, team_repo) -> Iterator[MatchSheet]:
+    """Match sheet entries for a category's bracket, in round order.
+
+    Only matches with both competitors defined are included. Entries are
+    built as they are consumed, so the session must stay open meanwhile.
+    """
+    is_doubles = is_doubles_category(category)
+    bracket_matches = match_repo.get_bracket_matches_by_category(category, by_round=True)
+    names = player_repo.get_names_by_ids(_singles_player_ids(bracket_matches))
+    players = PlayerLookup(player_repo)
+
+    for match_orm in bracket_matches:
+        side1 = _bracket_sheet_side(match_orm, 1, names, is_doubles, players, pair_repo, team_repo)
+        side2 = _bracket_sheet_side(match_orm, 2, names, is_doubles, players, pair_repo, team_repo)
+        if side1 is not None and side2 is not None:
+            yield _bracket_match_sheet_data(match_orm, side1, side2)
+
+
+# Match-sheet PDFs up to this size stay in memory; larger ones spill to a
+# temp file instead of being held as one bytes object
+_PDF_SPOOL_MAX_BYTES = 1024 * 1024
+_PDF_CHUNK_BYTES = 64 * 1024
+
+
+def _iter_spooled_file(spool):
+    """Yield an open file in chunks, closing it (deleting a spool) at the end."""
+    try:
+        while chunk := spool.read(_PDF_CHUNK_BYTES):
+            yield chunk
+    finally:
+        spool.close()
+
+
+# Rendered match-sheet PDFs: cache key -> (digest of the rendering inputs, file).
+# The lock serializes lookups, renders and file swaps between threadpool
+# requests; replaced files are only deleted on a later miss (see below).
+_match_sheets_pdf_cache: dict[str, tuple[str, Path]] = {}
+_match_sheets_pdf_dir: Optional[Path] = None
+_match_sheets_pdf_superseded: list[Path] = []
+_match_sheets_pdf_lock = threading.Lock()
+
+
+def _open_cached_match_sheets_pdf(cache_key, digest, matches_data, tournament_name,
+                                  category, is_doubles, branding):
+    """Open the PDF rendered from these inputs, rendering it on a miss.
+
+    The file is reused for as long as the digest of the inputs (sheet
+    entries, tournament name, branding) stays the same, so printing an
+    unchanged bracket again skips xhtml2pdf entirely. The file is opened
+    while the cache lock is held, so a concurrent miss can never delete it
+    out from under the response that streams it.
+    """
+    global _match_sheets_pdf_dir
+
+    with _match_sheets_pdf_lock:
+        cached = _match_sheets_pdf_cache.get(cache_key)
+        if cached is not None and cached[0] == digest and cached[1].exists():
+            return open(cached[1], "rb")
+
+        # Drop files replaced on earlier misses; one that is still being
+        # streamed (Windows refuses to delete open files) is retried next time
+        for old_path in list(_match_sheets_pdf_superseded):
+            try:
+                old_path.unlink(missing_ok=True)
+                _match_sheets_pdf_superseded.remove(old_path)
+            except OSError:
+                pass
+
+        if _match_sheets_pdf_dir is None:
+            _match_sheets_pdf_dir = Path(tempfile.mkdtemp(prefix="ettem-pdf-"))
+        path = _match_sheets_pdf_dir / f"{digest}.pdf"
+        with tempfile.NamedTemporaryFile(dir=_match_sheets_pdf_dir, suffix=".part", delete=False) as part:
+            try:
+                pdf_generator.write_all_match_sheets_pdf(
+                    part,
+                    matches_data=matches_data,
+                    tournament_name=tournament_name,
+                    category=category,
+                    is_doubles=is_doubles,
+                    branding=branding,
+                )
+            except Exception:
+                part.close()
+                Path(part.name).unlink(missing_ok=True)
+                raise
+        os.replace(part.name, path)
+
+        if cached is not None and cached[1] != path:
+            _match_sheets_pdf_superseded.append(cached[1])
+        _match_sheets_pdf_cache[cache_key] = (digest, path)
+        return open(path, "rb")
+
+
+def _remove_match_sheets_pdf_dir() -> None:
+    """Delete the rendered match-sheet PDFs when the app shuts down."""
+    with _match_sheets_pdf_lock:
+        if _match_sheets_pdf_dir is not None:
+            shutil.rmtree(_match_sheets_pdf_dir, ignore_errors=True)
+        _match_sheets_pdf_cache.clear()
+        _match_sheets_pdf_superseded.clear()
+
+
+app.router.on_shutdown.append(_remove_match_sheets_pdf_dir)
+
+
+def _match_sheets_pdf_response(matches_data, category, is_doubles, filename, cache_key=None) -> Response:
+    """Render match sheets to a streamed PDF download (500 with the error on failure).
+
+    With a ``cache_key``, the rendered file is kept and served again while
+    its inputs are unchanged (see _open_cached_match_sheets_pdf).
+    """
+    tournament_name = get_tournament_name()
+    branding = get_branding_data()
+
+    if cache_key is not None:
+        digest = hashlib.sha256(json.dumps(
+            [matches_data, tournament_name, category, is_doubles, branding],
+            sort_keys=True, default=str,
+        ).encode()).hexdigest()
+        try:
+            pdf_file = _open_cached_match_sheets_pdf(
+                cache_key, digest, matches_data, tournament_name, category, is_doubles, branding
+            )
+        except Exception as e:
+            return Response(content=f"Error generando PDF: {str(e)}", status_code=500)
+        return StreamingResponse(
+            _iter_spooled_file(pdf_file),
+            media_type="application/pdf",
+            headers={
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                "Content-Length": str(os.fstat(pdf_file.fileno()).st_size),
+            },
+        )
+
+    spool = tempfile.SpooledTemporaryFile(max_size=_PDF_SPOOL_MAX_BYTES)
+    try:
+        pdf_generator.write_all_match_sheets_pdf(
+            spool,
+            matches_data=matches_data,
+            tournament_name=tournament_name,
+            category=category,
+            is_doubles=is_doubles,
+            branding=branding,
+        )
+    except Exception as e:
+        spool.close()
+        return Response(content=f"Error generando PDF: {str(e)}", status_code=500)
+
+    size = spool.tell()
+    spool.seek(0)
+    return StreamingResponse(
+        _iter_spooled_file(spool),
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(size),
+        },
+    )
+
+
 @app.get("/preview/bracket/match/{match_id}", response_class=HTMLResponse)
-async def preview_bracket_match_sheet(request: Request, match_id: int):
+def preview_bracket_match_sheet(request: Request, match_id: int):
     """Preview a single bracket match sheet."""
     with get_db_session() as session:
         match_repo = MatchRepository(session)
@@ -10457,63 +10734,23 @@ async def preview_bracket_match_sheet(request: Request, match_id: int):
         if not match_orm:
             return Response(content="Partido no encontrado", status_code=404)
 
-        from ettem.webapp.helpers import get_competitor_display
-        from ettem.models import is_doubles_category
-
-        # Determine category
-        category = match_orm.category or "?"
-        if category == "?" and match_orm.pair1_id:
-            pair = pair_repo.get_by_id(match_orm.pair1_id)
-            if pair:
-                category = pair.categoria
-        if category == "?" and match_orm.player1_id:
-            player = player_repo.get_by_id(match_orm.player1_id)
-            if player:
-                category = player.categoria
-
+        names = player_repo.get_names_by_ids(_singles_player_ids([match_orm]))
+        category = _bracket_match_category(match_orm, names, pair_repo) or "?"
         _is_doubles = is_doubles_category(category)
-        p1 = get_competitor_display(match_orm, 1, player_repo, pair_repo, team_repo)
-        p2 = get_competitor_display(match_orm, 2, player_repo, pair_repo, team_repo)
-
-        # Round type display names
-        round_names = {
-            "R32": "Ronda de 32",
-            "R16": "Octavos de Final",
-            "QF": "Cuartos de Final",
-            "SF": "Semifinal",
-            "F": "Final",
-        }
-
-        match_data = {
-            "match": {
-                "id": match_orm.id,
-                "match_order": match_orm.match_number or 1,
-                "round_type": match_orm.round_type,
-            },
-            "player1": {
-                "nombre": p1.full_name if _is_doubles else p1.nombre,
-                "apellido": "" if _is_doubles else p1.apellido,
-                "pais_cd": p1.pais_cd,
-            },
-            "player2": {
-                "nombre": p2.full_name if _is_doubles else p2.nombre,
-                "apellido": "" if _is_doubles else p2.apellido,
-                "pais_cd": p2.pais_cd,
-            },
-            "group_name": round_names.get(match_orm.round_type, match_orm.round_type),
-            "round_number": 1,
-        }
-
-        matches_pairs = [[match_data]]
+        side1 = _bracket_sheet_side(match_orm, 1, names, _is_doubles, player_repo, pair_repo, team_repo)
+        side2 = _bracket_sheet_side(match_orm, 2, names, _is_doubles, player_repo, pair_repo, team_repo)
+        match_data = _bracket_match_sheet_data(
+            match_orm, side1 or TBD_SHEET_SIDE, side2 or TBD_SHEET_SIDE
+        )
 
         context = {
             "request": request,
-            "preview_title": f"Hoja de Partido - {round_names.get(match_orm.round_type, match_orm.round_type)}",
+            "preview_title": f"Hoja de Partido - {match_data.group_name}",
             "back_url": "/admin/print-center",
             "download_url": f"/print/bracket/match/{match_id}",
             "tournament_name": get_tournament_name(),
             "category": category,
-            "matches_pairs": matches_pairs,
+            "matches_pairs": [[match_data]],
             "is_doubles": _is_doubles,
             "branding": get_branding_data(),
         }
@@ -10522,75 +10759,28 @@ async def preview_bracket_match_sheet(request: Request, match_id: int):
 
 
 @app.get("/preview/bracket/{category}/all-match-sheets", response_class=HTMLResponse)
-async def preview_bracket_all_match_sheets(request: Request, category: str):
+def preview_bracket_all_match_sheets(request: Request, category: str):
     """Preview all bracket match sheets for a category."""
     with get_db_session() as session:
-        match_repo = MatchRepository(session)
-        player_repo = PlayerRepository(session)
-        pair_repo = PairRepository(session)
-        team_repo = TeamRepository(session)
-
-        from ettem.webapp.helpers import get_competitor_display
-        from ettem.models import is_doubles_category
-
-        _is_doubles = is_doubles_category(category)
-
-        # Get all bracket matches for this category
-        all_matches = [m for m in match_repo.get_all()
-                       if m.group_id is None and m.category == category]
-
-        # Round type display names
-        round_names = {
-            "R32": "Ronda de 32",
-            "R16": "Octavos de Final",
-            "QF": "Cuartos de Final",
-            "SF": "Semifinal",
-            "F": "Final",
-        }
-        round_order = {"R32": 0, "R16": 1, "QF": 2, "SF": 3, "F": 4}
-
-        matches_data = []
-        for match_orm in all_matches:
-            p1 = get_competitor_display(match_orm, 1, player_repo, pair_repo, team_repo)
-            p2 = get_competitor_display(match_orm, 2, player_repo, pair_repo, team_repo)
+        entries = _iter_bracket_matches_data(
+            category,
+            MatchRepository(session),
+            PlayerRepository(session),
+            PairRepository(session),
+            TeamRepository(session),
+        )
 
-            # Only include matches with both competitors defined
-            if p1.id == 0 or p2.id == 0:
-                continue
+        # JSON clients (e.g. enabling the print button) only need the count
+        if _wants_json(request):
+            return JSONResponse({"total_matches": sum(1 for _ in entries)})
 
-            matches_data.append({
-                "match": {
-                    "id": match_orm.id,
-                    "match_order": match_orm.match_number or 1,
-                    "round_type": match_orm.round_type,
-                },
-                "player1": {
-                    "nombre": p1.full_name if _is_doubles else p1.nombre,
-                    "apellido": "" if _is_doubles else p1.apellido,
-                    "pais_cd": p1.pais_cd,
-                },
-                "player2": {
-                    "nombre": p2.full_name if _is_doubles else p2.nombre,
-                    "apellido": "" if _is_doubles else p2.apellido,
-                    "pais_cd": p2.pais_cd,
-                },
-                "group_name": round_names.get(match_orm.round_type, match_orm.round_type),
-                "round_number": 1,
-                "sort_key": round_order.get(match_orm.round_type, 99),
-            })
-
-        if not matches_data:
+        # Pages are built straight from the query rows while the template
+        # renders; only the first one is pulled early to detect an empty bracket
+        pages = _pair_up(entries)
+        first_page = next(pages, None)
+        if first_page is None:
             return Response(content="No hay partidos definidos en el bracket", status_code=404)
 
-        # Sort by round
-        matches_data = sorted(matches_data, key=lambda m: (m["sort_key"], m["match"]["id"]))
-
-        # Group matches in pairs (2 per page)
-        matches_pairs = []
-        for i in range(0, len(matches_data), 2):
-            pair = matches_data[i:i+2]
-            matches_pairs.append(pair)
-
         context = {
             "request": request,
             "preview_title": f"Hojas de Partido - Bracket {category}",
@@ -10598,8 +10788,8 @@ async def preview_bracket_all_match_sheets(request: Request, category: str):
             "download_url": f"/print/bracket/{category}/all-match-sheets",
             "tournament_name": get_tournament_name(),
             "category": category,
-            "matches_pairs": matches_pairs,
-            "is_doubles": _is_doubles,
+            "matches_pairs": itertools.chain([first_page], pages),
+            "is_doubles": is_doubles_category(category),
             "branding": get_branding_data(),
         }
 
@@ -10607,7 +10797,7 @@ async def preview_bracket_all_match_sheets(request: Request, category: str):
 
 
 @app.get("/print/bracket/match/{match_id}")
-async def print_bracket_match_sheet(match_id: int):
+def print_bracket_match_sheet(match_id: int):
     """Download PDF for a single bracket match sheet."""
     with get_db_session() as session:
         match_repo = MatchRepository(session)
@@ -10619,77 +10809,22 @@ async def print_bracket_match_sheet(match_id: int):
         if not match_orm:
             return Response(content="Partido no encontrado", status_code=404)
 
-        from ettem.webapp.helpers import get_competitor_display
-        p1 = get_competitor_display(match_orm, 1, player_repo, pair_repo, team_repo)
-        p2 = get_competitor_display(match_orm, 2, player_repo, pair_repo, team_repo)
-
-        # Determine category from pair or player
-        from ettem.models import is_doubles_category
-        category = "Bracket"
-        if match_orm.pair1_id:
-            pair = pair_repo.get_by_id(match_orm.pair1_id)
-            if pair:
-                category = pair.categoria
-        elif match_orm.player1_id:
-            player = player_repo.get_by_id(match_orm.player1_id)
-            if player:
-                category = player.categoria
-
+        names = player_repo.get_names_by_ids(_singles_player_ids([match_orm]))
+        category = _bracket_match_category(match_orm, names, pair_repo) or "Bracket"
         _is_doubles = is_doubles_category(category)
-
-        round_names = {
-            "R32": "Ronda de 32",
-            "R16": "Octavos de Final",
-            "QF": "Cuartos de Final",
-            "SF": "Semifinal",
-            "F": "Final",
-        }
-
-        match_data = {
-            "match": {
-                "id": match_orm.id,
-                "match_order": match_orm.match_number or 1,
-                "round_type": match_orm.round_type,
-            },
-            "player1": {
-                "nombre": (p1.full_name if _is_doubles else p1.nombre) if p1 else "TBD",
-                "apellido": ("" if _is_doubles else p1.apellido) if p1 else "",
-                "pais_cd": p1.pais_cd if p1 else "?",
-            },
-            "player2": {
-                "nombre": (p2.full_name if _is_doubles else p2.nombre) if p2 else "TBD",
-                "apellido": ("" if _is_doubles else p2.apellido) if p2 else "",
-                "pais_cd": p2.pais_cd if p2 else "?",
-            },
-            "group_name": round_names.get(match_orm.round_type, match_orm.round_type),
-            "round_number": 1,
-        }
-
-        matches_pairs = [[match_data]]
-
-        try:
-            # Flatten matches_pairs to matches_data for the PDF generator
-            matches_data = [m for pair in matches_pairs for m in pair]
-            pdf_bytes = pdf_generator.generate_all_match_sheets_pdf(
-                matches_data=matches_data,
-                tournament_name=get_tournament_name(),
-                category=category,
-                is_doubles=_is_doubles,
-                branding=get_branding_data(),
-            )
-
-            filename = f"partido_bracket_{match_orm.round_type}_{match_id}.pdf"
-            return Response(
-                content=pdf_bytes,
-                media_type="application/pdf",
-                headers={"Content-Disposition": f'attachment; filename="{filename}"'}
-            )
-        except Exception as e:
-            return Response(content=f"Error generando PDF: {str(e)}", status_code=500)
+        side1 = _bracket_sheet_side(match_orm, 1, names, _is_doubles, player_repo, pair_repo, team_repo)
+        side2 = _bracket_sheet_side(match_orm, 2, names, _is_doubles, player_repo, pair_repo, team_repo)
+
+        return _match_sheets_pdf_response(
+            [_bracket_match_sheet_data(match_orm, side1 or TBD_SHEET_SIDE, side2 or TBD_SHEET_SIDE)],
+            category,
+            _is_doubles,
+            f"partido_bracket_{match_orm.round_type}_{match_id}.pdf",
+        )
 
 
 @app.post("/print/bracket/selected")
-async def print_bracket_selected_matches(
+def print_bracket_selected_matches(
     request: Request,
     category: str = Form(...),
     match_ids: list[int] = Form(default=[])
@@ -10710,62 +10845,33 @@ async def print_bracket_selected_matches(
         team_repo = TeamRepository(session)
         schedule_repo = ScheduleSlotRepository(session)
 
-        from ettem.webapp.helpers import get_competitor_display
-        from ettem.models import is_doubles_category
-
         _is_doubles = is_doubles_category(category)
 
         # Build schedule lookup
         all_slots = schedule_repo.get_all()
         schedule_lookup = {slot.match_id: slot for slot in all_slots}
 
-        round_names = {
-            "R128": "Ronda de 128",
-            "R64": "Ronda de 64",
-            "R32": "Ronda de 32",
-            "R16": "Octavos de Final",
-            "QF": "Cuartos de Final",
-            "SF": "Semifinal",
-            "F": "Final",
-        }
-        round_order = {"R128": -1, "R64": 0, "R32": 1, "R16": 2, "QF": 3, "SF": 4, "F": 5}
-
-        matches_data = []
-        for match_id in match_ids:
-            match_orm = match_repo.get_by_id(match_id)
-            if not match_orm:
-                continue
-
-            p1 = get_competitor_display(match_orm, 1, player_repo, pair_repo, team_repo)
-            p2 = get_competitor_display(match_orm, 2, player_repo, pair_repo, team_repo)
-
-            # Get schedule info
-            schedule_slot = schedule_lookup.get(match_id)
-            table_number = schedule_slot.table_number if schedule_slot else None
-            start_time = schedule_slot.start_time if schedule_slot else None
+        matches_by_id = {m.id: m for m in match_repo.get_by_ids(match_ids)}
+        names = player_repo.get_names_by_ids(_singles_player_ids(matches_by_id.values()))
+        players = PlayerLookup(player_repo)
+
+        def sheet_entry(match_orm) -> MatchSheet:
+            side1 = _bracket_sheet_side(match_orm, 1, names, _is_doubles, players, pair_repo, team_repo)
+            side2 = _bracket_sheet_side(match_orm, 2, names, _is_doubles, players, pair_repo, team_repo)
+            schedule_slot = schedule_lookup.get(match_orm.id)
+            return _bracket_match_sheet_data(
+                match_orm,
+                side1 or TBD_SHEET_SIDE,
+                side2 or TBD_SHEET_SIDE,
+                table_number=schedule_slot.table_number if schedule_slot else None,
+                scheduled_time=schedule_slot.start_time if schedule_slot else None,
+            )
 
-            matches_data.append({
-                "match": {
-                    "id": match_orm.id,
-                    "match_order": match_orm.match_number or 1,
-                    "round_type": match_orm.round_type,
-                },
-                "player1": {
-                    "nombre": p1.full_name if _is_doubles else p1.nombre,
-                    "apellido": "" if _is_doubles else p1.apellido,
-                    "pais_cd": p1.pais_cd,
-                },
-                "player2": {
-                    "nombre": p2.full_name if _is_doubles else p2.nombre,
-                    "apellido": "" if _is_doubles else p2.apellido,
-                    "pais_cd": p2.pais_cd,
-                },
-                "group_name": round_names.get(match_orm.round_type, match_orm.round_type),
-                "round_number": 1,
-                "sort_key": round_order.get(match_orm.round_type, 99),
-                "table_number": table_number,
-                "scheduled_time": start_time,
-            })
+        matches_data = [
+            sheet_entry(match_orm)
+            for match_id in match_ids
+            if (match_orm := matches_by_id.get(match_id)) is not None
+        ]
 
         if not matches_data:
             request.session["flash_message"] = "No se seleccionaron partidos válidos"
@@ -10773,19 +10879,13 @@ async def print_bracket_selected_matches(
             return RedirectResponse(url="/admin/print-center", status_code=303)
 
         # Sort by round
-        matches_data = sorted(matches_data, key=lambda m: (m["sort_key"], m["match"]["id"]))
-
-        # Group in pairs (2 per page)
-        matches_pairs = []
-        for i in range(0, len(matches_data), 2):
-            pair = matches_data[i:i+2]
-            matches_pairs.append(pair)
+        matches_data.sort(key=lambda m: (_ROUND_SORT_ORDER.get(m.match.round_type, 99), m.match.id))
 
         context = {
             "request": request,
             "tournament_name": get_tournament_name(),
             "category": category,
-            "matches_pairs": matches_pairs,
+            "matches_pairs": _pair_up(matches_data),
             "total_matches": len(matches_data),
             "back_url": "/admin/print-center",
             "preview_title": f"Hojas de Partido - Bracket {category}",
@@ -10797,87 +10897,26 @@ async def print_bracket_selected_matches(
 
 
 @app.get("/print/bracket/{category}/all-match-sheets")
-async def print_bracket_all_match_sheets(category: str):
+def print_bracket_all_match_sheets(category: str):
     """Download PDF for all bracket match sheets in a category."""
-    from ettem.models import is_doubles_category
-
     with get_db_session() as session:
-        match_repo = MatchRepository(session)
-        player_repo = PlayerRepository(session)
-        pair_repo = PairRepository(session)
-        team_repo = TeamRepository(session)
-
-        _is_doubles = is_doubles_category(category)
-        bracket_matches = match_repo.get_bracket_matches_by_category(category)
-
-        round_names = {
-            "R32": "Ronda de 32",
-            "R16": "Octavos de Final",
-            "QF": "Cuartos de Final",
-            "SF": "Semifinal",
-            "F": "Final",
-        }
-        round_order = {"R32": 0, "R16": 1, "QF": 2, "SF": 3, "F": 4}
-
-        from ettem.webapp.helpers import get_competitor_display
-        matches_data = []
-        for match_orm in bracket_matches:
-            p1 = get_competitor_display(match_orm, 1, player_repo, pair_repo, team_repo)
-            p2 = get_competitor_display(match_orm, 2, player_repo, pair_repo, team_repo)
-
-            if p1.id == 0 and p2.id == 0:
-                continue
-
-            matches_data.append({
-                "match": {
-                    "id": match_orm.id,
-                    "match_order": match_orm.match_number or 1,
-                    "round_type": match_orm.round_type,
-                },
-                "player1": {
-                    "nombre": p1.full_name if _is_doubles else p1.nombre,
-                    "apellido": "" if _is_doubles else p1.apellido,
-                    "pais_cd": p1.pais_cd,
-                },
-                "player2": {
-                    "nombre": p2.full_name if _is_doubles else p2.nombre,
-                    "apellido": "" if _is_doubles else p2.apellido,
-                    "pais_cd": p2.pais_cd,
-                },
-                "group_name": round_names.get(match_orm.round_type, match_orm.round_type),
-                "round_number": 1,
-                "sort_key": round_order.get(match_orm.round_type, 99),
-            })
-
+        matches_data = list(_iter_bracket_matches_data(
+            category,
+            MatchRepository(session),
+            PlayerRepository(session),
+            PairRepository(session),
+            TeamRepository(session),
+        ))
         if not matches_data:
             return Response(content="No hay partidos definidos en el bracket", status_code=404)
 
-        matches_data = sorted(matches_data, key=lambda m: (m["sort_key"], m["match"]["id"]))
-
-        matches_pairs = []
-        for i in range(0, len(matches_data), 2):
-            pair = matches_data[i:i+2]
-            matches_pairs.append(pair)
-
-        try:
-            # Flatten matches_pairs to matches_data for the PDF generator
-            matches_data_flat = [m for pair in matches_pairs for m in pair]
-            pdf_bytes = pdf_generator.generate_all_match_sheets_pdf(
-                matches_data=matches_data_flat,
-                tournament_name=get_tournament_name(),
-                category=category,
-                is_doubles=_is_doubles,
-                branding=get_branding_data(),
-            )
-
-            filename = f"partidos_bracket_{category}.pdf"
-            return Response(
-                content=pdf_bytes,
-                media_type="application/pdf",
-                headers={"Content-Disposition": f'attachment; filename="{filename}"'}
-            )
-        except Exception as e:
-            return Response(content=f"Error generando PDF: {str(e)}", status_code=500)
+        return _match_sheets_pdf_response(
+            matches_data,
+            category,
+            is_doubles_category(category),
+            f"partidos_bracket_{category}.pdf",
+            cache_key=f"bracket:{category}",
+        )
 
 
 @app.get("/preview/bracket/{category}/tree", response_class=HTMLResponse)
@@ -11012,17 +11051,6 @@ async def preview_bracket_tree(request: Request, category: str):
             if match.round_type == 'F' and match.winner_id:
                 champion = get_champion_display(match.winner_id, category, player_repo, pair_repo, team_repo=team_repo)
 
-        # Round display names
-        round_names = {
-            "R128": "Ronda 128",
-            "R64": "Ronda 64",
-            "R32": "Ronda 32",
-            "R16": "Octavos",
-            "QF": "Cuartos",
-            "SF": "Semifinal",
-            "F": "Final"
-        }
-
         # Build schedule info for bracket matches (time/table)
         schedule_repo = ScheduleSlotRepository(session)
         schedule_info = {}
@@ -11042,7 +11070,7 @@ async def preview_bracket_tree(request: Request, category: str):
             "slots_by_round": slots_with_players,
             "matches_by_round": matches_by_round,
             "round_order": required_rounds,
-            "round_names": round_names,
+            "round_names": _TREE_ROUND_NAMES,
             "best_of": bracket_best_of,
             "champion": champion,
             "is_doubles": _is_doubles,
@@ -11186,17 +11214,6 @@ async def print_bracket_tree(category: str):
             if match.round_type == 'F' and match.winner_id:
                 champion = get_champion_display(match.winner_id, category, player_repo, pair_repo, team_repo=team_repo)
 
-        # Round display names
-        round_names = {
-            "R128": "Ronda 128",
-            "R64": "Ronda 64",
-            "R32": "Ronda 32",
-            "R16": "Octavos",
-            "QF": "Cuartos",
-            "SF": "Semifinal",
-            "F": "Final"
-        }
-
         # Build schedule info for bracket matches (time/table)
         schedule_repo = ScheduleSlotRepository(session)
         schedule_info = {}
@@ -11212,7 +11229,7 @@ async def print_bracket_tree(category: str):
             "slots_by_round": slots_with_players,
             "matches_by_round": matches_by_round,
             "round_order": required_rounds,
-            "round_names": round_names,
+            "round_names": _TREE_ROUND_NAMES,
             "best_of": bracket_best_of,
             "champion": champion,
             "is_doubles": _is_doubles,
@@ -11239,12 +11256,10 @@ async def print_bracket_tree(category: str):
 
 
 @app.get("/admin/scheduler", response_class=HTMLResponse)
-async def admin_scheduler(request: Request):
+def admin_scheduler(request: Request):
     """Main scheduler page - configure sessions and view schedule overview."""
     with get_db_session() as session:
         tournament_repo = TournamentRepository(session)
-        from ettem.storage import SessionRepository
-
         tournament = tournament_repo.get_current()
         if not tournament:
             return render_template("admin_scheduler.html", {
@@ -11255,50 +11270,10 @@ async def admin_scheduler(request: Request):
         session_repo = SessionRepository(session)
         sessions = session_repo.get_by_tournament(tournament.id)
 
-        # Get match counts - only for current tournament
-        match_repo = MatchRepository(session)
-        group_repo = GroupRepository(session)
-        bracket_repo = BracketRepository(session)
-
-        # Get categories that belong to current tournament (groups + brackets)
-        tournament_categories = set()
-        all_groups = group_repo.get_all(tournament_id=tournament.id)
-        for g in all_groups:
-            tournament_categories.add(g.category)
-        all_bracket_slots = bracket_repo.get_all(tournament_id=tournament.id)
-        for bs in all_bracket_slots:
-            tournament_categories.add(bs.category)
-
-        # Get categories with brackets in current tournament
-        bracket_categories = set()
-        for cat in tournament_categories:
-            bracket_slots = bracket_repo.get_by_category(cat, tournament_id=tournament.id)
-            if bracket_slots:
-                bracket_categories.add(cat)
-
-        # Count matches for current tournament only
-        all_matches = match_repo.get_all()
-        tournament_matches = []
-        for m in all_matches:
-            if m.group_id:
-                group = group_repo.get_by_id(m.group_id)
-                if group and group.tournament_id == tournament.id:
-                    tournament_matches.append(m)
-            else:
-                # Bracket match - only include if bracket exists for this category in current tournament
-                if m.category in bracket_categories:
-                    tournament_matches.append(m)
-
-        # Count scheduled vs unscheduled
-        from ettem.storage import ScheduleSlotRepository
+        # Count matches for current tournament only (group matches of its
+        # groups, bracket matches of its brackets), and how many are scheduled
         schedule_repo = ScheduleSlotRepository(session)
-        scheduled_match_ids = set()
-        for sess in sessions:
-            for slot in schedule_repo.get_by_session(sess.id):
-                scheduled_match_ids.add(slot.match_id)
-
-        total_matches = len(tournament_matches)
-        scheduled_count = len([m for m in tournament_matches if m.id in scheduled_match_ids])
+        total_matches, scheduled_count = schedule_repo.count_matches_for_tournament(tournament.id)
         unscheduled_count = total_matches - scheduled_count
 
         # Config is locked if there are sessions created
@@ -11331,8 +11306,6 @@ async def save_scheduler_config(
     min_rest_time: int = Form(...)
 ):
     """Save scheduler configuration for the tournament."""
-    from ettem.storage import TableConfigRepository
-
     with get_db_session() as session:
         tournament_repo = TournamentRepository(session)
         tournament = tournament_repo.get_current()
@@ -11366,8 +11339,6 @@ async def create_session(
     """Create a new tournament session."""
     with get_db_session() as session:
         tournament_repo = TournamentRepository(session)
-        from ettem.storage import SessionRepository
-
         tournament = tournament_repo.get_current()
         if not tournament:
             return RedirectResponse(url="/tournaments", status_code=303)
@@ -11388,10 +11359,6 @@ async def create_session(
         next_order = len(existing_sessions)
 
         # Check for overlapping sessions on the same date
-        def time_to_minutes(t: str) -> int:
-            h, m = map(int, t.split(':'))
-            return h * 60 + m
-
         new_start = time_to_minutes(start_time)
         new_end = time_to_minutes(end_time)
 
@@ -11425,8 +11392,6 @@ async def create_session(
 async def delete_session(request: Request, session_id: int):
     """Delete a tournament session."""
     with get_db_session() as session:
-        from ettem.storage import SessionRepository, ScheduleSlotRepository
-
         session_repo = SessionRepository(session)
         schedule_repo = ScheduleSlotRepository(session)
 
@@ -11442,12 +11407,10 @@ async def delete_session(request: Request, session_id: int):
 
 
 @app.get("/admin/scheduler/grid/{session_id}", response_class=HTMLResponse)
-async def scheduler_grid(request: Request, session_id: int):
+def scheduler_grid(request: Request, session_id: int):
     """Scheduling grid for a specific session - drag and drop matches to table/time slots."""
     with get_db_session() as session:
         tournament_repo = TournamentRepository(session)
-        from ettem.storage import SessionRepository, ScheduleSlotRepository, TimeSlotRepository
-
         tournament = tournament_repo.get_current()
         if not tournament:
             return RedirectResponse(url="/tournaments", status_code=303)
@@ -11481,6 +11444,9 @@ async def scheduler_grid(request: Request, session_id: int):
                 end_time=session_obj.end_time,
                 default_duration=match_duration
             )
+            # The commit expired session_obj; reload it while the DB session
+            # is open, since the streamed template reads it after it closes
+            session_obj = session_repo.get_by_id(session_id)
 
         # Build time slots list with duration info
         time_slots = []
@@ -11495,27 +11461,37 @@ async def scheduler_grid(request: Request, session_id: int):
         # Get scheduled slots for this session (for grid display)
         scheduled_slots = schedule_repo.get_by_session(session_id)
 
-        # Get ALL scheduled match IDs across ALL sessions (to filter unscheduled list)
-        all_scheduled_match_ids = schedule_repo.get_all_scheduled_match_ids()
+        # Unscheduled matches of the current tournament (not in ANY session)
+        unscheduled = schedule_repo.get_unscheduled_matches(tournament.id)
 
-        # Build grid data: {time_slot: {table: match_data or None}}
-        grid_data = {}
-        for time_slot in time_slots:
-            grid_data[time_slot] = {}
-            for table in range(1, num_tables + 1):
-                grid_data[time_slot][table] = None
+        # Load matches, groups and players once and look them up in memory,
+        # instead of one query per scheduled/unscheduled match
+        matches_by_id = {m.id: m for m in match_repo.get_by_ids({slot.match_id for slot in scheduled_slots})}
+        group_ids = {m.group_id for m in itertools.chain(matches_by_id.values(), unscheduled) if m.group_id}
+        groups_by_id = {g.id: g for g in group_repo.get_by_ids(group_ids)}
+        all_players = player_repo.get_all(tournament_id=tournament.id)
+        players = PlayerLookup(player_repo, all_players)
+        displays = CompetitorDisplayCache(players, pair_repo, team_repo)
+        group_rounds = _group_round_labels(
+            itertools.chain.from_iterable(match_repo.get_by_groups(group_ids).values())
+        )
+
+        # Build grid data: one row per time slot (same order as time_slots),
+        # one cell per table (index table - 1), each match_data or None
+        grid_data = [[None] * num_tables for _ in time_slots]
+        time_slot_index = {time_slot: i for i, time_slot in enumerate(time_slots)}
 
         # Fill in scheduled matches
-        from ettem.webapp.helpers import get_competitor_display
         for slot in scheduled_slots:
-            match_orm = match_repo.get_by_id(slot.match_id)
-            if match_orm and slot.start_time in grid_data:
-                display1 = get_competitor_display(match_orm, 1, player_repo, pair_repo, team_repo)
-                display2 = get_competitor_display(match_orm, 2, player_repo, pair_repo, team_repo)
+            match_orm = matches_by_id.get(slot.match_id)
+            row = time_slot_index.get(slot.start_time)
+            if match_orm and row is not None and 1 <= slot.table_number <= num_tables:
+                display1 = displays.get(match_orm, 1)
+                display2 = displays.get(match_orm, 2)
 
                 # Get group/round info
                 if match_orm.group_id:
-                    group = group_repo.get_by_id(match_orm.group_id)
+                    group = groups_by_id.get(match_orm.group_id)
                     match_label = f"G{group.name}" if group else "Grupo"
                     category = group.category if group else "?"
                 else:
@@ -11524,16 +11500,11 @@ async def scheduler_grid(request: Request, session_id: int):
 
                 # Determine round type for scheduled match
                 if match_orm.group_id:
-                    group_matches_list = sorted(match_repo.get_by_group(match_orm.group_id), key=lambda x: x.match_number or 0)
-                    players_in_group = len(set([gm.player1_id for gm in group_matches_list] + [gm.player2_id for gm in group_matches_list]))
-                    matches_per_round = max(1, players_in_group // 2)
-                    match_index = next((i for i, gm in enumerate(group_matches_list) if gm.id == match_orm.id), 0)
-                    group_round = (match_index // matches_per_round) + 1
-                    round_type = f"R{group_round}"
+                    round_type = group_rounds.get(match_orm.id, "R1")
                 else:
                     round_type = match_orm.round_type or "Bracket"
 
-                grid_data[slot.start_time][slot.table_number] = {
+                grid_data[row][slot.table_number - 1] = {
                     "slot_id": slot.id,
                     "match_id": match_orm.id,
                     "player1": display1.full_name if display1 else "TBD",
@@ -11547,62 +11518,29 @@ async def scheduler_grid(request: Request, session_id: int):
                     "round_type": round_type,
                 }
 
-        # Get unscheduled matches - only from current tournament
-        # Build valid categories from groups AND brackets
-        tournament_categories = set()
-        all_groups = group_repo.get_all(tournament_id=tournament.id)
-        for g in all_groups:
-            tournament_categories.add(g.category)
-
-        # Also include categories that have brackets (KO Directo without groups)
+        # Build valid categories from groups AND brackets (KO Directo
+        # categories have no groups)
         bracket_repo = BracketRepository(session)
-        all_bracket_slots = bracket_repo.get_all(tournament_id=tournament.id)
-        for bs in all_bracket_slots:
-            tournament_categories.add(bs.category)
-
-        # Build set of categories that have brackets in current tournament
-        bracket_categories = set()
-        for cat in tournament_categories:
-            bracket_slots = bracket_repo.get_by_category(cat, tournament_id=tournament.id)
-            if bracket_slots:
-                bracket_categories.add(cat)
-
-        all_matches = match_repo.get_all()
+        tournament_categories = (
+            group_repo.get_categories(tournament_id=tournament.id)
+            | bracket_repo.get_categories(tournament_id=tournament.id)
+        )
 
         unscheduled_matches = []
-        for m in all_matches:
-            # Skip matches already scheduled in ANY session
-            if m.id in all_scheduled_match_ids:
-                continue
-
-            # Filter: only include matches from current tournament
+        for m in unscheduled:
             if m.group_id:
-                group = group_repo.get_by_id(m.group_id)
-                if not group:
-                    continue
-                if group.tournament_id != tournament.id:
-                    continue  # Skip matches from other tournaments
+                group = groups_by_id[m.group_id]
                 match_label = f"G{group.name}"
                 category = group.category
-                # Calculate group round number from match position within group
-                group_matches_list = sorted(match_repo.get_by_group(m.group_id), key=lambda x: x.match_number or 0)
-                players_in_group = len(set([gm.player1_id for gm in group_matches_list] + [gm.player2_id for gm in group_matches_list]))
-                matches_per_round = max(1, players_in_group // 2)
-                match_index = next((i for i, gm in enumerate(group_matches_list) if gm.id == m.id), 0)
-                group_round = (match_index // matches_per_round) + 1
-                round_type = f"R{group_round}"  # R1, R2, R3...
+                round_type = group_rounds.get(m.id, "R1")  # R1, R2, R3...
             else:
-                # Bracket match - must have a bracket created for this category in current tournament
-                if not m.category:
-                    continue  # Skip bracket matches without category
-                if m.category not in bracket_categories:
-                    continue  # Skip bracket matches from other tournaments
+                # Bracket match (its category has a bracket in this tournament)
                 match_label = m.round_type or "Bracket"
                 category = m.category
                 round_type = m.round_type or "Bracket"
 
-            d1 = get_competitor_display(m, 1, player_repo, pair_repo, team_repo)
-            d2 = get_competitor_display(m, 2, player_repo, pair_repo, team_repo)
+            d1 = displays.get(m, 1)
+            d2 = displays.get(m, 2)
 
             unscheduled_matches.append({
                 "id": m.id,
@@ -11619,7 +11557,6 @@ async def scheduler_grid(request: Request, session_id: int):
             })
 
         # Build list of all players for search functionality
-        all_players = player_repo.get_all(tournament_id=tournament.id)
         players_list = [
             {
                 "id": p.id,
@@ -11652,18 +11589,100 @@ async def scheduler_grid(request: Request, session_id: int):
             context["flash_message"] = flash_message
             context["flash_type"] = flash_type
 
-        return render_template("admin_scheduler_grid.html", context)
+        # One row per time slot and a card per match: stream the HTML so the
+        # browser can start rendering before the whole grid is produced
+        return stream_template("admin_scheduler_grid.html", context)
+
+
+def _group_round_labels(matches) -> dict[int, str]:
+    """Round label (R1, R2, ...) of every group match in ``matches``.
+
+    A match's round follows from its position in its group's match_number
+    order, with one round per (players in group // 2) matches. Each group is
+    sorted once, so labelling all matches is a dict lookup per match.
+    """
+    matches_by_group = {}
+    for m in matches:
+        if m.group_id:
+            matches_by_group.setdefault(m.group_id, []).append(m)
+
+    labels = {}
+    for group_matches in matches_by_group.values():
+        group_matches.sort(key=lambda gm: gm.match_number or 0)
+        player_ids = set()
+        for gm in group_matches:
+            player_ids.add(gm.player1_id)
+            player_ids.add(gm.player2_id)
+        matches_per_round = max(1, len(player_ids) // 2)
+        for match_index, gm in enumerate(group_matches):
+            labels[gm.id] = f"R{match_index // matches_per_round + 1}"
+    return labels
+
+
+def _build_print_grid(scheduled_slots, time_slots, num_tables,
+                      match_repo, player_repo, pair_repo, team_repo, group_repo):
+    """Fill the printable grid from a session's schedule slots.
+
+    Matches, their groups and their players are loaded in bulk up front,
+    and each competitor's display is built once.
+
+    Returns:
+        (grid_data, categories, total_matches) where grid_data holds one row
+        per time slot (same order as time_slots) with one cell per table
+        (index table - 1), each a dict or None
+    """
+    grid_data = [[None] * num_tables for _ in time_slots]
+    time_slot_index = {time_slot: i for i, time_slot in enumerate(time_slots)}
+    categories = set()
+    total_matches = 0
+
+    matches_by_id = {m.id: m for m in match_repo.get_by_ids({slot.match_id for slot in scheduled_slots})}
+    groups_by_id = {
+        g.id: g for g in group_repo.get_by_ids({m.group_id for m in matches_by_id.values() if m.group_id})
+    }
+    players = PlayerLookup(player_repo, player_repo.get_by_ids(_singles_player_ids(matches_by_id.values())))
+    displays = CompetitorDisplayCache(players, pair_repo, team_repo)
+
+    for slot in scheduled_slots:
+        match_orm = matches_by_id.get(slot.match_id)
+        row = time_slot_index.get(slot.start_time)
+        if match_orm and row is not None:
+            display1 = displays.get(match_orm, 1)
+            display2 = displays.get(match_orm, 2)
+
+            if match_orm.group_id:
+                group = groups_by_id.get(match_orm.group_id)
+                match_label = f"G{group.name}" if group else "Grupo"
+                category = group.category if group else "?"
+            else:
+                match_label = match_orm.round_type or "Bracket"
+                category = match_orm.category or "?"
+
+            categories.add(category)
+            total_matches += 1
+            if not 1 <= slot.table_number <= num_tables:
+                continue
+
+            grid_data[row][slot.table_number - 1] = {
+                "match_id": match_orm.id,
+                "player1": display1.full_name if display1 else "TBD",
+                "player2": display2.full_name if display2 else "TBD",
+                "player1_country": display1.pais_cd if display1 else "",
+                "player2_country": display2.pais_cd if display2 else "",
+                "label": match_label,
+                "category": category,
+            }
+
+    return grid_data, categories, total_matches
 
 
 @app.get("/admin/scheduler/grid/{session_id}/print", response_class=HTMLResponse)
-async def scheduler_grid_print(request: Request, session_id: int):
+def scheduler_grid_print(request: Request, session_id: int):
     """Printable version of the scheduling grid."""
     from datetime import datetime
 
     with get_db_session() as session:
         tournament_repo = TournamentRepository(session)
-        from ettem.storage import SessionRepository, ScheduleSlotRepository, TimeSlotRepository
-
         tournament = tournament_repo.get_current()
         if not tournament:
             return RedirectResponse(url="/", status_code=303)
@@ -11701,49 +11720,15 @@ async def scheduler_grid_print(request: Request, session_id: int):
         scheduled_slots = schedule_repo.get_by_session(session_id)
 
         # Build grid data and collect categories
-        grid_data = {}
-        categories = set()
-        total_matches = 0
-
-        for time_slot in time_slots:
-            grid_data[time_slot] = {}
-            for table in range(1, num_tables + 1):
-                grid_data[time_slot][table] = None
-
-        from ettem.webapp.helpers import get_competitor_display
-        for slot in scheduled_slots:
-            match_orm = match_repo.get_by_id(slot.match_id)
-            if match_orm and slot.start_time in grid_data:
-                display1 = get_competitor_display(match_orm, 1, player_repo, pair_repo, team_repo)
-                display2 = get_competitor_display(match_orm, 2, player_repo, pair_repo, team_repo)
-
-                if match_orm.group_id:
-                    group = group_repo.get_by_id(match_orm.group_id)
-                    match_label = f"G{group.name}" if group else "Grupo"
-                    category = group.category if group else "?"
-                else:
-                    match_label = match_orm.round_type or "Bracket"
-                    category = match_orm.category or "?"
-
-                categories.add(category)
-                total_matches += 1
-
-                grid_data[slot.start_time][slot.table_number] = {
-                    "match_id": match_orm.id,
-                    "player1": display1.full_name if display1 else "TBD",
-                    "player2": display2.full_name if display2 else "TBD",
-                    "player1_country": display1.pais_cd if display1 else "",
-                    "player2_country": display2.pais_cd if display2 else "",
-                    "label": match_label,
-                    "category": category,
-                }
+        grid_data, categories, total_matches = _build_print_grid(
+            scheduled_slots, time_slots, num_tables,
+            match_repo, player_repo, pair_repo, team_repo, group_repo,
+        )
 
         # Filter out empty time slots (rows with no matches)
-        non_empty_time_slots = []
-        for time_slot in time_slots:
-            has_match = any(grid_data[time_slot][table] is not None for table in range(1, num_tables + 1))
-            if has_match:
-                non_empty_time_slots.append(time_slot)
+        non_empty = [i for i, row in enumerate(grid_data) if any(row)]
+        non_empty_time_slots = [time_slots[i] for i in non_empty]
+        grid_data = [grid_data[i] for i in non_empty]
 
         # Category colors for legend
         category_colors = {}
@@ -11768,14 +11753,12 @@ async def scheduler_grid_print(request: Request, session_id: int):
 
 
 @app.get("/print/scheduler/grid/{session_id}")
-async def print_scheduler_grid_pdf(session_id: int):
+def print_scheduler_grid_pdf(session_id: int):
     """Download PDF for scheduler grid."""
     from datetime import datetime
 
     with get_db_session() as session:
         tournament_repo = TournamentRepository(session)
-        from ettem.storage import SessionRepository, ScheduleSlotRepository, TimeSlotRepository
-
         tournament = tournament_repo.get_current()
         if not tournament:
             return Response(content="No hay torneo activo", status_code=404)
@@ -11813,49 +11796,15 @@ async def print_scheduler_grid_pdf(session_id: int):
         scheduled_slots = schedule_repo.get_by_session(session_id)
 
         # Build grid data and collect categories
-        grid_data = {}
-        categories = set()
-        total_matches = 0
-
-        for time_slot in time_slots:
-            grid_data[time_slot] = {}
-            for table in range(1, num_tables + 1):
-                grid_data[time_slot][table] = None
-
-        from ettem.webapp.helpers import get_competitor_display
-        for slot in scheduled_slots:
-            match_orm = match_repo.get_by_id(slot.match_id)
-            if match_orm and slot.start_time in grid_data:
-                display1 = get_competitor_display(match_orm, 1, player_repo, pair_repo, team_repo)
-                display2 = get_competitor_display(match_orm, 2, player_repo, pair_repo, team_repo)
-
-                if match_orm.group_id:
-                    group = group_repo.get_by_id(match_orm.group_id)
-                    match_label = f"G{group.name}" if group else "Grupo"
-                    category = group.category if group else "?"
-                else:
-                    match_label = match_orm.round_type or "Bracket"
-                    category = match_orm.category or "?"
-
-                categories.add(category)
-                total_matches += 1
-
-                grid_data[slot.start_time][slot.table_number] = {
-                    "match_id": match_orm.id,
-                    "player1": display1.full_name if display1 else "TBD",
-                    "player2": display2.full_name if display2 else "TBD",
-                    "player1_country": display1.pais_cd if display1 else "",
-                    "player2_country": display2.pais_cd if display2 else "",
-                    "label": match_label,
-                    "category": category,
-                }
+        grid_data, categories, total_matches = _build_print_grid(
+            scheduled_slots, time_slots, num_tables,
+            match_repo, player_repo, pair_repo, team_repo, group_repo,
+        )
 
         # Filter out empty time slots
-        non_empty_time_slots = []
-        for time_slot in time_slots:
-            has_match = any(grid_data[time_slot][table] is not None for table in range(1, num_tables + 1))
-            if has_match:
-                non_empty_time_slots.append(time_slot)
+        non_empty = [i for i, row in enumerate(grid_data) if any(row)]
+        non_empty_time_slots = [time_slots[i] for i in non_empty]
+        grid_data = [grid_data[i] for i in non_empty]
 
         # Category colors for legend
         category_colors = {}
@@ -11897,8 +11846,6 @@ async def update_timeslot_duration(
 ):
     """Update the duration of a time slot and recalculate subsequent slots."""
     with get_db_session() as session:
-        from ettem.storage import TimeSlotRepository
-
         time_slot_repo = TimeSlotRepository(session)
 
         # Validate duration (minimum 5 minutes, maximum 120 minutes)
@@ -11923,8 +11870,6 @@ async def update_timeslot_duration(
 async def finalize_session(request: Request, session_id: int):
     """Finalize a scheduling session - marks it as complete and cleans up empty time slots."""
     with get_db_session() as session:
-        from ettem.storage import SessionRepository, TimeSlotRepository, ScheduleSlotRepository
-
         session_repo = SessionRepository(session)
         time_slot_repo = TimeSlotRepository(session)
         schedule_repo = ScheduleSlotRepository(session)
@@ -11966,8 +11911,6 @@ async def finalize_session(request: Request, session_id: int):
 async def reopen_session(request: Request, session_id: int):
     """Reopen a finalized scheduling session for further editing."""
     with get_db_session() as session:
-        from ettem.storage import SessionRepository
-
         session_repo = SessionRepository(session)
         session_obj = session_repo.get_by_id(session_id)
 
@@ -11989,8 +11932,6 @@ async def reopen_session(request: Request, session_id: int):
 async def add_timeslot(request: Request, session_id: int):
     """Add a new time slot at the end of the session."""
     with get_db_session() as session:
-        from ettem.storage import SessionRepository, TimeSlotRepository
-
         session_repo = SessionRepository(session)
         time_slot_repo = TimeSlotRepository(session)
         tournament_repo = TournamentRepository(session)
@@ -12010,13 +11951,11 @@ async def add_timeslot(request: Request, session_id: int):
         if existing_slots:
             # Calculate new slot start time based on last slot
             last_slot = existing_slots[-1]
-            last_h, last_m = map(int, last_slot.start_time.split(":"))
-            new_start_minutes = last_h * 60 + last_m + last_slot.duration_minutes
+            new_start_minutes = time_to_minutes(last_slot.start_time) + last_slot.duration_minutes
             new_slot_number = last_slot.slot_number + 1
         else:
             # No slots exist, start from session start time
-            start_h, start_m = map(int, session_obj.start_time.split(":"))
-            new_start_minutes = start_h * 60 + start_m
+            new_start_minutes = time_to_minutes(session_obj.start_time)
             new_slot_number = 0
 
         new_h = new_start_minutes // 60
@@ -12037,8 +11976,12 @@ async def add_timeslot(request: Request, session_id: int):
         return RedirectResponse(url=f"/admin/scheduler/grid/{session_id}", status_code=303)
 
 
+# Drag-drop acknowledgement body, serialized once instead of per request
+_SLOT_OK_JSON = b'{"status":"ok"}'
+
+
 @app.post("/admin/scheduler/slot/assign")
-async def assign_match_to_slot(
+def assign_match_to_slot(
     request: Request,
     session_id: int = Form(...),
     match_id: int = Form(...),
@@ -12047,40 +11990,27 @@ async def assign_match_to_slot(
 ):
     """Assign a match to a specific table and time slot."""
     with get_db_session() as session:
-        from ettem.storage import ScheduleSlotRepository
-
         schedule_repo = ScheduleSlotRepository(session)
 
-        # Check if match is already scheduled
-        existing = schedule_repo.get_by_match(match_id)
-        if existing:
-            # Update existing slot
-            existing.session_id = session_id
-            existing.table_number = table_number
-            existing.start_time = start_time
-            schedule_repo.update(existing)
-        else:
-            # Create new slot
-            schedule_repo.create(
-                session_id=session_id,
-                match_id=match_id,
-                table_number=table_number,
-                start_time=start_time
-            )
+        # Create the slot, or move it if the match is already scheduled
+        schedule_repo.upsert_by_match(
+            session_id=session_id,
+            match_id=match_id,
+            table_number=table_number,
+            start_time=start_time
+        )
 
-        return {"status": "ok"}
+        return Response(content=_SLOT_OK_JSON, media_type="application/json")
 
 
 @app.post("/admin/scheduler/slot/{slot_id}/remove")
-async def remove_slot_assignment(request: Request, slot_id: int):
+def remove_slot_assignment(request: Request, slot_id: int):
     """Remove a match from its scheduled slot (back to unscheduled)."""
     with get_db_session() as session:
-        from ettem.storage import ScheduleSlotRepository
-
         schedule_repo = ScheduleSlotRepository(session)
         schedule_repo.delete(slot_id)
 
-        return {"status": "ok"}
+        return Response(content=_SLOT_OK_JSON, media_type="application/json")
 
 
 # ============================================================================
@@ -12091,8 +12021,6 @@ async def remove_slot_assignment(request: Request, slot_id: int):
 @app.get("/admin/live-results", response_class=HTMLResponse)
 async def admin_live_results(request: Request, category: Optional[str] = None):
     """Live results entry panel - shows matches grouped by scheduled time."""
-    from ettem.storage import SessionRepository, ScheduleSlotRepository
-
     session = get_db_session()
     try:
         tournament_repo = TournamentRepository(session)
@@ -12118,8 +12046,7 @@ async def admin_live_results(request: Request, category: Optional[str] = None):
         tournament_id = current_tournament.id
 
         # Get categories
-        all_players = player_repo.get_all(tournament_id=tournament_id)
-        categories = sorted(set(p.categoria for p in all_players))
+        categories = player_repo.get_categories(tournament_id=tournament_id)
 
         # Get all scheduled slots
         all_slots = schedule_repo.get_all()
@@ -12189,11 +12116,7 @@ async def admin_live_results(request: Request, category: Optional[str] = None):
             schedule_info = schedule_lookup.get(match.id)
 
             # Create a display name for bracket round
-            round_names = {
-                'R128': 'R128', 'R64': 'R64', 'R32': 'R32', 'R16': 'R16',
-                'QF': 'Cuartos', 'SF': 'Semifinal', 'F': 'Final'
-            }
-            round_display = round_names.get(match.round_type, match.round_type)
+            round_display = _LIVE_ROUND_LABELS.get(match.round_type, match.round_type)
 
             matches_data.append({
                 "match": match,
@@ -5,7 +5,7 @@ players, pairs, and teams using the same macros.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 
 
 @dataclass
@@ -104,6 +104,63 @@ class CompetitorDisplay:
         )
 
 
+class MatchSheetSide(NamedTuple):
+    """Name and country printed for one side of a match sheet."""
+
+    nombre: str
+    apellido: str
+    pais_cd: Optional[str]
+
+
+class MatchSheetRef(NamedTuple):
+    """Match fields printed on a match sheet."""
+
+    id: int
+    match_order: int
+    round_type: str
+
+
+class MatchSheet(NamedTuple):
+    """One entry of the match-sheet templates (preview and PDF).
+
+    Tuples rather than dicts: they are smaller, and Jinja resolves
+    ``m.player1.nombre`` with a plain attribute read instead of falling back
+    from getattr to item lookup on every access.
+    """
+
+    match: MatchSheetRef
+    player1: MatchSheetSide
+    player2: MatchSheetSide
+    group_name: str
+    round_number: int
+    table_number: Optional[int] = None
+    scheduled_time: Optional[str] = None
+
+
+TBD_SHEET_SIDE = MatchSheetSide("TBD", "", "---")
+
+
+class PlayerLookup:
+    """Dict-backed stand-in for ``PlayerRepository.get_by_id``.
+
+    Players passed in up front (typically from one bulk query) are served
+    from memory; any other ID is fetched once and remembered, including
+    misses. Can be passed wherever a helper expects ``player_repo``.
+    """
+
+    def __init__(self, player_repo, players=()):
+        self.player_repo = player_repo
+        self.players_by_id = {p.id: p for p in players}
+
+    def get_by_id(self, player_id):
+        try:
+            return self.players_by_id[player_id]
+        except KeyError:
+            player = self.player_repo.get_by_id(player_id) if player_id else None
+            self.players_by_id[player_id] = player
+            return player
+
+
 def get_competitor_display(match_orm, side: int, player_repo, pair_repo=None, team_repo=None):
     """Get display data for side 1 or 2 of a match.
 
@@ -138,6 +195,40 @@ def get_competitor_display(match_orm, side: int, player_repo, pair_repo=None, te
     return CompetitorDisplay.tbd()
 
 
+class CompetitorDisplayCache:
+    """Memoizing front for ``get_competitor_display``.
+
+    Each player, pair or team gets one CompetitorDisplay, however many
+    matches it appears in. The returned objects are shared; treat them as
+    read-only.
+    """
+
+    def __init__(self, player_repo, pair_repo=None, team_repo=None):
+        self.player_repo = player_repo
+        self.pair_repo = pair_repo
+        self.team_repo = team_repo
+        self._displays = {}
+
+    def get(self, match_orm, side: int) -> CompetitorDisplay:
+        """Display for side 1 or 2 of a match (see get_competitor_display)."""
+        event_type = getattr(match_orm, "event_type", "singles") or "singles"
+        if event_type == "teams" and self.team_repo:
+            key = ("teams", match_orm.team1_id if side == 1 else match_orm.team2_id)
+        elif event_type == "doubles" and self.pair_repo:
+            key = ("doubles", match_orm.pair1_id if side == 1 else match_orm.pair2_id)
+        else:
+            key = ("singles", match_orm.player1_id if side == 1 else match_orm.player2_id)
+
+        try:
+            return self._displays[key]
+        except KeyError:
+            display = get_competitor_display(
+                match_orm, side, self.player_repo, self.pair_repo, self.team_repo
+            )
+            self._displays[key] = display
+            return display
+
+
 def get_bracket_slot_display(slot_orm, category, player_repo, pair_repo=None, team_repo=None):
     """Get CompetitorDisplay for a bracket slot.
 
@@ -7,6 +7,7 @@ import tempfile
 import pytest
 
 from ettem.models import Gender, Player, Group, GroupStanding, Bracket, BracketSlot, RoundType
+from ettem.exports import UTF8_BOM, format_csv_row, generate_results_csv
 from ettem.io_csv import export_groups_csv, export_standings_csv, export_bracket_csv
 
 
@@ -281,3 +282,42 @@ class TestExportCSV:
 
         finally:
             Path(temp_path).unlink()
+
+
+class TestExportsCsvHelpers:
+    """Test the CSV helpers in ettem.exports used by the web export endpoints."""
+
+    def _csv_writer_row(self, fields):
+        import io
+
+        buf = io.StringIO()
+        csv.writer(buf).writerow(fields)
+        return buf.getvalue()
+
+    def test_format_csv_row_matches_csv_writer(self):
+        """Rows must be byte-identical to csv.writer's default dialect."""
+        rows = [
+            ["Grupo", "Posición", "Jugador", "País"],
+            ["A", 1, "Juan Perez", "ESP"],
+            ["B", None, 'Carlos "Charly" Lopez', "ARG"],
+            ["Final", "-", "Perez, Juan", "Line\nbreak"],
+            [3.5, 0, "", "Cuartos de Final"],
+        ]
+        for row in rows:
+            assert format_csv_row(row) == self._csv_writer_row(row)
+
+
+    def test_generate_results_csv_starts_with_bom(self):
+        """Results CSV is UTF-8 with a BOM and one row per match."""
+        csv_bytes = generate_results_csv(
+            [{"category": "U13BS", "group_name": "A", "match_order": 1,
+              "player1_name": "José Pérez", "player2_name": "Ana, Ruiz",
+              "winner_name": "José Pérez", "sets_result": "3-1", "status": "completed"}],
+            [],
+        )
+        assert csv_bytes.startswith(UTF8_BOM)
+        rows = list(csv.reader(csv_bytes[len(UTF8_BOM):].decode("utf-8").splitlines()))
+        assert rows[0][1] == "Categoría"
+        assert rows[1] == [
+            "Grupos", "U13BS", "A", "1", "José Pérez", "Ana, Ruiz", "José Pérez", "3-1", "completed"
+        ]
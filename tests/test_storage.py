@@ -2,6 +2,63 @@
 
 import pytest
 
+from ettem.storage import (
+    BracketSlotORM,
+    DatabaseManager,
+    GroupORM,
+    GroupRepository,
+    GroupStandingORM,
+    MatchORM,
+    MatchRepository,
+    PlayerORM,
+    PlayerRepository,
+    ScheduleSlotORM,
+    ScheduleSlotRepository,
+    SessionORM,
+    StandingRepository,
+    TimeSlotRepository,
+    TournamentORM,
+    existing_columns,
+    migrate_query_indexes,
+    time_to_minutes,
+)
+
+
+@pytest.fixture
+def session(tmp_path):
+    """Fresh SQLite database with the full schema."""
+    manager = DatabaseManager(tmp_path / "test_storage.sqlite")
+    manager.create_tables()
+    session = manager.get_session()
+    yield session
+    session.close()
+    manager.engine.dispose()
+
+
+def _player(session, nombre, categoria="U13BS", tournament_id=None):
+    player = PlayerORM(
+        nombre=nombre, apellido="Test", genero="M", pais_cd="ESP",
+        ranking_pts=0, categoria=categoria, tournament_id=tournament_id,
+    )
+    session.add(player)
+    session.flush()
+    return player
+
+
+def test_connections_use_wal_journal(session):
+    """Every pooled connection is switched to WAL with NORMAL sync."""
+    from sqlalchemy import text
+
+    assert session.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+    assert session.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+
+
+def test_existing_columns_reads_table_schema(session):
+    """Column probing uses the table schema and tolerates missing tables."""
+    columns = existing_columns(session, "matches")
+    assert {"id", "category", "tournament_id", "best_of"} <= columns
+    assert existing_columns(session, "no_such_table") == set()
+
 
 def test_player_crud():
     """Test player create, read, update, delete operations."""
@@ -13,3 +70,337 @@ def test_match_result_storage():
     """Test storing and retrieving match results."""
     # TODO: Implement test
     pass
+
+
+def test_get_bracket_matches_skips_group_matches(session):
+    """Only matches without a group are returned, filtered by tournament."""
+    t1 = TournamentORM(name="T1")
+    t2 = TournamentORM(name="T2")
+    session.add_all([t1, t2])
+    session.flush()
+    group = GroupORM(name="A", category="U13BS", tournament_id=t1.id)
+    session.add(group)
+    session.flush()
+    p1 = _player(session, "Juan", tournament_id=t1.id)
+    p2 = _player(session, "Pedro", tournament_id=t1.id)
+
+    session.add_all([
+        MatchORM(player1_id=p1.id, player2_id=p2.id, group_id=group.id,
+                 tournament_id=t1.id, round_type="RR"),
+        MatchORM(player1_id=p1.id, player2_id=p2.id, tournament_id=t1.id,
+                 category="U13BS", round_type="F"),
+        MatchORM(tournament_id=t2.id, category="U13BS", round_type="F"),
+    ])
+    session.commit()
+
+    repo = MatchRepository(session)
+    bracket = repo.get_bracket_matches(tournament_id=t1.id, eager=True)
+    assert [m.round_type for m in bracket] == ["F"]
+    assert bracket[0].player1.nombre == "Juan"
+    assert len(repo.get_bracket_matches()) == 2
+
+
+def test_migrate_query_indexes_is_idempotent(session):
+    """Index migration can run repeatedly and leaves the index in place."""
+    from sqlalchemy import inspect
+
+    engine = session.get_bind()
+    migrate_query_indexes(engine)
+    migrate_query_indexes(engine)
+
+    index_names = {ix["name"] for ix in inspect(engine).get_indexes("matches")}
+    assert {
+        "ix_matches_group_tournament", "ix_matches_bracket", "ix_matches_category_group",
+        "ix_matches_player1_id", "ix_matches_player2_id",
+    } <= index_names
+    player_index_names = {ix["name"] for ix in inspect(engine).get_indexes("players")}
+    assert "ix_players_categoria" in player_index_names
+    slot_indexes = {ix["name"]: ix for ix in inspect(engine).get_indexes("schedule_slots")}
+    assert slot_indexes["ix_schedule_slots_match_id"]["unique"]
+    assert slot_indexes["ix_schedule_slots_session_time_table"]["column_names"] == [
+        "session_id", "start_time", "table_number",
+    ]
+
+
+def test_get_names_by_ids_returns_display_tuples(session):
+    """Projection returns (nombre, apellido, categoria, pais_cd) keyed by ID."""
+    juan = _player(session, "Juan", categoria="MS")
+    ana = _player(session, "Ana", categoria="WS")
+    session.commit()
+
+    names = PlayerRepository(session).get_names_by_ids([juan.id, ana.id, 9999])
+    assert names == {
+        juan.id: ("Juan", "Test", "MS", "ESP"),
+        ana.id: ("Ana", "Test", "WS", "ESP"),
+    }
+    assert names[juan.id].categoria == "MS"
+    assert names[ana.id].nombre == "Ana"
+    assert PlayerRepository(session).get_names_by_ids([]) == {}
+
+
+def test_get_player_categories_is_distinct_and_sorted(session):
+    """Player categories come back once each, sorted, per tournament."""
+    _player(session, "Juan", categoria="U13BS", tournament_id=1)
+    _player(session, "Pedro", categoria="MS", tournament_id=1)
+    _player(session, "Luis", categoria="MS", tournament_id=1)
+    _player(session, "Ana", categoria="WS", tournament_id=2)
+    session.commit()
+
+    repo = PlayerRepository(session)
+    assert repo.get_categories(tournament_id=1) == ["MS", "U13BS"]
+    assert repo.get_categories() == ["MS", "U13BS", "WS"]
+    assert repo.get_categories(tournament_id=3) == []
+
+
+def test_iter_rows_by_category_joins_group_and_player(session):
+    """Standings stream with group and player columns, ordered by group then position."""
+    group_a = GroupORM(name="A", category="MS")
+    group_b = GroupORM(name="B", category="MS")
+    other = GroupORM(name="A", category="WS")
+    session.add_all([group_a, group_b, other])
+    session.flush()
+    juan = _player(session, "Juan", categoria="MS")
+    ana = _player(session, "Ana", categoria="WS")
+
+    session.add_all([
+        GroupStandingORM(player_id=juan.id, group_id=group_b.id, position=1),
+        GroupStandingORM(player_id=None, group_id=group_a.id, position=2),
+        GroupStandingORM(player_id=juan.id, group_id=group_a.id, position=1, wins=2),
+        GroupStandingORM(player_id=ana.id, group_id=other.id, position=1),
+    ])
+    session.commit()
+
+    rows = list(StandingRepository(session).iter_rows_by_category("MS", batch_size=1))
+    assert [(r.group_name, r.position, r.nombre) for r in rows] == [
+        ("A", 1, "Juan"), ("A", 2, None), ("B", 1, "Juan"),
+    ]
+    assert rows[0].wins == 2
+    assert rows[1].player_id is None
+
+
+def test_has_category_checks_group_existence(session):
+    """Category existence is answered without loading the groups."""
+    tournament = TournamentORM(name="T1")
+    session.add(tournament)
+    session.flush()
+    session.add(GroupORM(name="A", category="MS", tournament_id=tournament.id))
+    session.commit()
+
+    repo = GroupRepository(session)
+    assert repo.has_category("MS")
+    assert repo.has_category("MS", tournament_id=tournament.id)
+    assert not repo.has_category("MS", tournament_id=tournament.id + 1)
+    assert not repo.has_category("WS")
+    assert repo.get_categories(tournament_id=tournament.id) == {"MS"}
+    assert repo.get_categories(tournament_id=tournament.id + 1) == set()
+
+
+def test_get_by_groups_and_schedule_slots_by_matches(session):
+    """Batch lookups key matches by group and slots by match in one query each."""
+    from datetime import datetime
+
+    tournament = TournamentORM(name="T1")
+    session.add(tournament)
+    session.flush()
+    group_a = GroupORM(name="A", category="MS", tournament_id=tournament.id)
+    group_b = GroupORM(name="B", category="MS", tournament_id=tournament.id)
+    empty = GroupORM(name="C", category="MS", tournament_id=tournament.id)
+    session.add_all([group_a, group_b, empty])
+    session.flush()
+    m1 = MatchORM(group_id=group_a.id, tournament_id=tournament.id, round_type="RR", match_number=1)
+    m2 = MatchORM(group_id=group_a.id, tournament_id=tournament.id, round_type="RR", match_number=2)
+    m3 = MatchORM(group_id=group_b.id, tournament_id=tournament.id, round_type="RR", match_number=1)
+    session.add_all([m1, m2, m3])
+    sched = SessionORM(tournament_id=tournament.id, name="S", date=datetime(2026, 1, 1),
+                       start_time="09:00", end_time="12:00")
+    session.add(sched)
+    session.flush()
+    first = ScheduleSlotORM(session_id=sched.id, match_id=m1.id, table_number=1, start_time="09:00")
+    session.add(first)
+    session.commit()
+
+    by_group = MatchRepository(session).get_by_groups([group_a.id, group_b.id, empty.id])
+    assert {gid: [m.id for m in ms] for gid, ms in by_group.items()} == {
+        group_a.id: [m1.id, m2.id], group_b.id: [m3.id],
+    }
+    assert MatchRepository(session).get_by_groups([]) == {}
+    matches = MatchRepository(session).get_by_ids([m3.id, m1.id, 9999])
+    assert sorted(m.id for m in matches) == [m1.id, m3.id]
+    assert MatchRepository(session).get_by_ids([]) == []
+    groups = GroupRepository(session).get_by_ids([group_b.id, group_a.id, 9999])
+    assert sorted(g.name for g in groups) == ["A", "B"]
+    assert GroupRepository(session).get_by_ids([]) == []
+
+    slots = ScheduleSlotRepository(session).get_by_matches([m1.id, m2.id])
+    assert list(slots) == [m1.id]
+    assert slots[m1.id].id == first.id
+
+
+def test_get_content_versions_changes_with_group_rows(session):
+    """The per-group change marker moves when a match or player changes."""
+    group = GroupORM(name="A", category="MS")
+    empty = GroupORM(name="B", category="MS")
+    session.add_all([group, empty])
+    session.flush()
+    player = _player(session, "Juan", categoria="MS")
+    player.group_id = group.id
+    match = MatchORM(group_id=group.id, round_type="RR", match_number=1)
+    session.add(match)
+    session.commit()
+
+    repo = GroupRepository(session)
+    versions = repo.get_content_versions([group.id, empty.id])
+    assert versions[empty.id] == (0, None, 0, None)
+    assert versions[group.id][0] == 1 and versions[group.id][2] == 1
+
+    before = versions[group.id]
+    session.add(MatchORM(group_id=group.id, round_type="RR", match_number=2))
+    session.commit()
+    assert repo.get_content_versions([group.id])[group.id] != before
+    assert repo.get_content_versions([]) == {}
+
+
+def test_get_by_group_ordered_puts_unnumbered_matches_last(session):
+    """Ordered group matches follow match_number; missing numbers sort last."""
+    group = GroupORM(name="A", category="MS")
+    session.add(group)
+    session.flush()
+    unnumbered = MatchORM(group_id=group.id, round_type="RR", match_number=None)
+    third = MatchORM(group_id=group.id, round_type="RR", match_number=3)
+    first = MatchORM(group_id=group.id, round_type="RR", match_number=1)
+    session.add_all([unnumbered, third, first])
+    session.commit()
+
+    repo = MatchRepository(session)
+    ordered = repo.get_by_group(group.id, ordered=True)
+    assert [m.id for m in ordered] == [first.id, third.id, unnumbered.id]
+    assert [m.id for m in repo.get_by_groups([group.id])[group.id]] == [m.id for m in ordered]
+
+
+def test_get_bracket_matches_by_category_by_round(session):
+    """by_round orders matches by round progression, then ID; unknown rounds last."""
+    matches = [
+        MatchORM(category="MS", round_type=round_type, match_number=1)
+        for round_type in ["F", "XX", "SF", "QF", "SF", "R16"]
+    ]
+    session.add_all(matches + [MatchORM(category="WS", round_type="QF")])
+    session.commit()
+
+    repo = MatchRepository(session)
+    ordered = repo.get_bracket_matches_by_category("MS", by_round=True)
+    assert [m.round_type for m in ordered] == ["R16", "QF", "SF", "SF", "F", "XX"]
+    assert [m.id for m in ordered][2:4] == [matches[2].id, matches[4].id]
+    assert [m.round_type for m in repo.get_bracket_matches_by_category("MS")][:2] == ["F", "QF"]
+
+
+def test_time_to_minutes():
+    """Schedule times parse to minutes since midnight."""
+    assert time_to_minutes("00:00") == 0
+    assert time_to_minutes("09:40") == 580
+    assert time_to_minutes("23:59") == 1439
+    with pytest.raises(ValueError):
+        time_to_minutes("9h40")
+
+
+def test_initialize_time_slots_for_session(session):
+    """Slots cover the session in default_duration steps; a partial last slot is kept."""
+    from datetime import datetime
+
+    tournament = TournamentORM(name="T1")
+    session.add(tournament)
+    session.flush()
+    sched = SessionORM(tournament_id=tournament.id, name="S", date=datetime(2026, 1, 1),
+                       start_time="09:40", end_time="11:00")
+    session.add(sched)
+    session.commit()
+
+    repo = TimeSlotRepository(session)
+    slots = repo.initialize_for_session(sched.id, "09:40", "11:00", default_duration=30)
+    assert [(s.slot_number, s.start_time) for s in slots] == [
+        (0, "09:40"), (1, "10:10"), (2, "10:40")
+    ]
+    assert [s.start_time for s in repo.get_by_session(sched.id)] == ["09:40", "10:10", "10:40"]
+    assert repo.initialize_for_session(sched.id, "11:00", "11:00", default_duration=30) == []
+
+
+def test_get_unscheduled_matches_for_tournament(session):
+    """Only the tournament's unscheduled group and bracket matches are returned."""
+    from datetime import datetime
+
+    current = TournamentORM(name="T1")
+    other = TournamentORM(name="T2")
+    session.add_all([current, other])
+    session.flush()
+    group = GroupORM(name="A", category="MS", tournament_id=current.id)
+    other_group = GroupORM(name="A", category="MS", tournament_id=other.id)
+    session.add_all([group, other_group])
+    session.add_all([
+        BracketSlotORM(category="WS", tournament_id=current.id, slot_number=1, round_type="F"),
+        BracketSlotORM(category="XS", tournament_id=other.id, slot_number=1, round_type="F"),
+    ])
+    session.flush()
+    scheduled = MatchORM(group_id=group.id, round_type="RR", match_number=1)
+    pending = MatchORM(group_id=group.id, round_type="RR", match_number=2)
+    other_tournament = MatchORM(group_id=other_group.id, round_type="RR", match_number=1)
+    bracket = MatchORM(category="WS", round_type="F", match_number=1)
+    other_bracket = MatchORM(category="XS", round_type="F", match_number=1)
+    no_category = MatchORM(round_type="F", match_number=1)
+    session.add_all([scheduled, pending, other_tournament, bracket, other_bracket, no_category])
+    sched = SessionORM(tournament_id=current.id, name="S", date=datetime(2026, 1, 1),
+                       start_time="09:00", end_time="12:00")
+    session.add(sched)
+    session.flush()
+    session.add(ScheduleSlotORM(
+        session_id=sched.id, match_id=scheduled.id, table_number=1, start_time="09:00"
+    ))
+    session.commit()
+
+    unscheduled = ScheduleSlotRepository(session).get_unscheduled_matches(current.id)
+    assert [m.id for m in unscheduled] == [pending.id, bracket.id]
+    assert ScheduleSlotRepository(session).count_matches_for_tournament(current.id) == (3, 1)
+    assert ScheduleSlotRepository(session).count_matches_for_tournament(other.id) == (2, 0)
+
+
+def test_upsert_by_match_keeps_one_slot_per_match(session):
+    """Assigning a scheduled match again moves its slot instead of adding one."""
+    from datetime import datetime
+
+    import sqlalchemy.exc
+
+    tournament = TournamentORM(name="T1")
+    session.add(tournament)
+    session.flush()
+    match = MatchORM(category="MS", round_type="F", match_number=1)
+    session.add(match)
+    first = SessionORM(tournament_id=tournament.id, name="S1", date=datetime(2026, 1, 1),
+                       start_time="09:00", end_time="12:00")
+    second = SessionORM(tournament_id=tournament.id, name="S2", date=datetime(2026, 1, 2),
+                        start_time="09:00", end_time="12:00")
+    session.add_all([first, second])
+    session.commit()
+
+    repo = ScheduleSlotRepository(session)
+    repo.upsert_by_match(first.id, match.id, table_number=1, start_time="09:00")
+    slot_id = repo.get_by_match(match.id).id
+    repo.upsert_by_match(second.id, match.id, table_number=3, start_time="10:30")
+
+    session.expire_all()
+    slots = repo.get_all()
+    assert [(s.id, s.session_id, s.table_number, s.start_time) for s in slots] == [
+        (slot_id, second.id, 3, "10:30"),
+    ]
+    with pytest.raises(sqlalchemy.exc.IntegrityError):
+        repo.create(first.id, match.id, table_number=2, start_time="09:30")
+
+
+def test_get_by_session_uses_session_time_index(session):
+    """A session's slots are read through the composite index, already in order."""
+    from sqlalchemy import text
+
+    plan = session.execute(text(
+        "EXPLAIN QUERY PLAN SELECT * FROM schedule_slots WHERE session_id = 1 "
+        "ORDER BY start_time, table_number"
+    )).fetchall()
+    details = " ".join(row[-1] for row in plan)
+    assert "ix_schedule_slots_session_time_table" in details
+    assert "TEMP B-TREE" not in details
@@ -41,3 +41,124 @@ def test_enter_result_page_loads(client):
     response = client.get("/enter-result/1")
     # Accept either 404 (no match) or 200 (match found) or 307 (redirect)
     assert response.status_code in [200, 307, 404]
+
+
+def test_bracket_match_sheets_preview_answers_json_with_count(client, monkeypatch):
+    """JSON clients get the match count instead of the rendered preview."""
+    # Admin pages sit behind the license check
+    monkeypatch.setattr(
+        "ettem.webapp.app.get_current_license_with_online", lambda: (True, None, None)
+    )
+    url = "/preview/bracket/NO_SUCH_CATEGORY/all-match-sheets"
+    response = client.get(url, headers={"Accept": "application/json"})
+    assert response.status_code == 200
+    assert response.json() == {"total_matches": 0}
+    assert client.get(url).status_code == 404
+
+
+def test_translation_function_resolves_dotted_keys():
+    """t() looks up nested keys, formats kwargs and flags missing keys."""
+    from ettem.webapp.app import make_translation_function
+
+    strings = {"a": {"b": "Hola {name}", "c": {"d": "deep"}}, "n": 3}
+    t = make_translation_function(strings, "xx")
+    assert t("a.b", name="Ana") == "Hola Ana"
+    assert t("a.b", other="x") == "Hola {name}"
+    assert t("a.c.d") == "deep"
+    assert t("a.c") == "[a.c]"
+    assert t("n") == "[n]"
+    assert t("missing.key") == "[missing.key]"
+    assert make_translation_function(strings, "xx") is t
+
+
+def test_license_check_is_cached_between_requests(client, monkeypatch):
+    """A valid license check is reused; clearing the cache re-checks."""
+    from ettem.webapp import app as webapp
+
+    calls = []
+
+    def check():
+        calls.append(1)
+        return True, None, None
+
+    monkeypatch.setattr("ettem.webapp.app.get_current_license_with_online", check)
+    webapp._clear_license_cache()
+    assert client.get("/tournament-status").status_code == 200
+    assert client.get("/tournament-status").status_code == 200
+    assert len(calls) == 1
+
+    webapp._clear_license_cache()
+    monkeypatch.setattr(
+        "ettem.webapp.app.get_current_license_with_online", lambda: (False, None, "none")
+    )
+    response = client.get("/tournament-status", follow_redirects=False)
+    assert response.status_code == 303
+
+
+def test_preloaded_static_files_serve_from_memory(tmp_path):
+    """Preloaded assets answer conditional and gzip requests without disk reads."""
+    from starlette.applications import Starlette
+    from starlette.routing import Mount
+
+    from ettem.webapp.app import PreloadedStaticFiles
+
+    (tmp_path / "site.css").write_text("body { color: red; }\n" * 50)
+    static = PreloadedStaticFiles(directory=str(tmp_path))
+    (tmp_path / "site.css").unlink()
+    client = TestClient(Starlette(routes=[Mount("/static", app=static)]))
+
+    response = client.get("/static/site.css")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/css")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == "body { color: red; }\n" * 50
+
+    etag = response.headers["etag"]
+    assert etag.endswith('-gz"')
+    cached = client.get("/static/site.css", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    plain = client.get("/static/site.css", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["etag"] != etag
+    refused = client.get("/static/site.css", headers={"Accept-Encoding": "gzip;q=0, identity"})
+    assert "content-encoding" not in refused.headers
+    stale = client.get(
+        "/static/site.css", headers={"Accept-Encoding": "identity", "If-None-Match": etag}
+    )
+    assert stale.status_code == 200
+    assert client.get("/static/missing.css").status_code == 404
+
+
+def test_cached_match_sheets_pdf_keeps_open_files_readable(monkeypatch, tmp_path):
+    """A newer render never deletes a cached PDF that a response already holds."""
+    from ettem.webapp import app as webapp
+
+    renders = []
+
+    def fake_write(target, matches_data, **kwargs):
+        renders.append(matches_data)
+        target.write(f"PDF {matches_data}".encode())
+
+    monkeypatch.setattr(webapp.pdf_generator, "write_all_match_sheets_pdf", fake_write)
+    monkeypatch.setattr(webapp, "_match_sheets_pdf_cache", {})
+    monkeypatch.setattr(webapp, "_match_sheets_pdf_superseded", [])
+    monkeypatch.setattr(webapp, "_match_sheets_pdf_dir", tmp_path)
+
+    def open_pdf(digest):
+        return webapp._open_cached_match_sheets_pdf("MS", digest, digest, "T", "MS", False, None)
+
+    with open_pdf("a") as first, open_pdf("a") as again:
+        assert again.read() == b"PDF a"
+        assert renders == ["a"]
+        with open_pdf("b") as second:
+            assert first.read() == b"PDF a"
+            assert second.read() == b"PDF b"
+    assert (tmp_path / "a.pdf").exists()
+
+    open_pdf("c").close()
+    assert not (tmp_path / "a.pdf").exists()
+    assert renders == ["a", "b", "c"]
+
+    webapp._remove_match_sheets_pdf_dir()
+    assert not tmp_path.exists()